@@ -3,43 +3,65 @@ from __future__ import annotations
 import logging
 
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.typing import ConfigType
 
 from .const import DOMAIN, PLATFORMS
 from .coordinator import FuturaCoordinator
+from .services import async_setup_services
+from .snapshot import FuturaSnapshotView
+from .stats import FuturaStatistics
 
 _LOGGER = logging.getLogger(__name__)
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Register services and the snapshot view once for all units."""
+    await async_setup_services(hass)
+    hass.http.register_view(FuturaSnapshotView(hass))
+    return True
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up the integration from a config entry."""
-    coordinator = FuturaCoordinator(hass, entry.data)
+    coordinator = FuturaCoordinator(hass, entry.data, entry.options, config_entry=entry)
     try:
         await coordinator.async_config_entry_first_refresh()
     except Exception as err:  # noqa: BLE001
         raise ConfigEntryNotReady(f"Initial connection failed: {err}") from err
 
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
+    statistics = FuturaStatistics(hass, coordinator)
+    await statistics.async_restore()
+    coordinator.statistics = statistics
+    entry.async_on_unload(coordinator.async_add_listener(statistics.async_on_update))
+    entry.async_on_unload(hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, statistics.async_save))
+    await coordinator.publisher.async_configure(entry.options)
+    entry.async_create_background_task(
+        hass, coordinator.async_setup_read_plan(), f"{DOMAIN} read plan {coordinator.host}"
+    )
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
 
-    async def handle_set_away(call):
-        begin = call.data.get("begin")
-        end = call.data.get("end")
-        await coordinator.async_set_away(begin, end)
-
-    async def handle_clear_away(call):
-        await coordinator.async_clear_away()
+    return True
 
-    hass.services.async_register(DOMAIN, "set_away", handle_set_away)
-    hass.services.async_register(DOMAIN, "clear_away", handle_clear_away)
 
-    return True
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply changed options to the running coordinator (no reload)."""
+    coordinator: FuturaCoordinator = hass.data[DOMAIN][entry.entry_id]
+    await coordinator.async_apply_options(entry.options)
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     coordinator: FuturaCoordinator = hass.data[DOMAIN].pop(entry.entry_id)
+    if coordinator.statistics is not None:
+        await coordinator.statistics.async_save()
     await coordinator.async_close()
     return unload_ok
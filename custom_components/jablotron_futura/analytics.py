@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import datetime as dt
+import logging
+from typing import Any, Mapping
+
+import numpy as np
+
+_LOGGER = logging.getLogger(__name__)
+
+# Columns kept in the sample buffer (order = column index)
+BUFFER_FIELDS = (
+    "temp_outdoor",
+    "temp_supply",
+    "temp_extract",
+    "temp_exhaust",
+    "humi_outdoor",
+    "humi_supply",
+    "humi_extract",
+    "air_flow",
+    "fan_power_supply",
+    "fan_power_exhaust",
+    "fan_rpm_supply",
+    "fan_rpm_exhaust",
+    "filter_wear",
+)
+COL = {name: i for i, name in enumerate(BUFFER_FIELDS)}
+
+BUFFER_SPACING = 60.0           # s, at most one buffered sample per minute
+BUFFER_CAPACITY = 7 * 24 * 60   # one week of minute samples
+ANALYTICS_INTERVAL = 300.0      # s between two analytics runs
+EFFICIENCY_WINDOW = 15 * 60.0   # s of samples the efficiencies are taken from
+MIN_DELTA_T = 3.0               # °C, below this the efficiency is undefined
+FIT_BUCKET = 3600.0             # s, fan curve is fitted per hour
+
+P_ATM = 101325.0
+
+
+class SampleBuffer:
+    """Ring buffer of coordinator samples (epoch seconds + BUFFER_FIELDS).
+
+    Storage starts at one day and doubles up to 'capacity', values are kept
+    as float32, so a freshly set up unit costs only a few hundred KiB.
+    """
+
+    def __init__(self, capacity: int = BUFFER_CAPACITY, initial: int = 24 * 60) -> None:
+        self._capacity = capacity
+        size = min(initial, capacity)
+        self._ts = np.full(size, np.nan)
+        self._values = np.full((size, len(BUFFER_FIELDS)), np.nan, dtype=np.float32)
+        self._pos = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def last_ts(self) -> float | None:
+        return None if not self._size else float(self._ts[(self._pos - 1) % len(self._ts)])
+
+    def _grow(self) -> None:
+        size = min(len(self._ts) * 2, self._capacity)
+        ts = np.full(size, np.nan)
+        values = np.full((size, len(BUFFER_FIELDS)), np.nan, dtype=np.float32)
+        ts[: self._size] = self._ts
+        values[: self._size] = self._values
+        self._ts, self._values = ts, values
+        self._pos = self._size
+
+    def append(self, ts: float, data: Mapping[str, Any]) -> None:
+        if self._size == len(self._ts) < self._capacity:
+            self._grow()
+        self._ts[self._pos] = ts
+        self._values[self._pos] = [
+            np.nan if data.get(f) is None else float(data[f]) for f in BUFFER_FIELDS
+        ]
+        self._pos = (self._pos + 1) % len(self._ts)
+        self._size = min(self._size + 1, len(self._ts))
+
+    def view(self, since: float | None = None) -> tuple[np.ndarray, np.ndarray]:
+        """Chronological (ts, values) copies, optionally only samples newer than 'since'."""
+        if self._size < len(self._ts):
+            ts, values = self._ts[: self._size], self._values[: self._size]
+        else:
+            ts = np.roll(self._ts, -self._pos)
+            values = np.roll(self._values, -self._pos, axis=0)
+        if since is not None:
+            mask = ts >= since
+            ts, values = ts[mask], values[mask]
+        return ts, values
+
+
+def _enthalpy(temp: np.ndarray, rh: np.ndarray) -> np.ndarray:
+    """Moist air enthalpy in kJ/kg dry air (Magnus saturation pressure)."""
+    p_sat = 611.2 * np.exp(17.62 * temp / (243.12 + temp))
+    p_w = np.clip(rh, 0.0, 100.0) / 100.0 * p_sat
+    x = 0.622 * p_w / (P_ATM - p_w)
+    return 1.006 * temp + x * (2501.0 + 1.86 * temp)
+
+
+def _median_or_none(values: np.ndarray, digits: int = 1) -> float | None:
+    values = values[np.isfinite(values)]
+    if not values.size:
+        return None
+    return round(float(np.median(values)), digits)
+
+
+def compute(buffer: SampleBuffer, now: float) -> dict[str, Any]:
+    """Derive heat recovery and filter analytics from the buffered samples.
+
+    All quantities are evaluated on whole columns at once; nothing is
+    recomputed per sample.
+    """
+    result: dict[str, Any] = {
+        "hrv_efficiency_sensible": None,
+        "hrv_efficiency_enthalpic": None,
+        "fan_imbalance": None,
+        "filter_resistance_index": None,
+        "filter_replacement_date": None,
+    }
+    ts, v = buffer.view()
+    if not ts.size:
+        return result
+
+    # --- heat exchanger efficiency over the recent window --------------------
+    recent = ts >= now - EFFICIENCY_WINDOW
+    t_out, t_sup, t_ext = (v[recent, COL[k]] for k in ("temp_outdoor", "temp_supply", "temp_extract"))
+    h_out = _enthalpy(t_out, v[recent, COL["humi_outdoor"]])
+    h_sup = _enthalpy(t_sup, v[recent, COL["humi_supply"]])
+    h_ext = _enthalpy(t_ext, v[recent, COL["humi_extract"]])
+    dt_total = t_ext - t_out
+    valid = np.abs(dt_total) >= MIN_DELTA_T
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sensible = np.where(valid, (t_sup - t_out) / dt_total * 100.0, np.nan)
+        dh_total = h_ext - h_out
+        enthalpic = np.where(valid & (np.abs(dh_total) > 1e-6), (h_sup - h_out) / dh_total * 100.0, np.nan)
+        rpm_s, rpm_e = v[recent, COL["fan_rpm_supply"]], v[recent, COL["fan_rpm_exhaust"]]
+        rpm_mean = (rpm_s + rpm_e) / 2.0
+        imbalance = np.where(rpm_mean > 0, (rpm_s - rpm_e) / rpm_mean * 100.0, np.nan)
+    result["hrv_efficiency_sensible"] = _median_or_none(sensible)
+    result["hrv_efficiency_enthalpic"] = _median_or_none(enthalpic)
+    result["fan_imbalance"] = _median_or_none(imbalance)
+
+    # --- fan curve: P = k·Q³ per hour, k grows as the filter clogs ----------
+    flow = v[:, COL["air_flow"]]
+    fan_power = (v[:, COL["fan_power_supply"]] + v[:, COL["fan_power_exhaust"]]) / 2.0
+    ok = np.isfinite(flow) & np.isfinite(fan_power) & (flow > 0) & (fan_power > 0)
+    if ok.sum() >= 10:
+        q3 = flow[ok] ** 3
+        bucket = ((ts[ok] - ts[ok][0]) // FIT_BUCKET).astype(np.int64)
+        num = np.bincount(bucket, weights=fan_power[ok] * q3)
+        den = np.bincount(bucket, weights=q3 * q3)
+        cnt = np.bincount(bucket)
+        k = np.where((den > 0) & (cnt >= 5), num / np.where(den > 0, den, 1.0), np.nan)
+        k = k[np.isfinite(k)]
+        if k.size:
+            result["filter_resistance_index"] = round(float(k[-1] / k.min() * 100.0), 1)
+
+    # --- filter replacement date from the filter_wear trend -----------------
+    wear = v[:, COL["filter_wear"]]
+    ok = np.isfinite(wear)
+    if ok.sum() >= 10 and np.ptp(wear[ok]) > 0:
+        slope, intercept = np.polyfit(ts[ok] - now, wear[ok], 1)
+        if slope > 0:
+            eta = (100.0 - intercept) / slope
+            if 0 <= eta < 5 * 365 * 86400:
+                result["filter_replacement_date"] = dt.datetime.fromtimestamp(
+                    now + eta, tz=dt.timezone.utc
+                )
+    return result
+
+
+class FuturaAnalytics:
+    """Buffers coordinator samples and periodically refreshes derived values."""
+
+    def __init__(self) -> None:
+        self.buffer = SampleBuffer()
+        self.result: dict[str, Any] = compute(self.buffer, 0.0)
+        self._computed_at: float | None = None
+
+    def update(self, data: Mapping[str, Any], now: float) -> dict[str, Any]:
+        last = self.buffer.last_ts
+        if last is None or now - last >= BUFFER_SPACING:
+            self.buffer.append(now, data)
+        if self._computed_at is None or now - self._computed_at >= ANALYTICS_INTERVAL:
+            self._computed_at = now
+            try:
+                self.result = compute(self.buffer, now)
+            except Exception as err:  # noqa: BLE001
+                _LOGGER.debug("Analytics failed: %s", err)
+        return self.result
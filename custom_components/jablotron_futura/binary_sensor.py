@@ -77,8 +77,13 @@ class _FuturaBinaryBase(CoordinatorEntity[FuturaCoordinator], BinarySensorEntity
         self._attr_name = name_cz
         # Stabilní unique_id:
         self._attr_unique_id = f"{entry.entry_id}_{key_en}"
-        # Entity ID v angličtině (nastavit PŘED přidáním do HA):
-        self.entity_id = f"binary_sensor.{DOMAIN}_{key_en}"
+        self._attr_device_info = coordinator.device_info
+        self._key_en = key_en
+
+    @property
+    def suggested_object_id(self) -> str:
+        # Entity ID v angličtině; další jednotky dostanou příponu _2, _3, ...
+        return f"{DOMAIN}_{self._key_en}"
 
 # ----- konkrétní senzory ------------------------------------------------------
 
@@ -129,6 +134,17 @@ class BitBinary(_FuturaBinaryBase):
         v = int(self.coordinator.data.get(self._source, 0) or 0)
         return ((v >> self._bit) & 1) == 1
 
+# Tabulka bitových senzorů (key_en, name_cz, zdroj, bit) – sestavená jednou pro všechny jednotky
+BIT_SENSORS: Tuple[Tuple[str, str, str, int], ...] = (
+    # chyby (0..12)
+    *((key_en, name_cz, "errors_bits_raw", bit) for key_en, bit, name_cz in ERROR_BITS),
+    # varování (0..31)
+    *(
+        (f"warning_bit_{bit}", WARNING_NAMES_CZ.get(bit, f"Varování – bit {bit}"), "warnings_bits_raw", bit)
+        for bit in range(32)
+    ),
+)
+
 # ----- setup ------------------------------------------------------------------
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback) -> None:
@@ -141,14 +157,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     entities.append(AnyWarningBinary(coordinator, entry))
     entities.append(AntiRadonBinary(coordinator, entry))
 
-    # chyby (0..12)
-    for key_en, bit, name_cz in ERROR_BITS:
-        entities.append(BitBinary(coordinator, entry, key_en, name_cz, source="errors_bits_raw", bit=bit))
-
-    # varování (0..31)
-    for bit in range(32):
-        key_en = f"warning_bit_{bit}"
-        name_cz = WARNING_NAMES_CZ.get(bit, f"Varování – bit {bit}")
-        entities.append(BitBinary(coordinator, entry, key_en, name_cz, source="warnings_bits_raw", bit=bit))
+    # chyby + varování
+    for key_en, name_cz, source, bit in BIT_SENSORS:
+        entities.append(BitBinary(coordinator, entry, key_en, name_cz, source=source, bit=bit))
 
     async_add_entities(entities)
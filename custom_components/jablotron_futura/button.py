@@ -11,8 +11,7 @@ class FuturaBoost60(ButtonEntity, FuturaEntity):
         FuturaEntity.__init__(self, coordinator, "Spustit Boost (60 min)", "boost_button")
 
     async def async_press(self) -> None:
-        await self.coordinator._write_u16(1, 60 * 60)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_write(1, 60 * 60, context=self._context)
 
 
 class FuturaCirculation30(ButtonEntity, FuturaEntity):
@@ -20,10 +19,9 @@ class FuturaCirculation30(ButtonEntity, FuturaEntity):
         FuturaEntity.__init__(self, coordinator, "Spustit Cirkulaci (30 min)", "circulation_button")
 
     async def async_press(self) -> None:
-        await self.coordinator._write_u16(2, 30 * 60)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_write(2, 30 * 60, context=self._context)
 
 
 async def async_setup_entry(hass, entry, async_add_entities):
     coord: FuturaCoordinator = hass.data["jablotron_futura"][entry.entry_id]
-    async_add_entities([FuturaBoost60(coord), FuturaCirculation30(coord)], True)
+    async_add_entities([FuturaBoost60(coord), FuturaCirculation30(coord)])
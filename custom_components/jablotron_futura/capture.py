@@ -0,0 +1,284 @@
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+import logging
+import time
+from collections import defaultdict, deque
+from typing import IO, TYPE_CHECKING, Any, Iterable
+
+from pymodbus.exceptions import ModbusException
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+# Trace format (gzip compressed JSON lines):
+#   header  {"format": "futura-trace", "version": 1, "host": ..., "unit": ..., "started": ...,
+#            "options": polling options, "spans": learned read spans, "poll_count": ...}
+#   record  [t, duration, op, address, arg, result]
+#     t, duration  s since capture start / s the request took
+#     op           "c" connect, "ri"/"rh" read input/holding, "w1"/"wn" write single/multiple
+#     arg          register count (reads) or written values (writes)
+#     result       list of registers, {"e": exception_code}, {"x": transport error}
+#                  or {"t": "timeout"/"cancelled"} (no response in time)
+TRACE_FORMAT = "futura-trace"
+TRACE_VERSION = 1
+
+CAPTURE_MAX_RECORDS = 200_000   # a forgotten capture must not fill the disk
+CAPTURE_FLUSH_EVERY = 256       # records buffered before a write to the file
+
+
+class TrafficCapture:
+    """Collects request/response records and writes them to a gzip JSONL trace."""
+
+    def __init__(self, hass: HomeAssistant, path: str, header: dict[str, Any]) -> None:
+        self.hass = hass
+        self.path = path
+        self.count = 0
+        self._header = {"format": TRACE_FORMAT, "version": TRACE_VERSION, **header}
+        self._start = time.monotonic()
+        self._lines: list[str] = []
+        self._fh: IO[str] | None = None
+        self._write_lock = asyncio.Lock()
+
+    async def async_open(self) -> None:
+        self._fh = await self.hass.async_add_executor_job(gzip.open, self.path, "wt")
+        self._lines.append(json.dumps(self._header, separators=(",", ":")))
+
+    def record(self, started: float, op: str, address: int, arg: Any, result: Any) -> None:
+        if self._fh is None:
+            return
+        if self.count >= CAPTURE_MAX_RECORDS:
+            if self.count == CAPTURE_MAX_RECORDS:
+                _LOGGER.warning("Capture %s reached %s records, dropping the rest", self.path, self.count)
+                self.count += 1
+            return
+        now = time.monotonic()
+        self.count += 1
+        self._lines.append(
+            json.dumps(
+                [round(started - self._start, 4), round(now - started, 4), op, address, arg, result],
+                separators=(",", ":"),
+            )
+        )
+        if len(self._lines) >= CAPTURE_FLUSH_EVERY:
+            self.hass.async_create_task(self.async_flush())
+
+    async def async_flush(self) -> None:
+        async with self._write_lock:
+            if self._fh is None or not self._lines:
+                return
+            lines, self._lines = self._lines, []
+            await self.hass.async_add_executor_job(self._fh.write, "\n".join(lines) + "\n")
+
+    async def async_close(self) -> None:
+        await self.async_flush()
+        async with self._write_lock:
+            fh, self._fh = self._fh, None
+            if fh is not None:
+                await self.hass.async_add_executor_job(fh.close)
+        _LOGGER.info("Modbus capture written to %s (%s records)", self.path, min(self.count, CAPTURE_MAX_RECORDS))
+
+
+def _result(rr: Any) -> Any:
+    if rr.isError():
+        return {"e": getattr(rr, "exception_code", None)}
+    return list(getattr(rr, "registers", None) or [])
+
+
+class CapturingClient:
+    """Wraps a Modbus client and records every request into a TrafficCapture."""
+
+    def __init__(self, client: Any, capture: TrafficCapture) -> None:
+        self.wrapped = client
+        self._capture = capture
+
+    @property
+    def connected(self) -> bool:
+        return bool(getattr(self.wrapped, "connected", False))
+
+    async def connect(self) -> bool:
+        started = time.monotonic()
+        try:
+            ok = await self.wrapped.connect()
+        except Exception as err:
+            self._capture.record(started, "c", 0, None, {"x": str(err)})
+            raise
+        self._capture.record(started, "c", 0, None, bool(ok))
+        return ok
+
+    def close(self) -> Any:
+        return self.wrapped.close()
+
+    async def _call(self, op: str, address: int, arg: Any, request) -> Any:
+        started = time.monotonic()
+        try:
+            rr = await request
+        except ModbusException as err:
+            self._capture.record(started, op, address, arg, {"x": str(err)})
+            raise
+        except TimeoutError:
+            self._capture.record(started, op, address, arg, {"t": "timeout"})
+            raise
+        except asyncio.CancelledError:
+            # The coordinator's read timeout cancels the request
+            self._capture.record(started, op, address, arg, {"t": "cancelled"})
+            raise
+        self._capture.record(started, op, address, arg, _result(rr))
+        return rr
+
+    async def read_input_registers(self, address: int, count: int = 1, **kwargs) -> Any:
+        return await self._call("ri", address, count, self.wrapped.read_input_registers(address, count=count, **kwargs))
+
+    async def read_holding_registers(self, address: int, count: int = 1, **kwargs) -> Any:
+        return await self._call("rh", address, count, self.wrapped.read_holding_registers(address, count=count, **kwargs))
+
+    async def write_register(self, address: int, value: int, **kwargs) -> Any:
+        return await self._call("w1", address, [value], self.wrapped.write_register(address, value=value, **kwargs))
+
+    async def write_registers(self, address: int, values: list[int], **kwargs) -> Any:
+        return await self._call("wn", address, list(values), self.wrapped.write_registers(address, values=values, **kwargs))
+
+
+def load_trace(path: str) -> tuple[dict[str, Any], list[list[Any]]]:
+    """Read a trace file (blocking) into its header and records."""
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rt") as fh:
+        header = json.loads(fh.readline())
+        if header.get("format") != TRACE_FORMAT or header.get("version") != TRACE_VERSION:
+            raise ValueError(f"{path} is not a version {TRACE_VERSION} Futura trace")
+        records = [json.loads(line) for line in fh if line.strip()]
+    return header, records
+
+
+class ReplayResponse:
+    def __init__(self, registers: list[int] | None = None, exception_code: int | None = None) -> None:
+        self.registers = registers or []
+        self.exception_code = exception_code
+
+    def isError(self) -> bool:  # noqa: N802 – pymodbus API
+        return self.exception_code is not None
+
+    def __str__(self) -> str:
+        if self.isError():
+            return f"ExceptionResponse(exception_code={self.exception_code})"
+        return f"ReplayResponse({self.registers})"
+
+
+class ReplayClient:
+    """Feeds a captured trace back to the coordinator in place of a Modbus client.
+
+    Records are queued per request (operation, address and, for reads, count)
+    and every request is answered by the next unused record of its queue, so
+    a replay is deterministic and a tier polled once more or less than in the
+    capture does not shift the other requests. A read that was never recorded
+    with this count is served from a recorded read covering its range (the
+    read plan of the replay differs from the captured one). With 'realtime'
+    each answer is delayed by the recorded request duration, otherwise it
+    returns immediately. An exhausted queue raises ModbusException and sets
+    'exhausted', or starts over when 'loop' is set.
+    """
+
+    def __init__(self, records: Iterable[list[Any]], *, realtime: bool = False, loop: bool = False) -> None:
+        self.records = list(records)
+        self.realtime = realtime
+        self.loop = loop
+        self.connected = False
+        self.exhausted = False
+        self.served = 0
+        self._by_key: dict[tuple, list[list[Any]]] = defaultdict(list)
+        for rec in self.records:
+            self._by_key[self._key(rec[2], rec[3], rec[4])].append(rec)
+        self._queues = {key: deque(recs) for key, recs in self._by_key.items()}
+
+    @staticmethod
+    def _key(op: str, address: int, arg: Any) -> tuple:
+        if op == "c":
+            return (op,)
+        if op.startswith("w"):
+            return (op, address)
+        return (op, address, arg)
+
+    @classmethod
+    def from_file(cls, path: str, **kwargs) -> ReplayClient:
+        return cls(load_trace(path)[1], **kwargs)
+
+    def _covering(self, op: str, address: int, count: int) -> tuple | None:
+        """Smallest recorded read of 'op' that contains address..address+count-1."""
+        keys = [
+            key for key in self._by_key
+            if len(key) == 3 and key[0] == op and key[1] <= address and key[1] + key[2] >= address + count
+        ]
+        return min(keys, key=lambda k: k[2]) if keys else None
+
+    def _pop(self, key: tuple) -> list[Any] | None:
+        queue = self._queues.get(key)
+        if queue is None:
+            return None
+        if not queue and self.loop:
+            queue.extend(self._by_key[key])
+        if not queue:
+            return None
+        self.served += 1
+        return queue.popleft()
+
+    def _take(self, op: str, address: int, arg: Any) -> tuple[list[Any], int]:
+        """Next record for the request and the offset of 'address' in its registers."""
+        key = self._key(op, address, arg)
+        offset = 0
+        if key not in self._by_key and not op.startswith("w"):
+            covering = self._covering(op, address, arg)
+            if covering is not None:
+                key, offset = covering, address - covering[1]
+        rec = self._pop(key)
+        if rec is None:
+            self.exhausted = True
+            raise ModbusException(f"Trace has no further {op} record for {address}/{arg}")
+        return rec, offset
+
+    async def _answer(self, op: str, address: int, arg: Any) -> ReplayResponse:
+        rec, offset = self._take(op, address, arg)
+        if self.realtime and rec[1]:
+            await asyncio.sleep(rec[1])
+        result = rec[5]
+        if isinstance(result, dict):
+            if "x" in result:
+                self.connected = False
+                raise ModbusException(result["x"])
+            if "t" in result:
+                self.connected = False
+                raise TimeoutError(f"Recorded request {result['t']}")
+            return ReplayResponse(exception_code=result.get("e"))
+        if op.startswith("r"):
+            return ReplayResponse(list(result[offset:offset + arg]))
+        return ReplayResponse(list(result))
+
+    async def connect(self) -> bool:
+        rec = self._pop(("c",))
+        if rec is not None:
+            if self.realtime and rec[1]:
+                await asyncio.sleep(rec[1])
+            if isinstance(rec[5], dict):
+                raise ModbusException(rec[5].get("x") or rec[5].get("t"))
+            self.connected = bool(rec[5])
+        else:
+            self.connected = True
+        return self.connected
+
+    def close(self) -> None:
+        self.connected = False
+
+    async def read_input_registers(self, address: int, count: int = 1, **kwargs) -> ReplayResponse:
+        return await self._answer("ri", address, count)
+
+    async def read_holding_registers(self, address: int, count: int = 1, **kwargs) -> ReplayResponse:
+        return await self._answer("rh", address, count)
+
+    async def write_register(self, address: int, value: int, **kwargs) -> ReplayResponse:
+        return await self._answer("w1", address, [value])
+
+    async def write_registers(self, address: int, values: list[int], **kwargs) -> ReplayResponse:
+        return await self._answer("wn", address, list(values))
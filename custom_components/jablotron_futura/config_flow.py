@@ -1,12 +1,34 @@
 from __future__ import annotations
 
+from urllib.parse import urlsplit
+
 import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 
-from .const import DOMAIN, CONF_HOST, CONF_PORT, DEFAULT_PORT, CONF_UNIT_ID, DEFAULT_UNIT_ID
+from .const import (
+    DOMAIN, CONF_HOST, CONF_PORT, DEFAULT_PORT, CONF_UNIT_ID, DEFAULT_UNIT_ID,
+    CONF_DCV_ENABLED, CONF_DCV_AGGREGATE, CONF_DCV_CO2_CURVE, CONF_DCV_HUMI_CURVE,
+    CONF_DCV_CO2_HYSTERESIS, CONF_DCV_HUMI_HYSTERESIS, CONF_DCV_MIN_LEVEL,
+    CONF_DCV_DWELL_UP, CONF_DCV_DWELL_DOWN,
+    DEFAULT_DCV_ENABLED, DEFAULT_DCV_AGGREGATE, DEFAULT_DCV_CO2_CURVE, DEFAULT_DCV_HUMI_CURVE,
+    DEFAULT_DCV_CO2_HYSTERESIS, DEFAULT_DCV_HUMI_HYSTERESIS, DEFAULT_DCV_MIN_LEVEL,
+    DEFAULT_DCV_DWELL_UP, DEFAULT_DCV_DWELL_DOWN,
+    CONF_SCAN_INTERVAL, CONF_HOLDING_EVERY, CONF_ALFA_EVERY, CONF_CONNECT_TIMEOUT,
+    CONF_READ_TIMEOUT, CONF_RETRIES, CONF_PIPELINE_DEPTH,
+    DEFAULT_SCAN_INTERVAL, DEFAULT_HOLDING_EVERY, DEFAULT_ALFA_EVERY, DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_READ_TIMEOUT, DEFAULT_RETRIES, DEFAULT_PIPELINE_DEPTH,
+    CONF_PUBLISH_URL, CONF_PUBLISH_FORMAT, CONF_PUBLISH_FULL_EVERY,
+    DEFAULT_PUBLISH_FORMAT, DEFAULT_PUBLISH_FULL_EVERY,
+    CONF_THERMAL_ENABLED, CONF_THERMAL_HORIZON, CONF_THERMAL_HEATING_BELOW,
+    CONF_THERMAL_BYPASS_DELTA, CONF_THERMAL_DWELL,
+    DEFAULT_THERMAL_ENABLED, DEFAULT_THERMAL_HORIZON, DEFAULT_THERMAL_HEATING_BELOW,
+    DEFAULT_THERMAL_BYPASS_DELTA, DEFAULT_THERMAL_DWELL,
+)
+from .dcv import parse_curve
+from .publisher import PUBLISH_SCHEMES
 
 
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -25,8 +47,9 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         })
         return self.async_show_form(step_id="user", data_schema=data_schema, errors=errors)
 
+    @staticmethod
     @callback
-    def async_get_options_flow(self, config_entry):
+    def async_get_options_flow(config_entry):
         return OptionsFlow(config_entry)
 
 
@@ -35,5 +58,79 @@ class OptionsFlow(config_entries.OptionsFlow):
         self.entry = entry
 
     async def async_step_init(self, user_input=None):
-        # No options yet; placeholder for future polling intervals etc.
-        return self.async_create_entry(title="", data={})
+        return self.async_show_menu(step_id="init", menu_options=["polling", "dcv", "thermal", "publisher"])
+
+    async def async_step_polling(self, user_input=None):
+        if user_input is not None:
+            return self.async_create_entry(title="", data={**self.entry.options, **user_input})
+
+        opts = self.entry.options
+        data_schema = vol.Schema({
+            vol.Optional(CONF_SCAN_INTERVAL, default=opts.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)): vol.All(int, vol.Range(min=1, max=300)),
+            vol.Optional(CONF_HOLDING_EVERY, default=opts.get(CONF_HOLDING_EVERY, DEFAULT_HOLDING_EVERY)): vol.All(int, vol.Range(min=1, max=60)),
+            vol.Optional(CONF_ALFA_EVERY, default=opts.get(CONF_ALFA_EVERY, DEFAULT_ALFA_EVERY)): vol.All(int, vol.Range(min=0, max=60)),
+            vol.Optional(CONF_CONNECT_TIMEOUT, default=opts.get(CONF_CONNECT_TIMEOUT, DEFAULT_CONNECT_TIMEOUT)): vol.All(vol.Coerce(float), vol.Range(min=0.5, max=60)),
+            vol.Optional(CONF_READ_TIMEOUT, default=opts.get(CONF_READ_TIMEOUT, DEFAULT_READ_TIMEOUT)): vol.All(vol.Coerce(float), vol.Range(min=0.2, max=60)),
+            vol.Optional(CONF_RETRIES, default=opts.get(CONF_RETRIES, DEFAULT_RETRIES)): vol.All(int, vol.Range(min=0, max=5)),
+            vol.Optional(CONF_PIPELINE_DEPTH, default=opts.get(CONF_PIPELINE_DEPTH, DEFAULT_PIPELINE_DEPTH)): vol.All(int, vol.Range(min=1, max=4)),
+        })
+        return self.async_show_form(step_id="polling", data_schema=data_schema)
+
+    async def async_step_dcv(self, user_input=None):
+        errors = {}
+        if user_input is not None:
+            try:
+                parse_curve(user_input[CONF_DCV_CO2_CURVE])
+                parse_curve(user_input[CONF_DCV_HUMI_CURVE])
+            except ValueError:
+                errors["base"] = "invalid_curve"
+            else:
+                return self.async_create_entry(title="", data={**self.entry.options, **user_input})
+
+        opts = {**self.entry.options, **(user_input or {})}
+        data_schema = vol.Schema({
+            vol.Optional(CONF_DCV_ENABLED, default=opts.get(CONF_DCV_ENABLED, DEFAULT_DCV_ENABLED)): bool,
+            vol.Optional(CONF_DCV_AGGREGATE, default=opts.get(CONF_DCV_AGGREGATE, DEFAULT_DCV_AGGREGATE)): vol.In(["max", "avg"]),
+            vol.Optional(CONF_DCV_CO2_CURVE, default=opts.get(CONF_DCV_CO2_CURVE, DEFAULT_DCV_CO2_CURVE)): str,
+            vol.Optional(CONF_DCV_CO2_HYSTERESIS, default=opts.get(CONF_DCV_CO2_HYSTERESIS, DEFAULT_DCV_CO2_HYSTERESIS)): vol.All(int, vol.Range(min=0, max=1000)),
+            vol.Optional(CONF_DCV_HUMI_CURVE, default=opts.get(CONF_DCV_HUMI_CURVE, DEFAULT_DCV_HUMI_CURVE)): str,
+            vol.Optional(CONF_DCV_HUMI_HYSTERESIS, default=opts.get(CONF_DCV_HUMI_HYSTERESIS, DEFAULT_DCV_HUMI_HYSTERESIS)): vol.All(int, vol.Range(min=0, max=50)),
+            vol.Optional(CONF_DCV_MIN_LEVEL, default=opts.get(CONF_DCV_MIN_LEVEL, DEFAULT_DCV_MIN_LEVEL)): vol.All(int, vol.Range(min=1, max=5)),
+            vol.Optional(CONF_DCV_DWELL_UP, default=opts.get(CONF_DCV_DWELL_UP, DEFAULT_DCV_DWELL_UP)): vol.All(int, vol.Range(min=0, max=3600)),
+            vol.Optional(CONF_DCV_DWELL_DOWN, default=opts.get(CONF_DCV_DWELL_DOWN, DEFAULT_DCV_DWELL_DOWN)): vol.All(int, vol.Range(min=0, max=7200)),
+        })
+        return self.async_show_form(step_id="dcv", data_schema=data_schema, errors=errors)
+
+    async def async_step_thermal(self, user_input=None):
+        if user_input is not None:
+            return self.async_create_entry(title="", data={**self.entry.options, **user_input})
+
+        opts = self.entry.options
+        data_schema = vol.Schema({
+            vol.Optional(CONF_THERMAL_ENABLED, default=opts.get(CONF_THERMAL_ENABLED, DEFAULT_THERMAL_ENABLED)): bool,
+            vol.Optional(CONF_THERMAL_HORIZON, default=opts.get(CONF_THERMAL_HORIZON, DEFAULT_THERMAL_HORIZON)): vol.All(int, vol.Range(min=10, max=240)),
+            vol.Optional(CONF_THERMAL_HEATING_BELOW, default=opts.get(CONF_THERMAL_HEATING_BELOW, DEFAULT_THERMAL_HEATING_BELOW)): vol.All(vol.Coerce(float), vol.Range(min=-20, max=25)),
+            vol.Optional(CONF_THERMAL_BYPASS_DELTA, default=opts.get(CONF_THERMAL_BYPASS_DELTA, DEFAULT_THERMAL_BYPASS_DELTA)): vol.All(vol.Coerce(float), vol.Range(min=1, max=15)),
+            vol.Optional(CONF_THERMAL_DWELL, default=opts.get(CONF_THERMAL_DWELL, DEFAULT_THERMAL_DWELL)): vol.All(int, vol.Range(min=5, max=720)),
+        })
+        return self.async_show_form(step_id="thermal", data_schema=data_schema)
+
+    async def async_step_publisher(self, user_input=None):
+        errors = {}
+        if user_input is not None:
+            url = user_input.get(CONF_PUBLISH_URL, "").strip()
+            parts = urlsplit(url)
+            if url and (parts.scheme not in PUBLISH_SCHEMES or not parts.hostname):
+                errors[CONF_PUBLISH_URL] = "invalid_url"
+            else:
+                return self.async_create_entry(
+                    title="", data={**self.entry.options, **user_input, CONF_PUBLISH_URL: url}
+                )
+
+        opts = {**self.entry.options, **(user_input or {})}
+        data_schema = vol.Schema({
+            vol.Optional(CONF_PUBLISH_URL, default=opts.get(CONF_PUBLISH_URL, "")): str,
+            vol.Optional(CONF_PUBLISH_FORMAT, default=opts.get(CONF_PUBLISH_FORMAT, DEFAULT_PUBLISH_FORMAT)): vol.In(["json", "binary"]),
+            vol.Optional(CONF_PUBLISH_FULL_EVERY, default=opts.get(CONF_PUBLISH_FULL_EVERY, DEFAULT_PUBLISH_FULL_EVERY)): vol.All(int, vol.Range(min=0, max=3600)),
+        })
+        return self.async_show_form(step_id="publisher", data_schema=data_schema, errors=errors)
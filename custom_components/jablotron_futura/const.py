@@ -99,3 +99,102 @@ VENT_MODE_MAP = {
 VENT_MODE_INV = {v: k for k, v in VENT_MODE_MAP.items()}
 
 HUMI_MODE_MAP = {"Suché": 25.0, "Komfortní": 50.0, "Vlhké": 75.0}
+
+# Write scheduler – priority lanes (lower number wins)
+PRIORITY_USER = 0         # UI / API call with a user behind it
+PRIORITY_AUTOMATION = 1   # automations, scripts, services without user
+PRIORITY_BACKGROUND = 2   # internal control loops
+
+# Debounce per lane (s) – last writer within the window wins
+WRITE_DEBOUNCE = {
+    PRIORITY_USER: 0.3,
+    PRIORITY_AUTOMATION: 2.0,
+    PRIORITY_BACKGROUND: 5.0,
+}
+
+# Minimal spacing between two writes of the same register per lane (s)
+WRITE_MIN_INTERVAL = {
+    PRIORITY_USER: 1.0,
+    PRIORITY_AUTOMATION: 30.0,
+    PRIORITY_BACKGROUND: 60.0,
+}
+
+# Per-register override for non-user lanes (setpoints are stored in EEPROM)
+WRITE_REGISTER_MIN_INTERVAL = {
+    0: 60.0,    # mode_raw
+    10: 300.0,  # temp_set_raw
+    11: 300.0,  # humi_set_raw
+    14: 300.0,  # bypass_enable_raw
+    15: 300.0,  # heating_enable_raw
+    16: 300.0,  # cooling_enable_raw
+}
+
+# Demand controlled ventilation (options)
+CONF_DCV_ENABLED = "dcv_enabled"
+CONF_DCV_AGGREGATE = "dcv_aggregate"          # "max" | "avg" across connected ALFA
+CONF_DCV_CO2_CURVE = "dcv_co2_curve"          # "ppm:level,..."
+CONF_DCV_HUMI_CURVE = "dcv_humi_curve"        # "%:level,..."
+CONF_DCV_CO2_HYSTERESIS = "dcv_co2_hysteresis"
+CONF_DCV_HUMI_HYSTERESIS = "dcv_humi_hysteresis"
+CONF_DCV_MIN_LEVEL = "dcv_min_level"
+CONF_DCV_DWELL_UP = "dcv_dwell_up"            # s before a further increase
+CONF_DCV_DWELL_DOWN = "dcv_dwell_down"        # s before a decrease
+
+DEFAULT_DCV_ENABLED = False
+DEFAULT_DCV_AGGREGATE = "max"
+DEFAULT_DCV_CO2_CURVE = "800:2,1000:3,1200:4,1500:5"
+DEFAULT_DCV_HUMI_CURVE = "65:2,75:3,85:4"
+DEFAULT_DCV_CO2_HYSTERESIS = 100
+DEFAULT_DCV_HUMI_HYSTERESIS = 5
+DEFAULT_DCV_MIN_LEVEL = 1
+DEFAULT_DCV_DWELL_UP = 60
+DEFAULT_DCV_DWELL_DOWN = 600
+
+# Predictive bypass / heating enable (options)
+CONF_THERMAL_ENABLED = "thermal_enabled"
+CONF_THERMAL_HORIZON = "thermal_horizon"              # min the trend is extrapolated
+CONF_THERMAL_HEATING_BELOW = "thermal_heating_below"  # °C outdoor that needs heating
+CONF_THERMAL_BYPASS_DELTA = "thermal_bypass_delta"    # °C outdoor must be cooler than indoor
+CONF_THERMAL_DWELL = "thermal_dwell"                  # min between two changes of a register
+
+DEFAULT_THERMAL_ENABLED = False
+DEFAULT_THERMAL_HORIZON = 60
+DEFAULT_THERMAL_HEATING_BELOW = 10.0
+DEFAULT_THERMAL_BYPASS_DELTA = 3.0
+DEFAULT_THERMAL_DWELL = 30
+
+# Polling / transport tuning (options, applied live)
+CONF_SCAN_INTERVAL = "scan_interval"          # s between two polls
+CONF_HOLDING_EVERY = "holding_every"          # settings/timers read every N polls
+CONF_ALFA_EVERY = "alfa_every"                # ALFA values read every N polls, 0 = off
+CONF_CONNECT_TIMEOUT = "connect_timeout"      # s
+CONF_READ_TIMEOUT = "read_timeout"            # s per request
+CONF_RETRIES = "retries"                      # extra attempts of a failed read
+CONF_PIPELINE_DEPTH = "pipeline_depth"        # Modbus requests in flight at once
+
+DEFAULT_SCAN_INTERVAL = 5
+DEFAULT_HOLDING_EVERY = 1
+DEFAULT_ALFA_EVERY = 1
+DEFAULT_CONNECT_TIMEOUT = 5
+DEFAULT_READ_TIMEOUT = 5
+DEFAULT_RETRIES = 1
+DEFAULT_PIPELINE_DEPTH = 1
+RETRY_DELAY = 0.2                             # s before a retry after reconnecting
+
+# Telemetry publisher (options) – one batched message per poll
+CONF_PUBLISH_URL = "publish_url"              # mqtt://[user:pass@]host[:port]/topic, ws(s)://...
+CONF_PUBLISH_FORMAT = "publish_format"        # "json" | "binary"
+CONF_PUBLISH_FULL_EVERY = "publish_full_every"  # full snapshot every N messages, 0 = only on connect
+
+DEFAULT_PUBLISH_FORMAT = "json"
+DEFAULT_PUBLISH_FULL_EVERY = 60
+
+# Read planning – addresses decoded every cycle and the hand-tuned blocks
+# used until the autoprobe learned the legal spans of the connected unit
+MAX_READ_COUNT = 125
+INPUT_MAIN_NEEDED = [*range(14, 22), *range(30, 39), *range(40, 49), 52, 75]
+DEFAULT_INPUT_MAIN_BLOCKS = [(14, 8), (30, 4), (34, 5), (40, 9), (52, 1), (75, 1)]
+HOLDING_MAIN_NEEDED = list(range(HOLD_START_MAIN, HOLD_START_MAIN + HOLD_LEN_MAIN))
+DEFAULT_HOLDING_MAIN_BLOCKS = [(HOLD_START_MAIN, HOLD_LEN_MAIN)]
+ALFA_SLOT_LEN = 6             # used registers of each 10-register ALFA slot
+DEFAULT_ALFA_BLOCKS = [(INP_START_ALFA + i * 10, ALFA_SLOT_LEN) for i in range(8)]
@@ -1,19 +1,43 @@
 from __future__ import annotations
 
+import asyncio
 import datetime as dt
 import logging
 import inspect
-from typing import Any, Dict
+import time
+from typing import Any, Callable, Dict, Mapping
 
+from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_PORT
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, Context, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import dt as ha_dt
 
 from pymodbus.client import AsyncModbusTcpClient
 from pymodbus.exceptions import ModbusException
 
-from .const import DOMAIN, CONF_UNIT_ID, DEFAULT_UNIT_ID, KEYS, INP_START_ALFA
+from .const import (
+    DOMAIN, CONF_UNIT_ID, DEFAULT_UNIT_ID, KEYS, INP_START_ALFA, HOLD_START_MAIN,
+    INPUT_MAIN_NEEDED, HOLDING_MAIN_NEEDED,
+    CONF_SCAN_INTERVAL, CONF_HOLDING_EVERY, CONF_ALFA_EVERY, CONF_CONNECT_TIMEOUT,
+    CONF_READ_TIMEOUT, CONF_RETRIES, CONF_PIPELINE_DEPTH,
+    DEFAULT_SCAN_INTERVAL, DEFAULT_HOLDING_EVERY, DEFAULT_ALFA_EVERY, DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_READ_TIMEOUT, DEFAULT_RETRIES, DEFAULT_PIPELINE_DEPTH, RETRY_DELAY,
+)
+from .analytics import FuturaAnalytics
+from .capture import CapturingClient, TrafficCapture
+from .const import PRIORITY_BACKGROUND
+from .dcv import DemandControl
+from .dump import async_dump_registers
+from .planner import REGIONS, ReadPlanner, alfa_needed
+from .profiling import PhaseTimings
+from .publisher import FuturaPublisher
+from .scheduler import FuturaWriteScheduler, priority_from_context
+from .stats import FuturaStatistics
+from .thermal import ThermalScheduler
+from .timers import CountdownTracker, derive_countdown_fields
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -22,51 +46,244 @@ def _to_int16(x: int) -> int:
     return x - 0x10000 if x & 0x8000 else x
 
 
+def _serializes(client: Any) -> bool:
+    """True when the client queues its own requests one at a time.
+
+    pymodbus (3.16 and others) runs every request of a client under a lock
+    in its transaction manager. Pipelining in front of it would only move the
+    wait for that lock into the request timeout.
+    """
+    client = getattr(client, "wrapped", client)
+    return isinstance(getattr(getattr(client, "ctx", None), "_lock", None), asyncio.Lock)
+
+
+class _BusGate:
+    """Admits at most 'depth' concurrent Modbus requests; depth may change at runtime."""
+
+    def __init__(self, depth: int = 1) -> None:
+        self.depth = depth
+        self._active = 0
+        self._cond = asyncio.Condition()
+
+    async def set_depth(self, depth: int) -> None:
+        async with self._cond:
+            self.depth = depth
+            self._cond.notify_all()
+
+    async def __aenter__(self) -> None:
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._active < self.depth)
+            self._active += 1
+
+    async def __aexit__(self, *exc) -> None:
+        async with self._cond:
+            self._active -= 1
+            self._cond.notify_all()
+
+
 class FuturaCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
     """Coordinator that reads/writes Modbus registers."""
 
-    def __init__(self, hass: HomeAssistant, cfg: dict) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        cfg: dict,
+        options: Mapping[str, Any] | None = None,
+        *,
+        config_entry: ConfigEntry | None = None,
+        client_factory: Callable[[], AsyncModbusTcpClient] | None = None,
+    ) -> None:
+        options = options or {}
         super().__init__(
             hass,
             _LOGGER,
+            config_entry=config_entry,
             name="Jablotron Futura",
-            update_interval=dt.timedelta(seconds=5),
+            update_interval=dt.timedelta(
+                seconds=options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+            ),
         )
         self.host = cfg.get(CONF_HOST)
         self.port = cfg.get(CONF_PORT, 502)
         self.unit = cfg.get(CONF_UNIT_ID, DEFAULT_UNIT_ID)
 
         self.client: AsyncModbusTcpClient | None = None
+        # Anything with the AsyncModbusTcpClient interface (simulator, replay, ...)
+        self._client_factory = client_factory
+        # Shared by all entities of this unit
+        self.device_info = {
+            "identifiers": {(DOMAIN, self.host)},
+            "manufacturer": "Jablotron",
+            "model": "Futura",
+            "name": "Jablotron Futura",
+        }
         self._device_kwarg = "device_id" if "device_id" in inspect.signature(AsyncModbusTcpClient.read_input_registers).parameters else "slave"
 
+        # Raw copy of holding registers 0..17 from the last read (and our own writes)
+        self._hold_cache: list[int] | None = None
+        self.writer = FuturaWriteScheduler(self)
+        # Polling, writes and diagnostics share the bus; requests in flight are
+        # limited to the pipelining depth (1 = strictly one at a time). It
+        # stays 1 until the client is known not to serialise requests itself.
+        self._apply_tuning(options)
+        self._bus = _BusGate(1)
+        self._connect_lock = asyncio.Lock()
+        # Raw registers of the slower tiers, reused by polls that skip them
+        self._hold_regs: dict[int, int] | None = None
+        self._hold_written = False   # a write changed the holding area since the last read
+        self._hold_fresh = False     # the last poll read the holding area (see holding_matches)
+        self._alfa_regs: tuple[int, dict[int, int]] | None = None   # (connected bits, registers)
+        # Legal/illegal address spans learned by the register dump
+        self.register_map: dict[str, dict[str, list[tuple[int, int]]]] = {}
+        self.planner = ReadPlanner(hass)
+        self.dcv = DemandControl(options)
+        self._dcv_options = {k: v for k, v in options.items() if k.startswith("dcv_")}
+        self.thermal = ThermalScheduler(options)
+        self._thermal_options = {k: v for k, v in options.items() if k.startswith("thermal_")}
+        self.analytics = FuturaAnalytics()
+        self.countdowns = CountdownTracker()
+        self._countdown_unsub: CALLBACK_TYPE | None = None
+        # Incremented by every real poll (countdown ticks only re-publish data)
+        self.poll_count = 0
+        self._capture: TrafficCapture | None = None
+        # Per-phase wall time of the cycles (io / decode / fanout), see profiling.py
+        self.phases = PhaseTimings()
+        self._cycle_io = 0.0
+        # Optional telemetry publisher, started by async_apply_options / setup
+        self.publisher = FuturaPublisher(self)
+        # Hourly statistics aggregator, attached by async_setup_entry (stats.py)
+        self.statistics: FuturaStatistics | None = None
+        self._capture_unsub: CALLBACK_TYPE | None = None
+
+    def _apply_tuning(self, options: Mapping[str, Any]) -> None:
+        self.holding_every = int(options.get(CONF_HOLDING_EVERY, DEFAULT_HOLDING_EVERY))
+        self.alfa_every = int(options.get(CONF_ALFA_EVERY, DEFAULT_ALFA_EVERY))
+        self.connect_timeout = float(options.get(CONF_CONNECT_TIMEOUT, DEFAULT_CONNECT_TIMEOUT))
+        self.read_timeout = float(options.get(CONF_READ_TIMEOUT, DEFAULT_READ_TIMEOUT))
+        self.retries = int(options.get(CONF_RETRIES, DEFAULT_RETRIES))
+        self.pipeline_depth = int(options.get(CONF_PIPELINE_DEPTH, DEFAULT_PIPELINE_DEPTH))
+
+    def polling_options(self) -> dict[str, Any]:
+        """The polling/connection options currently in effect."""
+        return {
+            CONF_SCAN_INTERVAL: self.update_interval.total_seconds() if self.update_interval else DEFAULT_SCAN_INTERVAL,
+            CONF_HOLDING_EVERY: self.holding_every,
+            CONF_ALFA_EVERY: self.alfa_every,
+            CONF_CONNECT_TIMEOUT: self.connect_timeout,
+            CONF_READ_TIMEOUT: self.read_timeout,
+            CONF_RETRIES: self.retries,
+            CONF_PIPELINE_DEPTH: self.pipeline_depth,
+        }
+
+    async def async_apply_options(self, options: Mapping[str, Any]) -> None:
+        """Apply changed options to the running coordinator.
+
+        The Modbus connection, the entities and the learned read plan stay as
+        they are; only timing, tiers and the DCV loop are reconfigured.
+        """
+        self._apply_tuning(options)
+        await self._bus.set_depth(self._bus_depth())
+        self.update_interval = dt.timedelta(
+            seconds=options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+        )
+        client = getattr(self.client, "wrapped", self.client)
+        # pymodbus 3.16 reads it from the transaction manager's own copy
+        for owner in (client, getattr(client, "ctx", None)):
+            params = getattr(owner, "comm_params", None)
+            if params is not None and hasattr(params, "timeout_connect"):
+                params.timeout_connect = self._client_timeout
+        dcv_options = {k: v for k, v in options.items() if k.startswith("dcv_")}
+        if dcv_options != self._dcv_options:
+            self._dcv_options = dcv_options
+            self.dcv = DemandControl(options)
+        thermal_options = {k: v for k, v in options.items() if k.startswith("thermal_")}
+        if thermal_options != self._thermal_options:
+            self._thermal_options = thermal_options
+            self.thermal = ThermalScheduler(options)
+        await self.publisher.async_configure(options)
+        # Re-read everything with the new settings and restart the timer
+        self._hold_regs = self._alfa_regs = None
+        await self.async_request_refresh()
+
+    @property
+    def _client_timeout(self) -> float:
+        # pymodbus uses one timeout for connecting and for every response; the
+        # connect and read timers of this class are the effective ones
+        return max(self.connect_timeout, self.read_timeout)
+
+    def _bus_depth(self) -> int:
+        if self.client is None or _serializes(self.client):
+            return 1
+        return max(1, self.pipeline_depth)
+
     async def _ensure_client(self) -> AsyncModbusTcpClient:
-        if self.client is None:
-            # timeout stejně jako v původním YAML (5 s)
-            self.client = AsyncModbusTcpClient(self.host, port=self.port, timeout=5)
+        # Several pipelined requests may find the client missing at once
+        async with self._connect_lock:
+            if self.client is None:
+                if self._client_factory is not None:
+                    self.client = self._client_factory()
+                else:
+                    # Retries are handled per request in _read_raw (retry budget option)
+                    self.client = AsyncModbusTcpClient(
+                        self.host, port=self.port, timeout=self._client_timeout, retries=0
+                    )
+                if self._capture is not None:
+                    self.client = CapturingClient(self.client, self._capture)
+                await self._bus.set_depth(self._bus_depth())
 
-        if not getattr(self.client, "connected", False):
-            try:
-                await self.client.connect()
-            except Exception as e:
-                try:
-                    await self.client.close()
-                except Exception:
-                    pass
-                self.client = None
-                raise UpdateFailed(
-                    f"TCP connect failed to {self.host}:{self.port}"
-                ) from e
             if not getattr(self.client, "connected", False):
                 try:
-                    await self.client.close()
-                except Exception:
-                    pass
-                self.client = None
-                raise UpdateFailed(f"TCP connect failed to {self.host}:{self.port}")
-
-        return self.client
+                    async with asyncio.timeout(self.connect_timeout):
+                        await self.client.connect()
+                except Exception as e:
+                    try:
+                        await self.client.close()
+                    except Exception:
+                        pass
+                    self.client = None
+                    raise UpdateFailed(
+                        f"TCP connect failed to {self.host}:{self.port}"
+                    ) from e
+                if not getattr(self.client, "connected", False):
+                    try:
+                        await self.client.close()
+                    except Exception:
+                        pass
+                    self.client = None
+                    raise UpdateFailed(f"TCP connect failed to {self.host}:{self.port}")
+
+            return self.client
+
+    @callback
+    def _schedule_countdown_tick(self) -> None:
+        if self._countdown_unsub is not None:
+            self._countdown_unsub()
+            self._countdown_unsub = None
+        delay = self.countdowns.next_tick(self.hass.loop.time())
+        if delay is not None:
+            self._countdown_unsub = async_call_later(self.hass, delay, self._async_countdown_tick)
+
+    @callback
+    def _async_countdown_tick(self, _now: dt.datetime) -> None:
+        """Publish locally projected timers; poll right away once one expires."""
+        self._countdown_unsub = None
+        if not self.data:
+            return
+        mono = self.hass.loop.time()
+        if self.countdowns.expired(mono):
+            self.hass.async_create_task(self.async_request_refresh())
+            return
+        self.data = {**self.data, **self.countdowns.interpolate(mono)}
+        self.async_update_listeners()
+        self._schedule_countdown_tick()
 
     async def async_close(self) -> None:
+        if self._countdown_unsub is not None:
+            self._countdown_unsub()
+            self._countdown_unsub = None
+        await self.async_stop_capture()
+        await self.publisher.async_stop()
+        await self.writer.async_stop()
         if self.client:
             try:
                 await self.client.close()
@@ -74,66 +291,143 @@ class FuturaCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
                 pass
             self.client = None
 
+    async def _read_raw(self, start: int, count: int, *, input_regs: bool):
+        """Issue one read request and return the raw pymodbus response.
+
+        Transport errors raise UpdateFailed, Modbus exception responses are
+        returned to the caller (see rr.isError() / rr.exception_code).
+        """
+        kwargs = {"count": count, self._device_kwarg: self.unit}
+        err: Exception | None = None
+        for attempt in range(self.retries + 1):
+            if attempt:
+                _LOGGER.debug("Retrying read @ %s/%s after: %s", start, count, err)
+                await asyncio.sleep(RETRY_DELAY)
+            async with self._bus:
+                try:
+                    client = await self._ensure_client()
+                except UpdateFailed as e:
+                    err = e
+                    continue
+                try:
+                    async with asyncio.timeout(self.read_timeout):
+                        if input_regs:
+                            return await client.read_input_registers(start, **kwargs)
+                        return await client.read_holding_registers(start, **kwargs)
+                except (ModbusException, TimeoutError) as e:
+                    try:
+                        await client.close()
+                    except Exception:
+                        pass
+                    if self.client is client:
+                        self.client = None
+                    err = e
+        raise UpdateFailed(f"Modbus read failed @ {start}/{count}: {err}") from err
+
     async def _read_block(self, start: int, count: int, *, input_regs: bool) -> list[int]:
-        client = await self._ensure_client()
-        try:
-            kwargs = {"count": count, self._device_kwarg: self.unit}
-            if input_regs:
-                rr = await client.read_input_registers(start, **kwargs)
-            else:
-                rr = await client.read_holding_registers(start, **kwargs)
-        except ModbusException as e:
-            try:
-                await client.close()
-            except Exception:
-                pass
-            self.client = None
-            raise UpdateFailed(f"Modbus read failed @ {start}/{count}: {e}") from e
+        rr = await self._read_raw(start, count, input_regs=input_regs)
         if rr.isError():
             raise UpdateFailed(f"Modbus error @ {start}/{count}: {rr}")
         return list(rr.registers)
 
     @staticmethod
-    def _u32_from(block: list[int], base: int, addr: int) -> int:
+    def _u32_from(block: Mapping[int, int], base: int, addr: int) -> int:
         idx = addr - base
         hi = block[idx]
         lo = block[idx + 1]
         return (hi << 16) | lo
 
     @staticmethod
-    def _i16_from(block: list[int], base: int, addr: int) -> int:
+    def _i16_from(block: Mapping[int, int], base: int, addr: int) -> int:
         idx = addr - base
         return _to_int16(block[idx])
 
     @staticmethod
-    def _u16_from(block: list[int], base: int, addr: int) -> int:
+    def _u16_from(block: Mapping[int, int], base: int, addr: int) -> int:
         idx = addr - base
         return block[idx]
 
+    async def _read_region(self, region: str, needed: list[int]) -> dict[int, int]:
+        """Read 'needed' addresses of a region using the planner's blocks.
+
+        A learned block that fails is forgotten and the cycle falls back to the
+        hand-tuned default block for its start.
+        """
+        regs: dict[int, int] = {}
+        input_regs = REGIONS[region].input_regs
+        blocks = self.planner.plan(region, needed)
+        # Issued together, the bus gate decides how many are really in flight
+        responses = await asyncio.gather(
+            *(self._read_raw(start, count, input_regs=input_regs) for start, count in blocks),
+            return_exceptions=True,
+        )
+        for rr in responses:
+            if isinstance(rr, BaseException):
+                raise rr
+        for (start, count), rr in zip(blocks, responses):
+            if rr.isError():
+                if self.planner.has_span(region, start):
+                    _LOGGER.warning(
+                        "Learned read block %s/%s failed (%s), falling back to the default block",
+                        start, count, rr,
+                    )
+                    await self.planner.async_forget(region, start)
+                    return await self._read_region(region, needed)
+                raise UpdateFailed(f"Modbus error @ {start}/{count}: {rr}")
+            regs.update(zip(range(start, start + count), rr.registers))
+        return regs
+
+    async def _timed_read_region(self, region: str, needed: list[int]) -> dict[int, int]:
+        start = time.perf_counter()
+        try:
+            return await self._read_region(region, needed)
+        finally:
+            self._cycle_io += time.perf_counter() - start
+
+    @callback
+    def async_update_listeners(self) -> None:
+        start = time.perf_counter()
+        super().async_update_listeners()
+        self.phases.add("fanout", time.perf_counter() - start)
+
+    async def async_setup_read_plan(self) -> None:
+        """Learn (or load) the largest legal read spans for this unit variant."""
+        if not self.data:
+            return
+        await self.planner.async_setup(self, int(self.data["variant_raw"]))
+
     async def _async_update_data(self) -> Dict[str, Any]:
         """Read all needed registers and parse into a dict.
 
-        Čteme po segmentech, protože velký rozsah 14..44 vrací ILLEGAL DATA ADDRESS.
+        Velký rozsah 14..44 vrací ILLEGAL DATA ADDRESS, proto se čte po blocích
+        z plánovače (výchozí ručně laděné bloky, po sondě naučené maximální rozsahy).
+        Registry se skládají do slovníku adresa -> hodnota (base 0).
         """
-        # Input segments
-        inp_14_21 = await self._read_block(14, 8, input_regs=True)   # 14..21 (variant + bity 16..21)
-        inp_30_33 = await self._read_block(30, 4, input_regs=True)   # 30..33 (teploty)
-        inp_34_38 = await self._read_block(34, 5, input_regs=True)   # 34..38 (vlhkosti + NTC)
-        inp_40_48 = await self._read_block(40, 9, input_regs=True)   # 40..48 (filtr, příkon, zpětně získávané teplo, výkon topení dohřevu, průtok, ventilátory)
-        inp_52 = await self._read_block(52, 1, input_regs=True)      # 52 baterie RTC
-        inp_alfa_bits = await self._read_block(KEYS["alfa_connected_bits"], 1, input_regs=True)  # 75 (bitfield)
-
-        # Holding area (0..17 je u Futury souvislý rozsah)
-        hold_main = await self._read_block(0, 18, input_regs=False)
+        cycle_start = time.perf_counter()
+        self._cycle_io = 0.0
+        inp = await self._timed_read_region("input_main", INPUT_MAIN_NEEDED)
+        # Settings/timers and ALFA values are slower tiers (options), the
+        # countdowns in between are interpolated (timers.py)
+        hold_read = (
+            self._hold_regs is None
+            or self._hold_written
+            or self.poll_count % max(1, self.holding_every) == 0
+        )
+        if hold_read:
+            self._hold_regs = await self._timed_read_region("holding_main", HOLDING_MAIN_NEEDED)
+            self._hold_cache = [self._hold_regs[a] for a in HOLDING_MAIN_NEEDED]
+            self._hold_written = False
+        self._hold_fresh = hold_read
+        hold = self._hold_regs
 
         data: Dict[str, Any] = {}
 
         # Input area – bity a variant
-        data["variant_raw"]      = self._u16_from(inp_14_21, 14, KEYS["variant_raw"])
-        data["fut_config_raw"]   = self._u16_from(inp_14_21, 14, KEYS["fut_config_raw"])
-        data["modes_bits_raw"]   = self._u32_from(inp_14_21, 14, KEYS["modes_bits_raw"])
-        data["errors_bits_raw"]  = self._u32_from(inp_14_21, 14, KEYS["errors_bits_raw"])
-        data["warnings_bits_raw"]= self._u32_from(inp_14_21, 14, KEYS["warnings_bits_raw"])
+        data["variant_raw"]      = self._u16_from(inp, 0, KEYS["variant_raw"])
+        data["fut_config_raw"]   = self._u16_from(inp, 0, KEYS["fut_config_raw"])
+        data["modes_bits_raw"]   = self._u32_from(inp, 0, KEYS["modes_bits_raw"])
+        data["errors_bits_raw"]  = self._u32_from(inp, 0, KEYS["errors_bits_raw"])
+        data["warnings_bits_raw"]= self._u32_from(inp, 0, KEYS["warnings_bits_raw"])
 
         # Feature availability derived from fut_config
         fc = data["fut_config_raw"]
@@ -146,52 +440,61 @@ class FuturaCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
         data["bypass_available"] = data["has_bypass"]
 
         # Teploty
-        data["temp_outdoor"]     = self._i16_from(inp_30_33, 30, KEYS["temp_outdoor"]) / 10.0
-        data["temp_supply"]      = self._i16_from(inp_30_33, 30, KEYS["temp_supply"]) / 10.0
-        data["temp_extract"]     = self._i16_from(inp_30_33, 30, KEYS["temp_extract"]) / 10.0
-        data["temp_exhaust"]     = self._i16_from(inp_30_33, 30, KEYS["temp_exhaust"]) / 10.0
-        data["temp_outdoor_ntc"] = self._i16_from(inp_34_38, 34, KEYS["temp_outdoor_ntc"]) / 10.0
+        data["temp_outdoor"]     = self._i16_from(inp, 0, KEYS["temp_outdoor"]) / 10.0
+        data["temp_supply"]      = self._i16_from(inp, 0, KEYS["temp_supply"]) / 10.0
+        data["temp_extract"]     = self._i16_from(inp, 0, KEYS["temp_extract"]) / 10.0
+        data["temp_exhaust"]     = self._i16_from(inp, 0, KEYS["temp_exhaust"]) / 10.0
+        data["temp_outdoor_ntc"] = self._i16_from(inp, 0, KEYS["temp_outdoor_ntc"]) / 10.0
 
         # Vlhkosti
-        data["humi_outdoor"]     = self._i16_from(inp_34_38, 34, KEYS["humi_outdoor"]) / 10.0
-        data["humi_supply"]      = self._i16_from(inp_34_38, 34, KEYS["humi_supply"]) / 10.0
-        data["humi_extract"]     = self._i16_from(inp_34_38, 34, KEYS["humi_extract"]) / 10.0
-        data["humi_exhaust"]     = self._i16_from(inp_34_38, 34, KEYS["humi_exhaust"]) / 10.0
+        data["humi_outdoor"]     = self._i16_from(inp, 0, KEYS["humi_outdoor"]) / 10.0
+        data["humi_supply"]      = self._i16_from(inp, 0, KEYS["humi_supply"]) / 10.0
+        data["humi_extract"]     = self._i16_from(inp, 0, KEYS["humi_extract"]) / 10.0
+        data["humi_exhaust"]     = self._i16_from(inp, 0, KEYS["humi_exhaust"]) / 10.0
 
         # Výkony / průtok
-        data["filter_wear"]      = self._u16_from(inp_40_48, 40, KEYS["filter_wear"])
-        data["power"]            = self._u16_from(inp_40_48, 40, KEYS["power"])
-        data["heat_recovering"]  = self._u16_from(inp_40_48, 40, KEYS["heat_recovering"])
-        data["heating_power"]    = self._u16_from(inp_40_48, 40, KEYS["heating_power"])
-        data["air_flow"]         = self._u16_from(inp_40_48, 40, KEYS["air_flow"])
-        data["fan_power_supply"] = self._u16_from(inp_40_48, 40, KEYS["fan_power_supply"])
-        data["fan_power_exhaust"]= self._u16_from(inp_40_48, 40, KEYS["fan_power_exhaust"])
-        data["fan_rpm_supply"]   = self._u16_from(inp_40_48, 40, KEYS["fan_rpm_supply"])
-        data["fan_rpm_exhaust"]  = self._u16_from(inp_40_48, 40, KEYS["fan_rpm_exhaust"])
-        data["rtc_batt_voltage"] = self._u16_from(inp_52, 52, KEYS["rtc_batt_voltage"])
+        data["filter_wear"]      = self._u16_from(inp, 0, KEYS["filter_wear"])
+        data["power"]            = self._u16_from(inp, 0, KEYS["power"])
+        data["heat_recovering"]  = self._u16_from(inp, 0, KEYS["heat_recovering"])
+        data["heating_power"]    = self._u16_from(inp, 0, KEYS["heating_power"])
+        data["air_flow"]         = self._u16_from(inp, 0, KEYS["air_flow"])
+        data["fan_power_supply"] = self._u16_from(inp, 0, KEYS["fan_power_supply"])
+        data["fan_power_exhaust"]= self._u16_from(inp, 0, KEYS["fan_power_exhaust"])
+        data["fan_rpm_supply"]   = self._u16_from(inp, 0, KEYS["fan_rpm_supply"])
+        data["fan_rpm_exhaust"]  = self._u16_from(inp, 0, KEYS["fan_rpm_exhaust"])
+        data["rtc_batt_voltage"] = self._u16_from(inp, 0, KEYS["rtc_batt_voltage"])
 
         # ALFA
-        bits = self._u16_from(
-            inp_alfa_bits, KEYS["alfa_connected_bits"], KEYS["alfa_connected_bits"]
-        )
+        bits = self._u16_from(inp, 0, KEYS["alfa_connected_bits"])
         data["alfa_connected_bits"] = bits
         data["alfa_count"] = bits.bit_count()
+        # Each ALFA occupies the first six registers of its 10-register slot
+        # (160..165, 170..175, ...); only connected slots are read.
+        if not self.alfa_every:
+            bits_polled = 0
+            alfa: dict[int, int] = {}
+        else:
+            bits_polled = bits & 0xFF
+            if (
+                self._alfa_regs is None
+                or self._alfa_regs[0] != bits_polled
+                or self.poll_count % self.alfa_every == 0
+            ):
+                regs = await self._timed_read_region("alfa", alfa_needed(bits_polled)) if bits_polled else {}
+                self._alfa_regs = (bits_polled, regs)
+            alfa = self._alfa_regs[1]
         for i in range(1, 9):
-            connected = bool(bits & (1 << (i - 1)))
+            connected = bool(bits_polled & (1 << (i - 1)))
             data[f"alfa_{i}_available"] = connected
             if not connected:
                 continue
             base = INP_START_ALFA + (i - 1) * 10
-            # Each ALFA occupies the first six registers of its 10-register slot
-            # (160..165, 170..175, ...). Reading beyond 6 registers may trigger
-            # ILLEGAL DATA ADDRESS errors, so limit the range.
-            block = await self._read_block(base, 6, input_regs=True)
-            data[f"alfa_mb_address_{i}"] = self._u16_from(block, base, base)
-            data[f"alfa_options_{i}"] = self._u16_from(block, base, base + 1)
-            data[f"alfa_co2_{i}"] = self._u16_from(block, base, base + 2)
-            data[f"alfa_temp_{i}"] = self._i16_from(block, base, base + 3) / 10.0
-            data[f"alfa_humi_{i}"] = self._u16_from(block, base, base + 4) / 10.0
-            data[f"alfa_ntc_temp_{i}"] = self._u16_from(block, base, base + 5) / 10.0
+            data[f"alfa_mb_address_{i}"] = self._u16_from(alfa, 0, base)
+            data[f"alfa_options_{i}"] = self._u16_from(alfa, 0, base + 1)
+            data[f"alfa_co2_{i}"] = self._u16_from(alfa, 0, base + 2)
+            data[f"alfa_temp_{i}"] = self._i16_from(alfa, 0, base + 3) / 10.0
+            data[f"alfa_humi_{i}"] = self._u16_from(alfa, 0, base + 4) / 10.0
+            data[f"alfa_ntc_temp_{i}"] = self._u16_from(alfa, 0, base + 5) / 10.0
 
         # Holding area
         for k in (
@@ -199,27 +502,25 @@ class FuturaCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
             "night_remaining_s","party_remaining_s","time_program_raw","antiradon_raw",
             "bypass_enable_raw","heating_enable_raw","cooling_enable_raw","comfort_enable_raw",
         ):
-            data[k] = self._u16_from(hold_main, 0, KEYS[k])
+            data[k] = self._u16_from(hold, 0, KEYS[k])
 
-        data["away_begin_ts"] = self._u32_from(hold_main, 0, KEYS["away_begin_ts"])
-        data["away_end_ts"]   = self._u32_from(hold_main, 0, KEYS["away_end_ts"])
+        data["away_begin_ts"] = self._u32_from(hold, 0, KEYS["away_begin_ts"])
+        data["away_end_ts"]   = self._u32_from(hold, 0, KEYS["away_end_ts"])
 
-        data["temp_set_raw"] = self._u16_from(hold_main, 0, KEYS["temp_set_raw"]) / 10.0
-        data["humi_set_raw"] = self._u16_from(hold_main, 0, KEYS["humi_set_raw"]) / 10.0
+        data["temp_set_raw"] = self._u16_from(hold, 0, KEYS["temp_set_raw"]) / 10.0
+        data["humi_set_raw"] = self._u16_from(hold, 0, KEYS["humi_set_raw"]) / 10.0
 
         # Derived helpers
         v = data.get("mode_raw", 0)
         data["mode_text"] = ["Vypnuto","1","2","3","4","5","Auto"][v] if v in (0,1,2,3,4,5,6) else "Neznámé"
 
-        for key in ("boost_remaining_s","circulation_remaining_s"):
-            s = int(data.get(key, 0) or 0)
-            data[key.replace("_s", "_min")] = (s + 59) // 60
-
-        def _hours_from_seconds(s: int) -> int:
-            return 0 if s == 0 else (s + 3599) // 3600
-
-        data["night_remaining_h"] = _hours_from_seconds(int(data.get("night_remaining_s", 0)))
-        data["party_remaining_h"] = _hours_from_seconds(int(data.get("party_remaining_s", 0)))
+        if hold_read:
+            derive_countdown_fields(data)
+            self.countdowns.observe(data, self.hass.loop.time())
+        else:
+            # The cached timers are as old as the last holding read – project them
+            data.update(self.countdowns.interpolate(self.hass.loop.time()))
+        data["device_clock_drift_ppm"] = self.countdowns.drift_ppm
 
         for which in ("away_begin_ts","away_end_ts"):
             ts = int(data.get(which, 0) or 0)
@@ -228,54 +529,205 @@ class FuturaCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
                 else ha_dt.as_local(ha_dt.utc_from_timestamp(ts)).strftime("%Y-%m-%d %H:%M")
             )
 
+        # Heat recovery / filter analytics over the buffered samples
+        now_ts = ha_dt.utcnow().timestamp()
+        data.update(self.analytics.update(data, now_ts))
+
+        # Demand controlled ventilation – decided right after the read
+        level = self.dcv.evaluate(data, self.hass.loop.time())
+        data["dcv_target_level"] = self.dcv.level
+        if level is not None:
+            self.hass.async_create_task(
+                self.async_write(0, level, priority=PRIORITY_BACKGROUND)
+            )
+
+        # Predictive bypass / heating enable from the buffered temperature trend
+        planned = self.thermal.evaluate(self.analytics.buffer, data, now_ts)
+        data["forecast_temp_outdoor"] = self.thermal.forecast["temp_outdoor"]
+        data["forecast_temp_extract"] = self.thermal.forecast["temp_extract"]
+        if planned:
+            # Queued together, the scheduler sends them in one batch
+            for address, value in planned.items():
+                self.hass.async_create_task(
+                    self.async_write(address, value, priority=PRIORITY_BACKGROUND)
+                )
+
+        self.poll_count += 1
+        self._schedule_countdown_tick()
+
+        self.phases.add("io", self._cycle_io)
+        self.phases.add("decode", time.perf_counter() - cycle_start - self._cycle_io)
         return data
 
     async def _write_u16(self, address: int, value: int) -> None:
-        client = await self._ensure_client()
-        try:
-            kwargs = {self._device_kwarg: self.unit}
-            rr = await client.write_register(address, value=value, **kwargs)
-        except ModbusException as e:
+        async with self._bus:
+            client = await self._ensure_client()
             try:
-                await client.close()
-            except Exception:
-                pass
-            self.client = None
-            raise UpdateFailed(f"Write failed @ {address}: {e}") from e
+                kwargs = {self._device_kwarg: self.unit}
+                rr = await client.write_register(address, value=value, **kwargs)
+            except ModbusException as e:
+                try:
+                    await client.close()
+                except Exception:
+                    pass
+                self.client = None
+                raise UpdateFailed(f"Write failed @ {address}: {e}") from e
         if rr.isError():
             raise UpdateFailed(f"Write failed @ {address}: {rr}")
 
     async def _write_u32(self, address: int, value: int) -> None:
         """Write two consecutive holding registers starting at 'address' (hi, lo)."""
-        client = await self._ensure_client()
         hi = (value >> 16) & 0xFFFF
         lo = value & 0xFFFF
-        try:
-            kwargs = {self._device_kwarg: self.unit}
-            rr = await client.write_registers(address, values=[hi, lo], **kwargs)
-        except ModbusException as e:
+        async with self._bus:
+            client = await self._ensure_client()
             try:
-                await client.close()
-            except Exception:
-                pass
-            self.client = None
-            raise UpdateFailed(f"Write failed @ {address} (u32): {e}") from e
+                kwargs = {self._device_kwarg: self.unit}
+                rr = await client.write_registers(address, values=[hi, lo], **kwargs)
+            except ModbusException as e:
+                try:
+                    await client.close()
+                except Exception:
+                    pass
+                self.client = None
+                raise UpdateFailed(f"Write failed @ {address} (u32): {e}") from e
         if rr.isError():
             raise UpdateFailed(f"Write failed @ {address} (u32): {rr}")
 
-    async def async_set_away(self, begin: dt.datetime | None, end: dt.datetime | None) -> None:
-        now_ts = int(dt.datetime.utcnow().timestamp())
-        b_ts = int(begin.timestamp()) if isinstance(begin, dt.datetime) else now_ts
-        if not isinstance(end, dt.datetime) or int(end.timestamp()) <= b_ts:
+    async def _write_block(self, address: int, values: list[int]) -> None:
+        if len(values) == 1:
+            await self._write_u16(address, values[0])
+        else:
+            async with self._bus:
+                client = await self._ensure_client()
+                try:
+                    kwargs = {self._device_kwarg: self.unit}
+                    rr = await client.write_registers(address, values=values, **kwargs)
+                except ModbusException as e:
+                    try:
+                        await client.close()
+                    except Exception:
+                        pass
+                    self.client = None
+                    raise UpdateFailed(f"Write failed @ {address}/{len(values)}: {e}") from e
+            if rr.isError():
+                raise UpdateFailed(f"Write failed @ {address}/{len(values)}: {rr}")
+        if self._hold_cache is not None:
+            idx = address - HOLD_START_MAIN
+            if 0 <= idx and idx + len(values) <= len(self._hold_cache):
+                self._hold_cache[idx:idx + len(values)] = values
+        if self._hold_regs is not None:
+            self._hold_regs.update(zip(range(address, address + len(values)), values))
+            # The next poll reads the holding tier, so timers restart from the device
+            self._hold_written = True
+
+    def holding_matches(self, address: int, values: tuple[int, ...]) -> bool:
+        """True when the cached holding registers already contain 'values'.
+
+        Only a cache read by the latest poll counts; with a slower holding tier
+        the value may have been changed on the panel since, so write it anyway.
+        """
+        if self._hold_cache is None or not self._hold_fresh:
+            return False
+        idx = address - HOLD_START_MAIN
+        if idx < 0 or idx + len(values) > len(self._hold_cache):
+            return False
+        return tuple(self._hold_cache[idx:idx + len(values)]) == tuple(values)
+
+    async def async_write(
+        self,
+        address: int,
+        value: int | list[int],
+        *,
+        context: Context | None = None,
+        priority: int | None = None,
+    ) -> None:
+        """Queue a holding register write through the rate-limited scheduler."""
+        values = value if isinstance(value, list) else [value]
+        if priority is None:
+            priority = priority_from_context(context)
+        await self.writer.async_submit(address, values, priority)
+
+    async def async_dump_registers(
+        self,
+        path: str,
+        ranges: list[tuple[str, int, int]],
+        *,
+        binary: bool = False,
+    ) -> None:
+        """Stream the raw register space to a file (see dump.py)."""
+        spans = await async_dump_registers(self, path, ranges, binary=binary)
+        self.register_map.update(spans)
+        self.planner.learn_from_map(self.register_map)
+
+    async def async_start_capture(self, path: str, duration: float) -> None:
+        """Record all Modbus traffic of this unit to 'path' for 'duration' seconds (see capture.py)."""
+        if self._capture is not None:
+            raise HomeAssistantError(f"A capture of {self.host} is already running ({self._capture.path})")
+        capture = TrafficCapture(
+            self.hass,
+            path,
+            {
+                "host": self.host,
+                "unit": self.unit,
+                "variant": (self.data or {}).get("variant_raw"),
+                "started": ha_dt.utcnow().isoformat(),
+                # What the replay needs to issue the same requests
+                "options": self.polling_options(),
+                "spans": {name: {str(a): n for a, n in spans.items()} for name, spans in self.planner.spans.items()},
+                "poll_count": self.poll_count,
+            },
+        )
+        await capture.async_open()
+        async with self._bus:
+            self._capture = capture
+            if self.client is not None:
+                self.client = CapturingClient(self.client, capture)
+
+        @callback
+        def _stop(_now: dt.datetime) -> None:
+            self._capture_unsub = None
+            self.hass.async_create_task(self.async_stop_capture())
+
+        self._capture_unsub = async_call_later(self.hass, duration, _stop)
+        _LOGGER.info("Capturing Modbus traffic of %s to %s for %s s", self.host, path, duration)
+
+    async def async_stop_capture(self) -> None:
+        if self._capture_unsub is not None:
+            self._capture_unsub()
+            self._capture_unsub = None
+        if self._capture is None:
+            return
+        async with self._bus:
+            capture, self._capture = self._capture, None
+            if isinstance(self.client, CapturingClient):
+                self.client = self.client.wrapped
+        await capture.async_close()
+
+    async def async_set_away(
+        self,
+        begin: dt.datetime | None,
+        end: dt.datetime | None,
+        context: Context | None = None,
+    ) -> None:
+        def _utc_ts(value: dt.datetime) -> int:
+            # The datetime selector sends naive local time
+            if value.tzinfo is None:
+                value = ha_dt.as_utc(value.replace(tzinfo=ha_dt.DEFAULT_TIME_ZONE))
+            return int(value.timestamp())
+
+        now_ts = int(ha_dt.utcnow().timestamp())
+        b_ts = _utc_ts(begin) if isinstance(begin, dt.datetime) else now_ts
+        if not isinstance(end, dt.datetime) or _utc_ts(end) <= b_ts:
             e_ts = b_ts + 7*24*3600
         else:
-            e_ts = int(end.timestamp())
+            e_ts = _utc_ts(end)
 
-        await self._write_u32(6, b_ts)
-        await self._write_u32(8, e_ts)
-        await self.async_request_refresh()
+        await self.async_write(
+            6,
+            [(b_ts >> 16) & 0xFFFF, b_ts & 0xFFFF, (e_ts >> 16) & 0xFFFF, e_ts & 0xFFFF],
+            context=context,
+        )
 
-    async def async_clear_away(self) -> None:
-        await self._write_u32(6, 0)
-        await self._write_u32(8, 0)
-        await self.async_request_refresh()
+    async def async_clear_away(self, context: Context | None = None) -> None:
+        await self.async_write(6, [0, 0, 0, 0], context=context)
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import logging
+from typing import Any, Mapping
+
+from .const import (
+    CONF_DCV_AGGREGATE,
+    CONF_DCV_CO2_CURVE,
+    CONF_DCV_CO2_HYSTERESIS,
+    CONF_DCV_DWELL_DOWN,
+    CONF_DCV_DWELL_UP,
+    CONF_DCV_ENABLED,
+    CONF_DCV_HUMI_CURVE,
+    CONF_DCV_HUMI_HYSTERESIS,
+    CONF_DCV_MIN_LEVEL,
+    DEFAULT_DCV_AGGREGATE,
+    DEFAULT_DCV_CO2_CURVE,
+    DEFAULT_DCV_CO2_HYSTERESIS,
+    DEFAULT_DCV_DWELL_DOWN,
+    DEFAULT_DCV_DWELL_UP,
+    DEFAULT_DCV_ENABLED,
+    DEFAULT_DCV_HUMI_CURVE,
+    DEFAULT_DCV_HUMI_HYSTERESIS,
+    DEFAULT_DCV_MIN_LEVEL,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Levels the loop may drive; 0 (Vypnuto) and 6 (Auto) are left to the user.
+MIN_LEVEL = 1
+MAX_LEVEL = 5
+
+
+def parse_curve(text: str) -> list[tuple[float, int]]:
+    """Parse "800:2,1000:3" into [(800.0, 2), (1000.0, 3)] sorted by threshold."""
+    points: list[tuple[float, int]] = []
+    for part in (text or "").split(","):
+        part = part.strip()
+        if not part:
+            continue
+        threshold, level = part.split(":", 1)
+        lvl = int(level)
+        if not MIN_LEVEL <= lvl <= MAX_LEVEL:
+            raise ValueError(f"level {lvl} out of range {MIN_LEVEL}..{MAX_LEVEL}")
+        points.append((float(threshold), lvl))
+    points.sort()
+    return points
+
+
+def _curve_level(value: float, curve: list[tuple[float, int]]) -> int:
+    level = 0
+    for threshold, lvl in curve:
+        if value >= threshold:
+            level = max(level, lvl)
+    return level
+
+
+def _level_with_hysteresis(
+    value: float, curve: list[tuple[float, int]], hysteresis: float, current: int
+) -> int:
+    """Raise immediately, lower only once the value fell 'hysteresis' below the step."""
+    raised = _curve_level(value, curve)
+    if raised >= current:
+        return raised
+    return max(raised, min(current, _curve_level(value + hysteresis, curve)))
+
+
+class DemandControl:
+    """CO₂/humidity driven ventilation level computed from ALFA readings."""
+
+    def __init__(self, options: Mapping[str, Any]) -> None:
+        self.enabled = bool(options.get(CONF_DCV_ENABLED, DEFAULT_DCV_ENABLED))
+        self.aggregate = options.get(CONF_DCV_AGGREGATE, DEFAULT_DCV_AGGREGATE)
+        self.co2_curve = parse_curve(options.get(CONF_DCV_CO2_CURVE, DEFAULT_DCV_CO2_CURVE))
+        self.humi_curve = parse_curve(options.get(CONF_DCV_HUMI_CURVE, DEFAULT_DCV_HUMI_CURVE))
+        self.co2_hysteresis = float(options.get(CONF_DCV_CO2_HYSTERESIS, DEFAULT_DCV_CO2_HYSTERESIS))
+        self.humi_hysteresis = float(options.get(CONF_DCV_HUMI_HYSTERESIS, DEFAULT_DCV_HUMI_HYSTERESIS))
+        self.min_level = int(options.get(CONF_DCV_MIN_LEVEL, DEFAULT_DCV_MIN_LEVEL))
+        self.dwell_up = float(options.get(CONF_DCV_DWELL_UP, DEFAULT_DCV_DWELL_UP))
+        self.dwell_down = float(options.get(CONF_DCV_DWELL_DOWN, DEFAULT_DCV_DWELL_DOWN))
+
+        self._level: int | None = None
+        self._target: int | None = None   # last level the loop decided on
+        self._changed_at: float | None = None
+
+    def _combine(self, values: list[float]) -> float | None:
+        if not values:
+            return None
+        if self.aggregate == "avg":
+            return sum(values) / len(values)
+        return max(values)
+
+    def evaluate(self, data: Mapping[str, Any], now: float) -> int | None:
+        """Return the level to write, or None when nothing should be written.
+
+        The loop only runs while the unit is in a manual level (1..5), so
+        Vypnuto/Auto chosen by the user are respected. A level is written only
+        when the computed target changes, so a level picked by hand stays
+        until the readings call for a different one.
+        """
+        if not self.enabled:
+            return None
+        mode = int(data.get("mode_raw", 0) or 0)
+        if not MIN_LEVEL <= mode <= MAX_LEVEL:
+            self._level = None
+            self._target = None
+            return None
+
+        co2: list[float] = []
+        humi: list[float] = []
+        for i in range(1, 9):
+            if not data.get(f"alfa_{i}_available"):
+                continue
+            co2.append(float(data.get(f"alfa_co2_{i}", 0) or 0))
+            humi.append(float(data.get(f"alfa_humi_{i}", 0) or 0))
+        co2_value = self._combine(co2)
+        humi_value = self._combine(humi)
+        if co2_value is None:
+            self._level = None
+            self._target = None
+            return None
+
+        current = self._target if self._target is not None else mode
+        target = max(
+            self.min_level,
+            _level_with_hysteresis(co2_value, self.co2_curve, self.co2_hysteresis, current),
+            _level_with_hysteresis(humi_value, self.humi_curve, self.humi_hysteresis, current),
+        )
+        target = max(MIN_LEVEL, min(MAX_LEVEL, target))
+
+        self._level = target
+        if self._target is None:
+            # First evaluation (start, options change, back from Auto): adopt the
+            # computed level without writing, so the current mode stays until
+            # the readings call for a different level
+            self._target = target
+            return None
+        if target == current:
+            return None
+        if self._changed_at is not None:
+            dwell = self.dwell_up if target > current else self.dwell_down
+            if now - self._changed_at < dwell:
+                return None
+
+        self._target = target
+        if target == mode:
+            return None
+        _LOGGER.debug(
+            "DCV level %s -> %s (CO2 %.0f ppm, RH %.1f %%)", mode, target, co2_value, humi_value
+        )
+        self._changed_at = now
+        return target
+
+    @property
+    def level(self) -> int | None:
+        return self._level
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import struct
+from typing import TYPE_CHECKING, BinaryIO, Iterable
+
+from homeassistant.exceptions import HomeAssistantError
+
+if TYPE_CHECKING:
+    from .coordinator import FuturaCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+ILLEGAL_DATA_ADDRESS = 0x02
+
+DUMP_MAX_CHUNK = 64          # largest request the scan starts with
+DUMP_CHUNK_PAUSE = 0.05      # s between requests, lets regular polling in
+
+# Binary format: header, then records until EOF
+#   header  b"FUTDUMP1" + u16 unit id
+#   record  u8 table (0 = input, 1 = holding), u8 kind (0 = data, 1 = hole),
+#           u16 start, u16 count, data records followed by count x u16
+BINARY_MAGIC = b"FUTDUMP1"
+TABLES = {"input": 0, "holding": 1}
+
+
+def parse_ranges(text: str) -> list[tuple[str, int, int]]:
+    """Parse "input:0-199,holding:0-63" into [("input", 0, 199), ("holding", 0, 63)]."""
+    ranges: list[tuple[str, int, int]] = []
+    for part in (text or "").split(","):
+        part = part.strip()
+        if not part:
+            continue
+        table, span = part.split(":", 1)
+        table = table.strip().lower()
+        if table not in TABLES:
+            raise ValueError(f"unknown register table '{table}'")
+        first, _, last = span.partition("-")
+        start = int(first)
+        end = int(last) if last else start
+        if not 0 <= start <= end <= 0xFFFF:
+            raise ValueError(f"invalid range {span}")
+        ranges.append((table, start, end))
+    return ranges
+
+
+class _CsvSink:
+    def header(self, unit: int) -> bytes:
+        return b"table,address,value\n"
+
+    def data(self, table: str, start: int, values: list[int]) -> bytes:
+        return "".join(f"{table},{start + i},{v}\n" for i, v in enumerate(values)).encode()
+
+    def hole(self, table: str, start: int, count: int) -> bytes:
+        return "".join(f"{table},{a},\n" for a in range(start, start + count)).encode()
+
+
+class _BinarySink:
+    def header(self, unit: int) -> bytes:
+        return BINARY_MAGIC + struct.pack(">H", unit)
+
+    def data(self, table: str, start: int, values: list[int]) -> bytes:
+        return struct.pack(f">BBHH{len(values)}H", TABLES[table], 0, start, len(values), *values)
+
+    def hole(self, table: str, start: int, count: int) -> bytes:
+        return struct.pack(">BBHH", TABLES[table], 1, start, count)
+
+
+async def async_dump_registers(
+    coordinator: FuturaCoordinator,
+    path: str,
+    ranges: Iterable[tuple[str, int, int]],
+    *,
+    binary: bool = False,
+    max_chunk: int = DUMP_MAX_CHUNK,
+) -> dict[str, dict[str, list[tuple[int, int]]]]:
+    """Scan register ranges and stream them to 'path'.
+
+    The chunk size halves on ILLEGAL DATA ADDRESS until single registers are
+    probed, so holes in the map end up as explicit hole records, and grows back
+    after a successful read. Returns per table the merged 'legal' and 'holes'
+    spans (first, last) – they only say which addresses are readable, not that
+    a span can be read in one request – and the 'reads' that actually
+    succeeded as single requests (start, count). The coordinator keeps them
+    in 'register_map' for later read planning.
+    """
+    hass = coordinator.hass
+    sink = _BinarySink() if binary else _CsvSink()
+    spans: dict[str, dict[str, list[tuple[int, int]]]] = {
+        t: {"legal": [], "holes": [], "reads": []} for t in TABLES
+    }
+
+    def _add(kind: list[tuple[int, int]], start: int, count: int) -> None:
+        if kind and kind[-1][1] + 1 == start:
+            kind[-1] = (kind[-1][0], start + count - 1)
+        else:
+            kind.append((start, start + count - 1))
+
+    fh: BinaryIO = await hass.async_add_executor_job(open, path, "wb")
+    try:
+        await hass.async_add_executor_job(fh.write, sink.header(coordinator.unit))
+        for table, start, end in ranges:
+            addr = start
+            chunk = max_chunk
+            while addr <= end:
+                count = min(chunk, end - addr + 1)
+                rr = await coordinator._read_raw(addr, count, input_regs=(table == "input"))
+                if not rr.isError():
+                    values = list(rr.registers)[:count]
+                    out = sink.data(table, addr, values)
+                    _add(spans[table]["legal"], addr, count)
+                    spans[table]["reads"].append((addr, count))
+                    addr += count
+                    chunk = min(max_chunk, chunk * 2)
+                elif getattr(rr, "exception_code", None) == ILLEGAL_DATA_ADDRESS:
+                    if count > 1:
+                        chunk = max(1, count // 2)
+                        await asyncio.sleep(DUMP_CHUNK_PAUSE)
+                        continue
+                    out = sink.hole(table, addr, 1)
+                    _add(spans[table]["holes"], addr, 1)
+                    addr += 1
+                else:
+                    raise HomeAssistantError(f"Modbus error @ {addr}/{count}: {rr}")
+                await hass.async_add_executor_job(fh.write, out)
+                await asyncio.sleep(DUMP_CHUNK_PAUSE)
+    finally:
+        await hass.async_add_executor_job(fh.close)
+
+    _LOGGER.info(
+        "Register dump of %s written to %s (%s)",
+        coordinator.host,
+        path,
+        {t: s["holes"] for t, s in spans.items() if s["holes"]},
+    )
+    return spans
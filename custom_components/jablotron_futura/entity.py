@@ -1,11 +1,45 @@
 from __future__ import annotations
 
+from typing import Callable
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import callback
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
 from .coordinator import FuturaCoordinator
 
 
+@callback
+def async_add_entities_when_available(
+    coordinator: FuturaCoordinator,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+    groups: dict[str, Callable[[], list[Entity]]],
+) -> None:
+    """Create each entity group only once its availability flag in data is true.
+
+    Features the unit does not have (unconnected ALFA slots, missing bypass,
+    ...) then cost nothing per unit until they show up.
+    """
+    pending = dict(groups)
+
+    @callback
+    def _async_check() -> None:
+        data = coordinator.data or {}
+        ready = [key for key in pending if data.get(key)]
+        entities: list[Entity] = []
+        for key in ready:
+            entities.extend(pending.pop(key)())
+        if entities:
+            async_add_entities(entities)
+
+    _async_check()
+    if pending:
+        entry.async_on_unload(coordinator.async_add_listener(_async_check))
+
+
 class FuturaEntity(CoordinatorEntity[FuturaCoordinator]):
     _attr_has_entity_name = True
 
@@ -13,9 +47,4 @@ class FuturaEntity(CoordinatorEntity[FuturaCoordinator]):
         super().__init__(coordinator)
         self._attr_name = name
         self._attr_unique_id = f"{coordinator.host}-{unique_suffix}"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, coordinator.host)},
-            "manufacturer": "Jablotron",
-            "model": "Futura",
-            "name": "Jablotron Futura",
-        }
+        self._attr_device_info = coordinator.device_info
@@ -19,8 +19,7 @@ class FuturaTempSetNumber(FuturaEntity, NumberEntity):
         return float(self.coordinator.data.get("temp_set_raw", 22.0))
 
     async def async_set_native_value(self, value: float) -> None:
-        await self.coordinator._write_u16(10, int(round(value * 10)))
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_write(10, int(round(value * 10)), context=self._context)
 
 
 class FuturaBoostMinutes(FuturaEntity, NumberEntity):
@@ -38,8 +37,7 @@ class FuturaBoostMinutes(FuturaEntity, NumberEntity):
     async def async_set_native_value(self, value: float) -> None:
         minutes = int((value // 15) * 15)
         secs = minutes * 60
-        await self.coordinator._write_u16(1, secs)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_write(1, secs, context=self._context)
 
 
 class FuturaCirculationMinutes(FuturaEntity, NumberEntity):
@@ -57,8 +55,7 @@ class FuturaCirculationMinutes(FuturaEntity, NumberEntity):
 
     async def async_set_native_value(self, value: float) -> None:
         secs = int(value) * 60
-        await self.coordinator._write_u16(2, secs)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_write(2, secs, context=self._context)
 
 
 class FuturaNightHours(FuturaEntity, NumberEntity):
@@ -77,8 +74,7 @@ class FuturaNightHours(FuturaEntity, NumberEntity):
     async def async_set_native_value(self, value: float) -> None:
         v = max(0, min(10, int(value)))
         secs = v * 3600
-        await self.coordinator._write_u16(4, secs)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_write(4, secs, context=self._context)
 
 
 class FuturaPartyHours(FuturaEntity, NumberEntity):
@@ -97,8 +93,7 @@ class FuturaPartyHours(FuturaEntity, NumberEntity):
     async def async_set_native_value(self, value: float) -> None:
         v = max(0, min(8, int(value)))
         secs = v * 3600
-        await self.coordinator._write_u16(5, secs)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_write(5, secs, context=self._context)
 
 
 async def async_setup_entry(hass, entry, async_add_entities):
@@ -109,4 +104,4 @@ async def async_setup_entry(hass, entry, async_add_entities):
         FuturaCirculationMinutes(coord),
         FuturaNightHours(coord),
         FuturaPartyHours(coord),
-    ], True)
+    ])
@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Iterable
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    ALFA_SLOT_LEN,
+    DEFAULT_ALFA_BLOCKS,
+    DEFAULT_HOLDING_MAIN_BLOCKS,
+    DEFAULT_INPUT_MAIN_BLOCKS,
+    DOMAIN,
+    HOLDING_MAIN_NEEDED,
+    INPUT_MAIN_NEEDED,
+    MAX_READ_COUNT,
+)
+from .dump import ILLEGAL_DATA_ADDRESS
+
+if TYPE_CHECKING:
+    from .coordinator import FuturaCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_KEY = f"{DOMAIN}.read_spans"
+STORAGE_VERSION = 1
+# hass.data key of the SpanCache shared by all units
+SPAN_CACHE = f"{DOMAIN}_read_spans"
+
+
+@dataclass(frozen=True)
+class Region:
+    name: str
+    input_regs: bool
+    needed: tuple[int, ...]
+    default_blocks: tuple[tuple[int, int], ...]
+
+    @property
+    def end(self) -> int:
+        return max(s + n - 1 for s, n in self.default_blocks)
+
+
+REGIONS = {
+    r.name: r
+    for r in (
+        Region("input_main", True, tuple(INPUT_MAIN_NEEDED), tuple(DEFAULT_INPUT_MAIN_BLOCKS)),
+        Region("holding_main", False, tuple(HOLDING_MAIN_NEEDED), tuple(DEFAULT_HOLDING_MAIN_BLOCKS)),
+        Region(
+            "alfa",
+            True,
+            tuple(a for s, n in DEFAULT_ALFA_BLOCKS for a in range(s, s + n)),
+            tuple(DEFAULT_ALFA_BLOCKS),
+        ),
+    )
+}
+
+
+def alfa_needed(bits: int) -> list[int]:
+    """Addresses of the connected ALFA slots."""
+    return [
+        a
+        for i, (start, _) in enumerate(DEFAULT_ALFA_BLOCKS)
+        if bits & (1 << i)
+        for a in range(start, start + ALFA_SLOT_LEN)
+    ]
+
+
+class SpanCache:
+    """Learned spans of all unit variants, one store shared by every unit.
+
+    The stored data is loaded once and every change is saved under a lock,
+    so units starting (or failing) at the same time do not overwrite each
+    other's variants. The per-variant lock also lets a second unit of the
+    same variant wait for the first probe instead of probing again.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._store: Store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._data: dict[str, dict[str, dict[str, int]]] | None = None
+        self._lock = asyncio.Lock()
+        self.variant_locks: defaultdict[int, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+    @classmethod
+    def get(cls, hass: HomeAssistant) -> SpanCache:
+        if SPAN_CACHE not in hass.data:
+            hass.data[SPAN_CACHE] = cls(hass)
+        return hass.data[SPAN_CACHE]
+
+    async def _async_data(self) -> dict[str, dict[str, dict[str, int]]]:
+        if self._data is None:
+            self._data = await self._store.async_load() or {}
+        return self._data
+
+    async def async_get(self, variant: int) -> dict[str, dict[int, int]] | None:
+        async with self._lock:
+            cached = (await self._async_data()).get(str(variant))
+        if not cached:
+            return None
+        return {name: {int(a): int(n) for a, n in spans.items()} for name, spans in cached.items()}
+
+    async def async_set(self, variant: int, spans: dict[str, dict[int, int]]) -> None:
+        async with self._lock:
+            data = await self._async_data()
+            data[str(variant)] = {name: {str(a): n for a, n in s.items()} for name, s in spans.items()}
+            await self._store.async_save(data)
+
+    async def async_drop(self, variant: int, region_name: str, start: int) -> None:
+        async with self._lock:
+            data = await self._async_data()
+            cached = data.get(str(variant), {}).get(region_name)
+            if cached is not None and cached.pop(str(start), None) is not None:
+                await self._store.async_save(data)
+
+
+class ReadPlanner:
+    """Turns the addresses a cycle needs into as few read requests as possible.
+
+    'spans' holds, per region and start address, the largest count a single
+    request may use. It is learned once per unit variant by binary searching
+    the legal span at every start the greedy plan visits (see async_probe) and
+    cached in HA storage. Without a learned span the hand-tuned default blocks
+    are used; a learned span that fails at runtime is dropped on its own.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._cache = SpanCache.get(hass)
+        self._variant: int | None = None
+        self.spans: dict[str, dict[int, int]] = {}
+
+    @property
+    def learned(self) -> bool:
+        return bool(self.spans)
+
+    def plan(self, region_name: str, needed: Iterable[int]) -> list[tuple[int, int]]:
+        region = REGIONS[region_name]
+        needed = sorted(set(needed))
+        spans = self.spans.get(region_name, {})
+        blocks: list[tuple[int, int]] = []
+        i = 0
+        while i < len(needed):
+            start = needed[i]
+            count = spans.get(start)
+            if not count:
+                count = next(
+                    (s + n - start for s, n in region.default_blocks if s <= start < s + n), 1
+                )
+            end = start + count - 1
+            j = i
+            while j + 1 < len(needed) and needed[j + 1] <= end:
+                j += 1
+            blocks.append((start, needed[j] - start + 1))
+            i = j + 1
+        return blocks
+
+    def learn_from_map(self, register_map: dict[str, dict[str, list[tuple[int, int]]]]) -> None:
+        """Derive spans from the reads of a register dump that succeeded as one request."""
+        for region in REGIONS.values():
+            reads = register_map.get("input" if region.input_regs else "holding", {}).get("reads", [])
+            spans = self.spans.setdefault(region.name, {})
+            for start, count in reads:
+                for addr in region.needed:
+                    if start <= addr < start + count:
+                        span = min(MAX_READ_COUNT, start + count - addr, region.end - addr + 1)
+                        spans[addr] = max(spans.get(addr, 0), span)
+
+    def has_span(self, region_name: str, start: int) -> bool:
+        return start in self.spans.get(region_name, {})
+
+    async def _async_legal(
+        self, coordinator: FuturaCoordinator, start: int, count: int, input_regs: bool
+    ) -> bool:
+        rr = await coordinator._read_raw(start, count, input_regs=input_regs)
+        if not rr.isError():
+            return True
+        if getattr(rr, "exception_code", None) == ILLEGAL_DATA_ADDRESS:
+            return False
+        raise RuntimeError(f"Modbus error @ {start}/{count}: {rr}")
+
+    async def _async_max_span(
+        self, coordinator: FuturaCoordinator, region: Region, start: int
+    ) -> int:
+        lo, hi = 0, min(MAX_READ_COUNT, region.end - start + 1)
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if await self._async_legal(coordinator, start, mid, region.input_regs):
+                lo = mid
+            else:
+                hi = mid - 1
+        return lo
+
+    async def async_probe(self, coordinator: FuturaCoordinator) -> dict[str, dict[int, int]]:
+        spans: dict[str, dict[int, int]] = {}
+        for region in REGIONS.values():
+            found = spans.setdefault(region.name, {})
+            # Every slot start for ALFA, the connection set decides later which are needed
+            starts = [s for s, _ in region.default_blocks] if region.name == "alfa" else []
+            needed = sorted(region.needed)
+            i = 0
+            while i < len(needed):
+                start = needed[i]
+                if start not in found:
+                    found[start] = await self._async_max_span(coordinator, region, start)
+                end = start + max(found[start], 1) - 1
+                while i < len(needed) and needed[i] <= end:
+                    i += 1
+            for start in starts:
+                if start not in found:
+                    found[start] = await self._async_max_span(coordinator, region, start)
+        return spans
+
+    async def async_setup(self, coordinator: FuturaCoordinator, variant: int) -> None:
+        """Load spans for 'variant' from storage, probing the unit when unknown."""
+        self._variant = variant
+        async with self._cache.variant_locks[variant]:
+            cached = await self._cache.async_get(variant)
+            if cached:
+                self.spans = cached
+                return
+
+            try:
+                spans = await self.async_probe(coordinator)
+            except Exception as err:  # noqa: BLE001
+                _LOGGER.warning("Read span probe of %s failed, keeping default blocks: %s", coordinator.host, err)
+                return
+            self.spans = spans
+            await self._cache.async_set(variant, spans)
+        _LOGGER.debug("Learned read spans for variant %s: %s", variant, spans)
+
+    async def async_forget(self, region_name: str, start: int) -> None:
+        """Drop the learned span that failed, the default block covers its start again."""
+        spans = self.spans.get(region_name, {})
+        if spans.pop(start, None) is None or self._variant is None:
+            return
+        await self._cache.async_drop(self._variant, region_name, start)
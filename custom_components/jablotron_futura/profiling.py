@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import asyncio
+import cProfile
+import io
+import logging
+import pstats
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Iterable
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .coordinator import FuturaCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# Phases of one coordinator cycle
+#   io      waiting for Modbus responses (incl. the bus gate)
+#   decode  the rest of _async_update_data: parsing, derived values, analytics, DCV
+#   fanout  async_update_listeners: entity properties, state writes, statistics, publisher
+PHASES = ("io", "decode", "fanout")
+PACKAGE_FILTER = "jablotron_futura"
+TRACEMALLOC_FRAMES = 10
+
+
+@dataclass
+class _Phase:
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+
+class PhaseTimings:
+    """Cheap always-on accumulator of per-phase wall time (perf_counter)."""
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self._phases = {name: _Phase() for name in PHASES}
+
+    def add(self, phase: str, seconds: float) -> None:
+        p = self._phases[phase]
+        p.count += 1
+        p.total += seconds
+        if seconds > p.max:
+            p.max = seconds
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        return {
+            name: {
+                "count": p.count,
+                "total_ms": round(p.total * 1000, 3),
+                "mean_ms": round(p.total * 1000 / p.count, 3) if p.count else 0.0,
+                "max_ms": round(p.max * 1000, 3),
+            }
+            for name, p in self._phases.items()
+        }
+
+    def format(self) -> str:
+        lines = [f"{'phase':<8} {'count':>7} {'total ms':>11} {'mean ms':>9} {'max ms':>9}"]
+        for name, p in self.summary().items():
+            lines.append(
+                f"{name:<8} {p['count']:>7} {p['total_ms']:>11.3f} {p['mean_ms']:>9.3f} {p['max_ms']:>9.3f}"
+            )
+        return "\n".join(lines)
+
+
+def format_cprofile(profiler: cProfile.Profile, limit: int = 40, restrict: str | None = PACKAGE_FILTER) -> str:
+    out = io.StringIO()
+    stats = pstats.Stats(profiler, stream=out).sort_stats(pstats.SortKey.CUMULATIVE)
+    if restrict:
+        stats.print_stats(restrict, limit)
+    else:
+        stats.print_stats(limit)
+    return out.getvalue()
+
+
+def format_tracemalloc(snapshot: tracemalloc.Snapshot, limit: int = 25, restrict: str | None = PACKAGE_FILTER) -> str:
+    if restrict:
+        snapshot = snapshot.filter_traces([tracemalloc.Filter(True, f"*{restrict}*")])
+    stats = snapshot.statistics("lineno")
+    total = sum(s.size for s in stats)
+    lines = [f"Total traced: {total / 1024:.1f} KiB in {len(stats)} lines"]
+    for stat in stats[:limit]:
+        frame = stat.traceback[0]
+        lines.append(f"{stat.size / 1024:>9.1f} KiB {stat.count:>7}  {frame.filename}:{frame.lineno}")
+    return "\n".join(lines)
+
+
+async def async_profile(
+    hass: HomeAssistant,
+    coordinators: Iterable[FuturaCoordinator],
+    duration: float,
+    path: str,
+    *,
+    memory: bool = True,
+) -> None:
+    """Profile the event loop thread for 'duration' seconds and write a report.
+
+    '<path>.txt' gets the per-phase timings of every unit, the cProfile
+    functions of this integration and (with 'memory') the top tracemalloc
+    allocators; '<path>.prof' the full cProfile stats (snakeviz, pstats).
+    """
+    coordinators = list(coordinators)
+    for coordinator in coordinators:
+        coordinator.phases.reset()
+    started_tracing = memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start(TRACEMALLOC_FRAMES)
+    profiler = cProfile.Profile()
+    start = time.perf_counter()
+    profiler.enable()
+    try:
+        await asyncio.sleep(duration)
+    finally:
+        profiler.disable()
+        snapshot = tracemalloc.take_snapshot() if memory else None
+        if started_tracing:
+            tracemalloc.stop()
+    elapsed = time.perf_counter() - start
+
+    parts = [f"Jablotron Futura profile, {elapsed:.1f} s"]
+    for coordinator in coordinators:
+        parts.append(f"\n== Phases {coordinator.host} ({coordinator.poll_count} polls total)\n{coordinator.phases.format()}")
+
+    def _write() -> None:
+        # Sorting the stats and filtering the snapshot take a while – not on the loop
+        parts.append(f"\n== cProfile (cumulative, {PACKAGE_FILTER} only)\n{format_cprofile(profiler)}")
+        if snapshot is not None:
+            parts.append(f"\n== tracemalloc top allocators\n{format_tracemalloc(snapshot)}")
+        profiler.dump_stats(f"{path}.prof")
+        with open(f"{path}.txt", "w", encoding="utf-8") as fh:
+            fh.write("\n".join(parts) + "\n")
+
+    await hass.async_add_executor_job(_write)
+    _LOGGER.info("Profile written to %s.txt / %s.prof", path, path)
@@ -0,0 +1,380 @@
+from __future__ import annotations
+
+import asyncio
+import datetime as dt
+import json
+import logging
+import struct
+import time
+from typing import TYPE_CHECKING, Any, Mapping
+from urllib.parse import unquote, urlsplit
+
+from homeassistant.core import callback
+from homeassistant.util import slugify
+
+from .const import (
+    CONF_PUBLISH_FORMAT,
+    CONF_PUBLISH_FULL_EVERY,
+    CONF_PUBLISH_URL,
+    DEFAULT_PUBLISH_FORMAT,
+    DEFAULT_PUBLISH_FULL_EVERY,
+    DOMAIN,
+)
+
+if TYPE_CHECKING:
+    from .coordinator import FuturaCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+PUBLISH_SCHEMES = ("mqtt", "ws", "wss")
+PUBLISH_QUEUE_SIZE = 32        # messages waiting for the transport
+PUBLISH_SEND_TIMEOUT = 10.0    # s, a slower send counts as a dead connection
+PUBLISH_RECONNECT_MAX = 60.0   # s, upper bound of the reconnect backoff
+MQTT_KEEPALIVE = 60            # s
+
+# Binary message: header, then 'count' fields
+#   header  b"FUT1" + u8 flags (bit 0 = full snapshot) + u32 seq + f64 epoch s + u16 count
+#   field   u8 key length + key (utf-8) + type + value
+#           b"n" None, b"?" u8, b"q" i64, b"d" f64, b"s" u16 length + utf-8
+BINARY_MAGIC = b"FUT1"
+_HEADER = struct.Struct(">4sBIdH")
+
+_MISSING = object()
+
+
+def redact_url(url: str) -> str:
+    """scheme://host[:port] of 'url' – credentials, topic and query stay out of logs."""
+    parts = urlsplit(url)
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    host = parts.hostname or ""
+    if ":" in host:
+        host = f"[{host}]"
+    return f"{parts.scheme}://{host}" + (f":{port}" if port else "")
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, (dt.datetime, dt.date)):
+        return value.isoformat()
+    return value
+
+
+def encode_json(seq: int, ts: float, full: bool, fields: Mapping[str, Any], host: str) -> bytes:
+    return json.dumps(
+        {"host": host, "seq": seq, "ts": round(ts, 3), "full": full, "data": fields},
+        separators=(",", ":"),
+    ).encode()
+
+
+def encode_binary(seq: int, ts: float, full: bool, fields: Mapping[str, Any], host: str) -> bytes:
+    parts = [_HEADER.pack(BINARY_MAGIC, int(full), seq & 0xFFFFFFFF, ts, len(fields))]
+    for key, value in fields.items():
+        name = key.encode()
+        parts.append(struct.pack(">B", len(name)) + name)
+        if value is None:
+            parts.append(b"n")
+        elif isinstance(value, bool):
+            parts.append(b"?" + struct.pack(">B", value))
+        elif isinstance(value, int):
+            parts.append(b"q" + struct.pack(">q", value))
+        elif isinstance(value, float):
+            parts.append(b"d" + struct.pack(">d", value))
+        else:
+            text = str(value).encode()
+            parts.append(b"s" + struct.pack(">H", len(text)) + text)
+    return b"".join(parts)
+
+
+def decode_binary(payload: bytes) -> dict[str, Any]:
+    """Inverse of encode_binary, for consumers and the test stand-in."""
+    magic, flags, seq, ts, count = _HEADER.unpack_from(payload)
+    if magic != BINARY_MAGIC:
+        raise ValueError("not a Futura binary message")
+    pos = _HEADER.size
+    fields: dict[str, Any] = {}
+    for _ in range(count):
+        size = payload[pos]
+        key = payload[pos + 1:pos + 1 + size].decode()
+        pos += 1 + size
+        kind = payload[pos:pos + 1]
+        pos += 1
+        if kind == b"n":
+            fields[key] = None
+        elif kind == b"?":
+            fields[key] = bool(payload[pos])
+            pos += 1
+        elif kind == b"q":
+            fields[key] = struct.unpack_from(">q", payload, pos)[0]
+            pos += 8
+        elif kind == b"d":
+            fields[key] = struct.unpack_from(">d", payload, pos)[0]
+            pos += 8
+        else:
+            (length,) = struct.unpack_from(">H", payload, pos)
+            fields[key] = payload[pos + 2:pos + 2 + length].decode()
+            pos += 2 + length
+    return {"seq": seq, "ts": ts, "full": bool(flags & 1), "data": fields}
+
+
+ENCODERS = {"json": encode_json, "binary": encode_binary}
+
+
+# --- transports -------------------------------------------------------------
+
+def _mqtt_str(value: str) -> bytes:
+    raw = value.encode()
+    return struct.pack(">H", len(raw)) + raw
+
+
+def _mqtt_packet(kind: int, body: bytes) -> bytes:
+    """Fixed header (packet type + variable length remaining length) + body."""
+    out = bytearray([kind])
+    length = len(body)
+    while True:
+        byte, length = length % 128, length // 128
+        out.append(byte | (0x80 if length else 0))
+        if not length:
+            break
+    return bytes(out) + body
+
+
+class MqttTransport:
+    """Minimal MQTT 3.1.1 client: CONNECT, QoS 0 PUBLISH, keepalive pings."""
+
+    def __init__(self, url: str, client_id: str, default_topic: str) -> None:
+        parts = urlsplit(url)
+        self.host = parts.hostname or "localhost"
+        self.port = parts.port or 1883
+        self.username = unquote(parts.username) if parts.username else None
+        self.password = unquote(parts.password) if parts.password else None
+        self.topic = parts.path.strip("/") or default_topic
+        self.client_id = client_id
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._tasks: list[asyncio.Task] = []
+        self._last_sent = 0.0
+
+    async def connect(self) -> None:
+        self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+        flags = 0x02  # clean session
+        payload = _mqtt_str(self.client_id)
+        if self.username is not None:
+            flags |= 0x80
+            payload += _mqtt_str(self.username)
+            if self.password is not None:
+                flags |= 0x40
+                payload += _mqtt_str(self.password)
+        body = _mqtt_str("MQTT") + struct.pack(">BBH", 4, flags, MQTT_KEEPALIVE) + payload
+        await self._write(_mqtt_packet(0x10, body))
+        connack = await self._reader.readexactly(4)
+        if connack[0] != 0x20 or connack[3] != 0:
+            raise ConnectionError(f"MQTT connection refused (return code {connack[3]})")
+        self._tasks = [asyncio.create_task(self._drain_incoming()), asyncio.create_task(self._keepalive())]
+
+    async def _write(self, packet: bytes) -> None:
+        assert self._writer is not None
+        self._writer.write(packet)
+        await self._writer.drain()
+        self._last_sent = time.monotonic()
+
+    async def _drain_incoming(self) -> None:
+        # Only PINGRESP is expected; reading keeps the socket buffer empty and
+        # notices a closed connection early
+        assert self._reader is not None
+        while await self._reader.read(1024):
+            pass
+        if self._writer is not None:
+            self._writer.close()
+
+    async def _keepalive(self) -> None:
+        try:
+            while True:
+                await asyncio.sleep(MQTT_KEEPALIVE / 2)
+                if time.monotonic() - self._last_sent >= MQTT_KEEPALIVE / 2:
+                    await self._write(b"\xc0\x00")  # PINGREQ
+        except (OSError, ConnectionError):
+            pass  # the next send notices the dead connection
+
+    async def send(self, payload: bytes) -> None:
+        if self._writer is None or self._writer.is_closing():
+            raise ConnectionError("MQTT connection closed")
+        await self._write(_mqtt_packet(0x30, _mqtt_str(self.topic) + payload))
+
+    async def close(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        self._tasks = []
+        writer, self._writer = self._writer, None
+        if writer is None:
+            return
+        try:
+            if not writer.is_closing():
+                writer.write(b"\xe0\x00")  # DISCONNECT
+            writer.close()
+            await writer.wait_closed()
+        except (OSError, ConnectionError):
+            pass
+
+
+class WebsocketTransport:
+    """Sends every message as one websocket frame (text for JSON, binary otherwise)."""
+
+    def __init__(self, hass, url: str, binary: bool) -> None:
+        self.hass = hass
+        self.url = url
+        self.binary = binary
+        self._ws = None
+
+    async def connect(self) -> None:
+        from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+        self._ws = await async_get_clientsession(self.hass).ws_connect(self.url, heartbeat=30)
+
+    async def send(self, payload: bytes) -> None:
+        if self._ws is None or self._ws.closed:
+            raise ConnectionError("websocket closed")
+        if self.binary:
+            await self._ws.send_bytes(payload)
+        else:
+            await self._ws.send_str(payload.decode())
+
+    async def close(self) -> None:
+        ws, self._ws = self._ws, None
+        if ws is not None and not ws.closed:
+            await ws.close()
+
+
+# --- publisher --------------------------------------------------------------
+
+class FuturaPublisher:
+    """Publishes every poll as one batched message with the changed fields only.
+
+    Messages are encoded on the event loop right after the poll and handed to
+    a worker through a bounded queue. When the transport cannot keep up (or is
+    disconnected), queued deltas are discarded and the next message is a full
+    snapshot instead, so a slow consumer never makes the backlog grow and never
+    misses a change. A full snapshot is also sent every 'full_every' messages
+    so late subscribers catch up.
+    """
+
+    def __init__(self, coordinator: FuturaCoordinator) -> None:
+        self.coordinator = coordinator
+        self.hass = coordinator.hass
+        self.url: str = ""
+        self.format = DEFAULT_PUBLISH_FORMAT
+        self.full_every = DEFAULT_PUBLISH_FULL_EVERY
+        self.sent = 0
+        self.dropped = 0
+        self._queue: asyncio.Queue[bytes] = asyncio.Queue(PUBLISH_QUEUE_SIZE)
+        self._last: dict[str, Any] = {}
+        self._seq = 0
+        self._resync = True
+        self._connected = False
+        self._poll_count = -1
+        self._task: asyncio.Task | None = None
+        self._unsub_listener = None
+
+    async def async_configure(self, options: Mapping[str, Any]) -> None:
+        """(Re)start the publisher when its options changed; an empty URL disables it."""
+        url = (options.get(CONF_PUBLISH_URL) or "").strip()
+        fmt = options.get(CONF_PUBLISH_FORMAT, DEFAULT_PUBLISH_FORMAT)
+        full_every = int(options.get(CONF_PUBLISH_FULL_EVERY, DEFAULT_PUBLISH_FULL_EVERY))
+        if (url, fmt, full_every) == (self.url, self.format, self.full_every) and (self._task or not url):
+            return
+        await self.async_stop()
+        self.url, self.format, self.full_every = url, fmt, full_every
+        if not url:
+            return
+        self._resync = True
+        self._unsub_listener = self.coordinator.async_add_listener(self.async_on_update)
+        self._task = self.hass.async_create_background_task(
+            self._async_run(), f"{DOMAIN} publisher {self.coordinator.host}"
+        )
+
+    async def async_stop(self) -> None:
+        if self._unsub_listener is not None:
+            self._unsub_listener()
+            self._unsub_listener = None
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def _transport(self) -> MqttTransport | WebsocketTransport:
+        host = slugify(str(self.coordinator.host))
+        if urlsplit(self.url).scheme == "mqtt":
+            return MqttTransport(self.url, f"{DOMAIN}_{host}", f"{DOMAIN}/{host}")
+        return WebsocketTransport(self.hass, self.url, self.format == "binary")
+
+    @callback
+    def async_on_update(self) -> None:
+        data = self.coordinator.data
+        if not data or not self.coordinator.last_update_success:
+            return
+        if self.coordinator.poll_count == self._poll_count:
+            return  # countdown tick, not a poll
+        self._poll_count = self.coordinator.poll_count
+        if not self._connected:
+            # Nothing can be delivered; the first message after connecting is full
+            self._resync = True
+            return
+
+        self._seq += 1
+        full = self._resync or (self.full_every > 0 and self._seq % self.full_every == 0)
+        current = {key: _plain(value) for key, value in data.items()}
+        if full:
+            fields = current
+        else:
+            fields = {k: v for k, v in current.items() if self._last.get(k, _MISSING) != v}
+            if not fields:
+                return
+        payload = ENCODERS[self.format](self._seq, time.time(), full, fields, str(self.coordinator.host))
+        try:
+            self._queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            # Backpressure: throw the backlog away and resend the whole state
+            self.dropped += self._queue.qsize() + 1
+            self._clear_queue()
+            self._resync = True
+            _LOGGER.debug("Publisher of %s is behind, %s messages dropped", self.coordinator.host, self.dropped)
+            return
+        self._last = current
+        self._resync = False
+
+    def _clear_queue(self) -> None:
+        while not self._queue.empty():
+            self._queue.get_nowait()
+
+    async def _async_run(self) -> None:
+        backoff = 1.0
+        while True:
+            transport = self._transport()
+            try:
+                await asyncio.wait_for(transport.connect(), PUBLISH_SEND_TIMEOUT)
+                _LOGGER.info("Publishing %s to %s", self.coordinator.host, redact_url(self.url))
+                self._connected = True
+                backoff = 1.0
+                while True:
+                    payload = await self._queue.get()
+                    await asyncio.wait_for(transport.send(payload), PUBLISH_SEND_TIMEOUT)
+                    self.sent += 1
+            except asyncio.CancelledError:
+                self._connected = False
+                await transport.close()
+                raise
+            except Exception as err:  # noqa: BLE001
+                _LOGGER.warning(
+                    "Publisher %s: %s, reconnecting in %.0f s", redact_url(self.url), err, backoff
+                )
+            self._connected = False
+            self._clear_queue()
+            self._resync = True
+            await transport.close()
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, PUBLISH_RECONNECT_MAX)
+
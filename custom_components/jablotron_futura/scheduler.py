@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Sequence
+
+from homeassistant.core import Context
+from homeassistant.exceptions import HomeAssistantError
+
+from .const import (
+    PRIORITY_AUTOMATION,
+    PRIORITY_BACKGROUND,
+    PRIORITY_USER,
+    WRITE_DEBOUNCE,
+    WRITE_MIN_INTERVAL,
+    WRITE_REGISTER_MIN_INTERVAL,
+)
+
+if TYPE_CHECKING:
+    from .coordinator import FuturaCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def priority_from_context(context: Context | None) -> int:
+    """Map a HA context to a write lane.
+
+    Calls from the UI/API carry the user id, automations and scripts do not.
+    """
+    if context is None:
+        return PRIORITY_BACKGROUND
+    if context.user_id is not None:
+        return PRIORITY_USER
+    return PRIORITY_AUTOMATION
+
+
+@dataclass
+class _PendingWrite:
+    values: tuple[int, ...]
+    priority: int
+    due: float
+    # (future, values the caller asked for) – succeeds only if those were written
+    waiters: list[tuple[asyncio.Future, tuple[int, ...]]] = field(default_factory=list)
+
+
+class FuturaWriteScheduler:
+    """Serialises holding register writes.
+
+    - last writer wins: a newer value for the same register replaces the queued one,
+      unless it comes from a lower priority lane – then it is dropped
+    - a write is dropped when the register already holds the value
+    - writes of one register are spaced by a per-lane / per-register interval
+    - when several writes are due, the higher priority lane goes first
+    """
+
+    def __init__(self, coordinator: FuturaCoordinator) -> None:
+        self._coordinator = coordinator
+        self._pending: dict[int, _PendingWrite] = {}
+        self._last_write: dict[int, float] = {}
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    @staticmethod
+    def _min_interval(address: int, priority: int) -> float:
+        interval = WRITE_MIN_INTERVAL[priority]
+        if priority != PRIORITY_USER:
+            interval = max(interval, WRITE_REGISTER_MIN_INTERVAL.get(address, 0.0))
+        return interval
+
+    async def async_submit(
+        self, address: int, values: Sequence[int], priority: int
+    ) -> None:
+        """Queue a write. User lane waits for the result, others return at once."""
+        values = tuple(int(v) & 0xFFFF for v in values)
+        prev = self._pending.get(address)
+        if prev is None and self._coordinator.holding_matches(address, values):
+            _LOGGER.debug("Skipping write @ %s, value %s already set", address, values)
+            return
+        if prev is not None and priority > prev.priority:
+            # A lower lane must not undo a queued UI/automation value
+            if values != prev.values:
+                _LOGGER.debug(
+                    "Dropping write @ %s = %s, a higher priority write of %s is queued",
+                    address, values, prev.values,
+                )
+            return
+
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        due = max(
+            now + WRITE_DEBOUNCE[priority],
+            self._last_write.get(address, float("-inf")) + self._min_interval(address, priority),
+        )
+        waiter = loop.create_future() if priority == PRIORITY_USER else None
+
+        if prev is not None:
+            # Never postpone an already queued write – chatty callers would starve it.
+            prev.values = values
+            prev.priority = min(prev.priority, priority)
+            prev.due = min(prev.due, due)
+            if waiter is not None:
+                prev.waiters.append((waiter, values))
+        else:
+            self._pending[address] = _PendingWrite(
+                values, priority, due, [(waiter, values)] if waiter is not None else []
+            )
+
+        self._wakeup.set()
+        if self._task is None or self._task.done():
+            self._task = self._coordinator.hass.async_create_background_task(
+                self._async_run(), f"jablotron_futura writer {self._coordinator.host}"
+            )
+        if waiter is not None:
+            await waiter
+
+    def _next(self, now: float) -> tuple[int, _PendingWrite] | None:
+        ready = [(p.priority, p.due, a) for a, p in self._pending.items() if p.due <= now]
+        if not ready:
+            return None
+        _, _, address = min(ready)
+        return address, self._pending.pop(address)
+
+    async def _async_run(self) -> None:
+        loop = asyncio.get_running_loop()
+        wrote = False
+        while True:
+            while self._pending:
+                now = loop.time()
+                item = self._next(now)
+                if item is None:
+                    if wrote:
+                        # One refresh for the whole batch written so far.
+                        await self._coordinator.async_request_refresh()
+                        wrote = False
+                    self._wakeup.clear()
+                    delay = min(p.due for p in self._pending.values()) - now
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+
+                address, pending = item
+                try:
+                    if self._coordinator.holding_matches(address, pending.values):
+                        _LOGGER.debug("Skipping write @ %s, value %s already set", address, pending.values)
+                    else:
+                        await self._coordinator._write_block(address, list(pending.values))
+                        self._last_write[address] = loop.time()
+                        wrote = True
+                except Exception as err:  # noqa: BLE001
+                    _LOGGER.warning("Write @ %s failed: %s", address, err)
+                    for waiter, _ in pending.waiters:
+                        if not waiter.done():
+                            waiter.set_exception(err)
+                    continue
+                for waiter, values in pending.waiters:
+                    if waiter.done():
+                        continue
+                    if values == pending.values:
+                        waiter.set_result(None)
+                    else:
+                        waiter.set_exception(
+                            HomeAssistantError(
+                                f"Write @ {address} = {list(values)} was superseded by {list(pending.values)}"
+                            )
+                        )
+
+            if not wrote:
+                return
+            # Writes submitted while the refresh runs see this task alive and do
+            # not start another runner – the next round picks them up.
+            await self._coordinator.async_request_refresh()
+            wrote = False
+
+    async def async_stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except (asyncio.CancelledError, Exception):  # noqa: BLE001
+                pass
+            self._task = None
+        for pending in self._pending.values():
+            for waiter, _ in pending.waiters:
+                if not waiter.done():
+                    waiter.cancel()
+        self._pending.clear()
@@ -19,8 +19,7 @@ class FuturaVentModeSelect(FuturaEntity, SelectEntity):
 
     async def async_select_option(self, option: str) -> None:
         value = VENT_MODE_MAP[option]
-        await self.coordinator._write_u16(0, value)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_write(0, value, context=self._context)
 
 
 class FuturaHumiModeSelect(FuturaEntity, SelectEntity):
@@ -39,10 +38,9 @@ class FuturaHumiModeSelect(FuturaEntity, SelectEntity):
 
     async def async_select_option(self, option: str) -> None:
         target = int(HUMI_MODE_MAP[option] * 10)
-        await self.coordinator._write_u16(11, target)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_write(11, target, context=self._context)
 
 
 async def async_setup_entry(hass, entry, async_add_entities):
     coord: FuturaCoordinator = hass.data["jablotron_futura"][entry.entry_id]
-    async_add_entities([FuturaVentModeSelect(coord), FuturaHumiModeSelect(coord)], True)
+    async_add_entities([FuturaVentModeSelect(coord), FuturaHumiModeSelect(coord)])
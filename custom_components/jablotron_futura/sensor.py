@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
+
 from homeassistant.components.sensor import (
     SensorEntity,
+    SensorEntityDescription,
     SensorDeviceClass,
     SensorStateClass,
 )
@@ -14,38 +17,167 @@ from homeassistant.const import (
     UnitOfElectricPotential,
 )
 
-from .entity import FuturaEntity
+from homeassistant.core import callback
+
+from .entity import FuturaEntity, async_add_entities_when_available
 from .coordinator import FuturaCoordinator
 
+# Smallest change of a numeric value worth a new state (per unit); smaller
+# changes are written at most once per STATE_MAX_AGE seconds. Long-term
+# history comes from the imported statistics (stats.py), not from states.
+SIGNIFICANT_CHANGE = {
+    UnitOfTemperature.CELSIUS: 0.3,
+    PERCENTAGE: 2.0,
+    CONCENTRATION_PARTS_PER_MILLION: 25.0,
+    UnitOfPower.WATT: 10.0,
+    UnitOfVolumeFlowRate.CUBIC_METERS_PER_HOUR: 5.0,
+    UnitOfElectricPotential.MILLIVOLT: 50.0,
+    "rpm": 50.0,
+}
+STATE_MAX_AGE = 300.0
+
+
+@dataclass(frozen=True, kw_only=True)
+class FuturaSensorEntityDescription(SensorEntityDescription):
+    avail_key: str | None = None
+
+
+def _d(
+    key: str,
+    name: str,
+    unit: str | None = None,
+    device_class=None,
+    icon: str | None = None,
+    state_class=None,
+    avail_key: str | None = None,
+) -> FuturaSensorEntityDescription:
+    return FuturaSensorEntityDescription(
+        key=key,
+        name=name,
+        native_unit_of_measurement=unit,
+        device_class=device_class,
+        icon=icon,
+        state_class=state_class,
+        avail_key=avail_key,
+    )
+
+
+# Shared description tables – built once at import, reused by every unit
+SENSORS: tuple[FuturaSensorEntityDescription, ...] = (
+    # Temperatures
+    _d("temp_outdoor", "Teplota venku", UnitOfTemperature.CELSIUS, SensorDeviceClass.TEMPERATURE),
+    _d("temp_supply",  "Teplota do domu", UnitOfTemperature.CELSIUS, SensorDeviceClass.TEMPERATURE),
+    _d("temp_extract", "Teplota z domu", UnitOfTemperature.CELSIUS, SensorDeviceClass.TEMPERATURE),
+    _d("temp_exhaust", "Teplota odtah", UnitOfTemperature.CELSIUS, SensorDeviceClass.TEMPERATURE),
+    _d("temp_outdoor_ntc", "Teplota NTC venku", UnitOfTemperature.CELSIUS, SensorDeviceClass.TEMPERATURE),
+    # Humidity
+    _d("humi_outdoor", "Vlhkost venku", PERCENTAGE, SensorDeviceClass.HUMIDITY),
+    _d("humi_supply", "Vlhkost do domu", PERCENTAGE, SensorDeviceClass.HUMIDITY),
+    _d("humi_extract", "Vlhkost z domu", PERCENTAGE, SensorDeviceClass.HUMIDITY),
+    _d("humi_exhaust", "Vlhkost odtah", PERCENTAGE, SensorDeviceClass.HUMIDITY),
+    # ALFA controllers
+    _d("alfa_count", "ALFA – počet"),
+    # Performance
+    _d("filter_wear", "Zanesení filtrů", PERCENTAGE),
+    _d("power", "Příkon", UnitOfPower.WATT),
+    _d("heat_recovering", "Zpětně získávané teplo", UnitOfPower.WATT),
+    _d("heating_power", "Výkon topení dohřevu", UnitOfPower.WATT),
+    _d("air_flow", "Vzduchové množství", UnitOfVolumeFlowRate.CUBIC_METERS_PER_HOUR),
+    _d("fan_power_supply",  "Výkon ventilátoru přívod", PERCENTAGE, state_class=SensorStateClass.MEASUREMENT),
+    _d("fan_power_exhaust", "Výkon ventilátoru odtah", PERCENTAGE, state_class=SensorStateClass.MEASUREMENT),
+    _d("fan_rpm_supply",    "Otáčky ventilátoru přívod", "rpm", state_class=SensorStateClass.MEASUREMENT),
+    _d("fan_rpm_exhaust", "Otáčky ventilátoru odtah", "rpm", state_class=SensorStateClass.MEASUREMENT),
+    _d("rtc_batt_voltage", "Napětí baterie RTC", UnitOfElectricPotential.MILLIVOLT, SensorDeviceClass.VOLTAGE),
+    # Analytics (derived from buffered samples)
+    _d("hrv_efficiency_sensible", "Účinnost rekuperace (citelná)", PERCENTAGE, icon="mdi:heat-wave", state_class=SensorStateClass.MEASUREMENT),
+    _d("hrv_efficiency_enthalpic", "Účinnost rekuperace (entalpická)", PERCENTAGE, icon="mdi:heat-wave", state_class=SensorStateClass.MEASUREMENT),
+    _d("fan_imbalance", "Nevyváženost přívod/odtah", PERCENTAGE, icon="mdi:scale-unbalanced", state_class=SensorStateClass.MEASUREMENT),
+    _d("filter_resistance_index", "Odpor filtrů (index)", PERCENTAGE, icon="mdi:air-filter", state_class=SensorStateClass.MEASUREMENT),
+    _d("filter_replacement_date", "Odhad výměny filtrů", device_class=SensorDeviceClass.TIMESTAMP, icon="mdi:calendar-clock"),
+    _d("forecast_temp_outdoor", "Předpověď teploty venku", UnitOfTemperature.CELSIUS, SensorDeviceClass.TEMPERATURE),
+    _d("forecast_temp_extract", "Předpověď teploty z domu", UnitOfTemperature.CELSIUS, SensorDeviceClass.TEMPERATURE),
+    # Config / helpers
+    _d("mode_raw", "Režim (raw)"),
+    _d("mode_text", "Režim větrání (text)"),
+    _d("temp_set_raw", "Požadovaná teplota (raw)", UnitOfTemperature.CELSIUS, SensorDeviceClass.TEMPERATURE),
+    _d("humi_set_raw", "Požadovaná vlhkost (raw)", PERCENTAGE, SensorDeviceClass.HUMIDITY),
+    _d("dcv_target_level", "Řízení podle CO₂ – cílový stupeň", icon="mdi:molecule-co2"),
+    # Times
+    _d("boost_remaining_s", "Boost – zbývá (s)"),
+    _d("boost_remaining_min", "Boost – zbývá (min)"),
+    _d("circulation_remaining_s", "Cirkulace – zbývá (s)"),
+    _d("circulation_remaining_min", "Cirkulace – zbývá (min)"),
+    _d("night_remaining_s", "Noc – zbývá (s)"),
+    _d("night_remaining_h", "Noc – zbývá (h)"),
+    _d("party_remaining_s", "Party – zbývá (s)"),
+    _d("party_remaining_h", "Party – zbývá (h)"),
+    _d("overpressure_remaining_s", "Přetlak – zbývá (s)"),
+    _d("device_clock_drift_ppm", "Odchylka hodin jednotky", "ppm", icon="mdi:clock-fast"),
+    _d("away_begin_ts", "Dovolená – začátek (unix)"),
+    _d("away_end_ts", "Dovolená – konec (unix)"),
+    _d("away_begin_text", "Dovolená – začátek"),
+    _d("away_end_text", "Dovolená – konec"),
+)
+
+
+def _alfa_sensors(i: int) -> tuple[FuturaSensorEntityDescription, ...]:
+    prefix = f"ALFA {i}"
+    avail = f"alfa_{i}_available"
+    return (
+        _d(f"alfa_mb_address_{i}", f"{prefix} – adresa", avail_key=avail),
+        _d(f"alfa_options_{i}", f"{prefix} – nastavení", avail_key=avail),
+        _d(f"alfa_temp_{i}", f"{prefix} – teplota", UnitOfTemperature.CELSIUS, SensorDeviceClass.TEMPERATURE, avail_key=avail),
+        _d(f"alfa_ntc_temp_{i}", f"{prefix} – teplota NTC", UnitOfTemperature.CELSIUS, SensorDeviceClass.TEMPERATURE, avail_key=avail),
+        _d(f"alfa_humi_{i}", f"{prefix} – vlhkost", PERCENTAGE, SensorDeviceClass.HUMIDITY, avail_key=avail),
+        _d(f"alfa_co2_{i}", f"{prefix} – CO₂", CONCENTRATION_PARTS_PER_MILLION, avail_key=avail),
+    )
+
+
+# ALFA slot sensors are only created once the slot reports a connected unit
+ALFA_SENSORS: dict[str, tuple[FuturaSensorEntityDescription, ...]] = {
+    f"alfa_{i}_available": _alfa_sensors(i) for i in range(1, 9)
+}
+
 
 class FuturaSimpleSensor(FuturaEntity, SensorEntity):
-    def __init__(
-        self,
-        coordinator: FuturaCoordinator,
-        key: str,
-        name: str,
-        unit: str | None = None,
-        device_class=None,
-        icon: str | None = None,
-        state_class=None,
-        avail_key: str | None = None,
-    ):
-        super().__init__(coordinator, name, key)
-        self.key = key
-        self.avail_key = avail_key
-        if unit is not None:
-            self._attr_native_unit_of_measurement = unit
-        if device_class is not None:
-            self._attr_device_class = device_class
-        if icon is not None:
-            self._attr_icon = icon
-        if state_class is not None:
-            self._attr_state_class = state_class
+    entity_description: FuturaSensorEntityDescription
+
+    def __init__(self, coordinator: FuturaCoordinator, description: FuturaSensorEntityDescription):
+        super().__init__(coordinator, description.name, description.key)
+        self.entity_description = description
+        self.key = description.key
+        self.avail_key = description.avail_key
+        self._significant = SIGNIFICANT_CHANGE.get(description.native_unit_of_measurement)
+        self._written: tuple[object, bool] | None = None
+        self._written_at = 0.0
 
     @property
     def native_value(self):
         return self.coordinator.data.get(self.key)
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state only on a significant change (or once per STATE_MAX_AGE)."""
+        value = self.native_value
+        available = self.available
+        now = self.hass.loop.time()
+        if self._written is not None:
+            last_value, last_available = self._written
+            if available == last_available:
+                if value == last_value:
+                    return
+                if (
+                    self._significant is not None
+                    and isinstance(value, (int, float))
+                    and isinstance(last_value, (int, float))
+                    and abs(value - last_value) < self._significant
+                    and now - self._written_at < STATE_MAX_AGE
+                ):
+                    return
+        self._written = (value, available)
+        self._written_at = now
+        self.async_write_ha_state()
+
     @property
     def available(self) -> bool:
         if self.avail_key is None:
@@ -56,62 +188,13 @@ class FuturaSimpleSensor(FuturaEntity, SensorEntity):
 async def async_setup_entry(hass, entry, async_add_entities):
     coord: FuturaCoordinator = hass.data["jablotron_futura"][entry.entry_id]
 
-    ents = []
-
-    # Temperatures
-    ents.append(FuturaSimpleSensor(coord, "temp_outdoor", "Teplota venku", UnitOfTemperature.CELSIUS, SensorDeviceClass.TEMPERATURE))
-    ents.append(FuturaSimpleSensor(coord, "temp_supply",  "Teplota do domu", UnitOfTemperature.CELSIUS, SensorDeviceClass.TEMPERATURE))
-    ents.append(FuturaSimpleSensor(coord, "temp_extract", "Teplota z domu", UnitOfTemperature.CELSIUS, SensorDeviceClass.TEMPERATURE))
-    ents.append(FuturaSimpleSensor(coord, "temp_exhaust", "Teplota odtah", UnitOfTemperature.CELSIUS, SensorDeviceClass.TEMPERATURE))
-    ents.append(FuturaSimpleSensor(coord, "temp_outdoor_ntc", "Teplota NTC venku", UnitOfTemperature.CELSIUS, SensorDeviceClass.TEMPERATURE))
-
-    # Humidity
-    for k, n in (("humi_outdoor","Vlhkost venku"),("humi_supply","Vlhkost do domu"),("humi_extract","Vlhkost z domu"),("humi_exhaust","Vlhkost odtah")):
-        ents.append(FuturaSimpleSensor(coord, k, n, PERCENTAGE, SensorDeviceClass.HUMIDITY))
-
-    # ALFA controllers
-    ents.append(FuturaSimpleSensor(coord, "alfa_count", "ALFA – počet"))
-    for i in range(1, 9):
-        prefix = f"ALFA {i}"
-        avail = f"alfa_{i}_available"
-        ents.append(FuturaSimpleSensor(coord, f"alfa_mb_address_{i}", f"{prefix} – adresa", avail_key=avail))
-        ents.append(FuturaSimpleSensor(coord, f"alfa_options_{i}", f"{prefix} – nastavení", avail_key=avail))
-        ents.append(FuturaSimpleSensor(coord, f"alfa_temp_{i}", f"{prefix} – teplota", UnitOfTemperature.CELSIUS, SensorDeviceClass.TEMPERATURE, avail_key=avail))
-        ents.append(FuturaSimpleSensor(coord, f"alfa_ntc_temp_{i}", f"{prefix} – teplota NTC", UnitOfTemperature.CELSIUS, SensorDeviceClass.TEMPERATURE, avail_key=avail))
-        ents.append(FuturaSimpleSensor(coord, f"alfa_humi_{i}", f"{prefix} – vlhkost", PERCENTAGE, SensorDeviceClass.HUMIDITY, avail_key=avail))
-        ents.append(FuturaSimpleSensor(coord, f"alfa_co2_{i}", f"{prefix} – CO₂", CONCENTRATION_PARTS_PER_MILLION, avail_key=avail))
-
-    # Performance
-    ents.append(FuturaSimpleSensor(coord, "filter_wear", "Zanesení filtrů", PERCENTAGE))
-    ents.append(FuturaSimpleSensor(coord, "power", "Příkon", UnitOfPower.WATT))
-    ents.append(FuturaSimpleSensor(coord, "heat_recovering", "Zpětně získávané teplo", UnitOfPower.WATT))
-    ents.append(FuturaSimpleSensor(coord, "heating_power", "Výkon topení dohřevu", UnitOfPower.WATT))
-    ents.append(FuturaSimpleSensor(coord, "air_flow", "Vzduchové množství", UnitOfVolumeFlowRate.CUBIC_METERS_PER_HOUR))
-    ents.append(FuturaSimpleSensor(coord, "fan_power_supply",  "Výkon ventilátoru přívod", PERCENTAGE, state_class=SensorStateClass.MEASUREMENT))
-    ents.append(FuturaSimpleSensor(coord, "fan_power_exhaust", "Výkon ventilátoru odtah", PERCENTAGE, state_class=SensorStateClass.MEASUREMENT))
-    ents.append(FuturaSimpleSensor(coord, "fan_rpm_supply",    "Otáčky ventilátoru přívod", "rpm", state_class=SensorStateClass.MEASUREMENT))
-    ents.append(FuturaSimpleSensor(coord, "fan_rpm_exhaust", "Otáčky ventilátoru odtah", "rpm", state_class=SensorStateClass.MEASUREMENT))
-    ents.append(FuturaSimpleSensor(coord, "rtc_batt_voltage", "Napětí baterie RTC", UnitOfElectricPotential.MILLIVOLT, SensorDeviceClass.VOLTAGE))
-
-    # Config / helpers
-    ents.append(FuturaSimpleSensor(coord, "mode_raw", "Režim (raw)"))
-    ents.append(FuturaSimpleSensor(coord, "mode_text", "Režim větrání (text)"))
-    ents.append(FuturaSimpleSensor(coord, "temp_set_raw", "Požadovaná teplota (raw)", UnitOfTemperature.CELSIUS, SensorDeviceClass.TEMPERATURE))
-    ents.append(FuturaSimpleSensor(coord, "humi_set_raw", "Požadovaná vlhkost (raw)", PERCENTAGE, SensorDeviceClass.HUMIDITY))
-
-    # Times
-    ents.append(FuturaSimpleSensor(coord, "boost_remaining_s", "Boost – zbývá (s)"))
-    ents.append(FuturaSimpleSensor(coord, "boost_remaining_min", "Boost – zbývá (min)"))
-    ents.append(FuturaSimpleSensor(coord, "circulation_remaining_s", "Cirkulace – zbývá (s)"))
-    ents.append(FuturaSimpleSensor(coord, "circulation_remaining_min", "Cirkulace – zbývá (min)"))
-    ents.append(FuturaSimpleSensor(coord, "night_remaining_s", "Noc – zbývá (s)"))
-    ents.append(FuturaSimpleSensor(coord, "night_remaining_h", "Noc – zbývá (h)"))
-    ents.append(FuturaSimpleSensor(coord, "party_remaining_s", "Party – zbývá (s)"))
-    ents.append(FuturaSimpleSensor(coord, "party_remaining_h", "Party – zbývá (h)"))
-    ents.append(FuturaSimpleSensor(coord, "overpressure_remaining_s", "Přetlak – zbývá (s)"))
-    ents.append(FuturaSimpleSensor(coord, "away_begin_ts", "Dovolená – začátek (unix)"))
-    ents.append(FuturaSimpleSensor(coord, "away_end_ts", "Dovolená – konec (unix)"))
-    ents.append(FuturaSimpleSensor(coord, "away_begin_text", "Dovolená – začátek"))
-    ents.append(FuturaSimpleSensor(coord, "away_end_text", "Dovolená – konec"))
-
-    async_add_entities(ents, True)
+    async_add_entities([FuturaSimpleSensor(coord, d) for d in SENSORS])
+    async_add_entities_when_available(
+        coord,
+        entry,
+        async_add_entities,
+        {
+            avail: (lambda descs=descs: [FuturaSimpleSensor(coord, d) for d in descs])
+            for avail, descs in ALFA_SENSORS.items()
+        },
+    )
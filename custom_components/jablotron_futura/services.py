@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import logging
+import os
+
+import voluptuous as vol
+
+from homeassistant.const import ATTR_ENTITY_ID, ENTITY_MATCH_ALL
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.service import async_extract_referenced_entity_ids
+from homeassistant.util import dt as ha_dt, slugify
+
+from .const import DOMAIN
+from .coordinator import FuturaCoordinator
+from .dump import parse_ranges
+from .profiling import async_profile
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_DUMP_RANGES = "input:0-255,holding:0-63"
+DEFAULT_CAPTURE_DURATION = 300
+# device_id, entity_id, area_id (+ floor_id, label_id on newer HA)
+TARGET_FIELDS = tuple(str(key) for key in cv.ENTITY_SERVICE_FIELDS)
+
+SET_AWAY_SCHEMA = vol.Schema({
+    **cv.ENTITY_SERVICE_FIELDS,
+    vol.Optional("begin"): cv.datetime,
+    vol.Optional("end"): cv.datetime,
+})
+CLEAR_AWAY_SCHEMA = vol.Schema({**cv.ENTITY_SERVICE_FIELDS})
+DUMP_REGISTERS_SCHEMA = vol.Schema({
+    **cv.ENTITY_SERVICE_FIELDS,
+    vol.Optional("ranges"): str,
+    vol.Optional("format", default="csv"): vol.In(["csv", "binary"]),
+    vol.Optional("path"): str,
+})
+CAPTURE_TRAFFIC_SCHEMA = vol.Schema({
+    **cv.ENTITY_SERVICE_FIELDS,
+    vol.Optional("duration", default=DEFAULT_CAPTURE_DURATION): vol.All(
+        vol.Coerce(int), vol.Range(min=1, max=24 * 3600)
+    ),
+    vol.Optional("path"): str,
+})
+STOP_CAPTURE_SCHEMA = vol.Schema({**cv.ENTITY_SERVICE_FIELDS})
+PROFILE_SCHEMA = vol.Schema({
+    **cv.ENTITY_SERVICE_FIELDS,
+    vol.Optional("duration", default=60): vol.All(vol.Coerce(float), vol.Range(min=1, max=3600)),
+    vol.Optional("memory", default=True): cv.boolean,
+    vol.Optional("path"): str,
+})
+
+
+def async_get_coordinators(hass: HomeAssistant, call: ServiceCall) -> list[FuturaCoordinator]:
+    """Coordinators addressed by the call's target (all when untargeted).
+
+    Devices, entities, areas, floors and labels are resolved by HA; a target
+    that matches no unit is an error rather than "every unit".
+    """
+    coordinators: dict[str, FuturaCoordinator] = hass.data.get(DOMAIN, {})
+    if (
+        not any(call.data.get(key) for key in TARGET_FIELDS)
+        or call.data.get(ATTR_ENTITY_ID) == ENTITY_MATCH_ALL
+    ):
+        return list(coordinators.values())
+
+    selected_ids = async_extract_referenced_entity_ids(hass, call)
+    entry_ids: set[str] = set()
+    dev_reg = dr.async_get(hass)
+    for device_id in selected_ids.referenced_devices:
+        if (device := dev_reg.async_get(device_id)) is not None:
+            entry_ids.update(device.config_entries)
+    ent_reg = er.async_get(hass)
+    for entity_id in selected_ids.referenced | selected_ids.indirectly_referenced:
+        if (entity := ent_reg.async_get(entity_id)) is not None and entity.config_entry_id:
+            entry_ids.add(entity.config_entry_id)
+
+    selected = [coordinators[e] for e in entry_ids if e in coordinators]
+    if not selected:
+        raise HomeAssistantError("No Jablotron Futura unit matches the service target")
+    return selected
+
+
+async def async_output_path(hass: HomeAssistant, call: ServiceCall, default_name: str) -> str:
+    """File a diagnostics service writes to.
+
+    Without a 'path' the file goes to the HA config directory under a
+    generated name; a 'path' given by the caller must be in
+    allowlist_external_dirs.
+    """
+    path = call.data.get("path")
+    if not path:
+        return hass.config.path(default_name)
+    # is_allowed_path resolves the path on disk – not on the event loop
+    if not await hass.async_add_executor_job(hass.config.is_allowed_path, os.path.dirname(path) or "."):
+        raise HomeAssistantError(f"Path {path} is not allowed (allowlist_external_dirs)")
+    return path
+
+
+async def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the domain services once; calls are dispatched per target."""
+
+    async def handle_set_away(call: ServiceCall) -> None:
+        for coordinator in async_get_coordinators(hass, call):
+            await coordinator.async_set_away(
+                call.data.get("begin"), call.data.get("end"), context=call.context
+            )
+
+    async def handle_clear_away(call: ServiceCall) -> None:
+        for coordinator in async_get_coordinators(hass, call):
+            await coordinator.async_clear_away(context=call.context)
+
+    async def handle_dump_registers(call: ServiceCall) -> None:
+        try:
+            ranges = parse_ranges(call.data.get("ranges", DEFAULT_DUMP_RANGES))
+        except ValueError as err:
+            raise HomeAssistantError(f"Invalid ranges: {err}") from err
+        binary = call.data["format"] == "binary"
+        coordinators = async_get_coordinators(hass, call)
+        if call.data.get("path") and len(coordinators) > 1:
+            raise HomeAssistantError("An explicit path needs a single target unit")
+        for coordinator in coordinators:
+            path = await async_output_path(
+                hass,
+                call,
+                f"jablotron_futura_dump_{slugify(str(coordinator.host))}_"
+                f"{ha_dt.now().strftime('%Y%m%d_%H%M%S')}" + (".bin" if binary else ".csv"),
+            )
+            await coordinator.async_dump_registers(path, ranges, binary=binary)
+
+    async def handle_capture_traffic(call: ServiceCall) -> None:
+        coordinators = async_get_coordinators(hass, call)
+        if call.data.get("path") and len(coordinators) > 1:
+            raise HomeAssistantError("An explicit path needs a single target unit")
+        for coordinator in coordinators:
+            path = await async_output_path(
+                hass,
+                call,
+                f"jablotron_futura_capture_{slugify(str(coordinator.host))}_"
+                f"{ha_dt.now().strftime('%Y%m%d_%H%M%S')}.jsonl.gz",
+            )
+            await coordinator.async_start_capture(path, call.data["duration"])
+
+    async def handle_profile(call: ServiceCall) -> None:
+        path = await async_output_path(
+            hass, call, f"jablotron_futura_profile_{ha_dt.now().strftime('%Y%m%d_%H%M%S')}"
+        )
+        await async_profile(
+            hass,
+            async_get_coordinators(hass, call),
+            call.data["duration"],
+            path,
+            memory=call.data["memory"],
+        )
+
+    async def handle_stop_capture(call: ServiceCall) -> None:
+        for coordinator in async_get_coordinators(hass, call):
+            await coordinator.async_stop_capture()
+
+    hass.services.async_register(DOMAIN, "set_away", handle_set_away, schema=SET_AWAY_SCHEMA)
+    hass.services.async_register(DOMAIN, "clear_away", handle_clear_away, schema=CLEAR_AWAY_SCHEMA)
+    hass.services.async_register(
+        DOMAIN, "dump_registers", handle_dump_registers, schema=DUMP_REGISTERS_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN, "capture_traffic", handle_capture_traffic, schema=CAPTURE_TRAFFIC_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN, "stop_capture", handle_stop_capture, schema=STOP_CAPTURE_SCHEMA
+    )
+    hass.services.async_register(DOMAIN, "profile", handle_profile, schema=PROFILE_SCHEMA)
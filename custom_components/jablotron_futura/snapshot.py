@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import time
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any
+
+from aiohttp import web
+
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.json import json_bytes
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from .coordinator import FuturaCoordinator
+
+SNAPSHOT_URL = f"/api/{DOMAIN}/snapshot"
+
+
+class SnapshotCache:
+    """Pre-serialized snapshot of all units, rebuilt only when their data changed.
+
+    Every poll (and countdown tick) replaces the coordinator's data dict, so
+    comparing the dict identities tells whether anything can have changed
+    without looking at the values. The version only moves when the
+    serialized content really differs; the ETag also carries a per-start
+    token so a restarted HA never answers 304 for an old version.
+    """
+
+    def __init__(self) -> None:
+        self.version = 0
+        self.body = b""
+        self.etag = ""
+        self._boot = format(int(time.time()), "x")
+        self._sources: list[tuple[str, Any, bool]] | None = None
+        self._units = b""
+
+    def get(self, coordinators: dict[str, FuturaCoordinator]) -> tuple[bytes, str]:
+        sources = [(entry_id, c.data, c.last_update_success) for entry_id, c in coordinators.items()]
+        if self._sources is not None and len(sources) == len(self._sources) and all(
+            new[0] == old[0] and new[1] is old[1] and new[2] == old[2]
+            for new, old in zip(sources, self._sources)
+        ):
+            return self.body, self.etag
+        self._sources = sources
+
+        units = json_bytes({
+            str(c.host): {
+                "entry_id": entry_id,
+                "available": c.last_update_success,
+                "data": c.data or {},
+            }
+            for entry_id, c in coordinators.items()
+        })
+        if units != self._units or not self.body:
+            self._units = units
+            self.version += 1
+            self.body = b'{"version":%d,"units":%s}' % (self.version, units)
+            self.etag = f'"{self._boot}-{self.version}"'
+        return self.body, self.etag
+
+
+def _etag_matches(header: str | None, etag: str) -> bool:
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in header.split(","))
+
+
+class FuturaSnapshotView(HomeAssistantView):
+    """Latest coordinator data of all units in one cached JSON response.
+
+    Meant for dashboards polling at a high rate: an unchanged snapshot costs
+    an identity check and a 304 (with If-None-Match) or the cached bytes,
+    nothing goes through the state machine.
+    """
+
+    url = SNAPSHOT_URL
+    name = f"api:{DOMAIN}:snapshot"
+    requires_auth = True
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self.hass = hass
+        self._cache = SnapshotCache()
+
+    async def get(self, request: web.Request) -> web.Response:
+        body, etag = self._cache.get(self.hass.data.get(DOMAIN, {}))
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if _etag_matches(request.headers.get("If-None-Match"), etag):
+            return web.Response(status=HTTPStatus.NOT_MODIFIED, headers=headers)
+        return web.Response(body=body, content_type="application/json", headers=headers)
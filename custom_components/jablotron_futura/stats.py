@@ -0,0 +1,251 @@
+from __future__ import annotations
+
+import datetime as dt
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Mapping
+
+from homeassistant.const import (
+    CONCENTRATION_PARTS_PER_MILLION,
+    PERCENTAGE,
+    UnitOfEnergy,
+    UnitOfPower,
+    UnitOfTemperature,
+    UnitOfVolumeFlowRate,
+)
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as ha_dt, slugify
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from .coordinator import FuturaCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# key -> unit of the hourly mean/min/max statistic
+MEAN_STATISTICS: dict[str, str] = {
+    "temp_outdoor": UnitOfTemperature.CELSIUS,
+    "temp_supply": UnitOfTemperature.CELSIUS,
+    "temp_extract": UnitOfTemperature.CELSIUS,
+    "temp_exhaust": UnitOfTemperature.CELSIUS,
+    "humi_outdoor": PERCENTAGE,
+    "humi_supply": PERCENTAGE,
+    "humi_extract": PERCENTAGE,
+    "humi_exhaust": PERCENTAGE,
+    "power": UnitOfPower.WATT,
+    "heat_recovering": UnitOfPower.WATT,
+    "heating_power": UnitOfPower.WATT,
+    "air_flow": UnitOfVolumeFlowRate.CUBIC_METERS_PER_HOUR,
+    "fan_power_supply": PERCENTAGE,
+    "fan_power_exhaust": PERCENTAGE,
+    "fan_rpm_supply": "rpm",
+    "fan_rpm_exhaust": "rpm",
+    "filter_wear": PERCENTAGE,
+    **{f"alfa_co2_{i}": CONCENTRATION_PARTS_PER_MILLION for i in range(1, 9)},
+    **{f"alfa_temp_{i}": UnitOfTemperature.CELSIUS for i in range(1, 9)},
+    **{f"alfa_humi_{i}": PERCENTAGE for i in range(1, 9)},
+}
+
+# power key (W) -> energy statistic (kWh, cumulative sum)
+ENERGY_STATISTICS: dict[str, str] = {
+    "power": "energy_consumed",
+    "heat_recovering": "energy_recovered",
+    "heating_power": "energy_heating",
+}
+
+# A gap longer than this (s) is not integrated – the unit was unreachable
+MAX_INTEGRATION_GAP = 120.0
+
+# The hour in progress survives restarts and reloads here (one file per unit)
+STORAGE_KEY = f"{DOMAIN}.statistics"
+STORAGE_VERSION = 1
+
+
+@dataclass
+class _Bucket:
+    count: int = 0
+    total: float = 0.0
+    min: float = float("inf")
+    max: float = float("-inf")
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+
+class FuturaStatistics:
+    """Aggregates every poll in memory and imports hourly long-term statistics.
+
+    Instead of relying on the recorder sampling ~60 sensors at poll rate, one
+    mean/min/max row per key and hour (and a running kWh sum for the power
+    keys) is written through the recorder statistics API, so database I/O does
+    not depend on the poll interval. The recorder accepts imported statistics
+    in hourly resolution only, so there is no 5-minute import. The hour in
+    progress is saved on unload/shutdown and merged (or imported, once the
+    hour is over) on the next start.
+    """
+
+    def __init__(self, hass: HomeAssistant, coordinator: FuturaCoordinator) -> None:
+        self.hass = hass
+        self.coordinator = coordinator
+        self._prefix = f"{DOMAIN}:{slugify(str(coordinator.host))}"
+        self._hour: dt.datetime | None = None
+        self._buckets: dict[str, _Bucket] = {}
+        self._energy_hour: dict[str, float] = {}     # kWh in the current hour
+        self._energy_sum: dict[str, float] | None = None
+        self._last_power: dict[str, tuple[float, float]] = {}  # key -> (monotonic, W)
+        self._poll_count = -1
+        self._store: Store = Store(
+            hass, STORAGE_VERSION, f"{STORAGE_KEY}_{slugify(str(coordinator.host))}"
+        )
+
+    def statistic_id(self, key: str) -> str:
+        return f"{self._prefix}_{key}"
+
+    async def async_restore(self) -> None:
+        """Pick up the hour saved by the previous run."""
+        stored = await self._store.async_load()
+        if not stored:
+            return
+        hour = ha_dt.parse_datetime(stored.get("hour") or "")
+        buckets = {key: _Bucket(**bucket) for key, bucket in stored.get("buckets", {}).items()}
+        energy = {key: float(kwh) for key, kwh in stored.get("energy", {}).items()}
+        if hour is None:
+            pass
+        elif hour == ha_dt.utcnow().replace(minute=0, second=0, microsecond=0):
+            self._hour = hour
+            for key, bucket in buckets.items():
+                own = self._buckets.setdefault(key, _Bucket())
+                own.count += bucket.count
+                own.total += bucket.total
+                own.min = min(own.min, bucket.min)
+                own.max = max(own.max, bucket.max)
+            for key, kwh in energy.items():
+                self._energy_hour[key] = self._energy_hour.get(key, 0.0) + kwh
+        elif "recorder" in self.hass.config.components:
+            await self._async_import(hour, buckets, energy)
+        await self._store.async_remove()
+
+    async def async_save(self, *_: Any) -> None:
+        """Keep the hour in progress for the next run (unload, reload, shutdown)."""
+        if self._hour is None:
+            return
+        await self._store.async_save({
+            "hour": self._hour.isoformat(),
+            "buckets": {
+                key: {"count": b.count, "total": b.total, "min": b.min, "max": b.max}
+                for key, b in self._buckets.items()
+                if b.count
+            },
+            "energy": dict(self._energy_hour),
+        })
+
+    @callback
+    def async_on_update(self) -> None:
+        data = self.coordinator.data
+        if not data or not self.coordinator.last_update_success:
+            return
+        if self.coordinator.poll_count == self._poll_count:
+            return  # countdown tick, no new sample
+        self._poll_count = self.coordinator.poll_count
+        now = ha_dt.utcnow()
+        hour = now.replace(minute=0, second=0, microsecond=0)
+        if self._hour is not None and hour != self._hour:
+            self._flush(self._hour)
+        self._hour = hour
+        self._add_samples(data, self.hass.loop.time())
+
+    def _add_samples(self, data: Mapping[str, Any], mono: float) -> None:
+        for key in MEAN_STATISTICS:
+            value = data.get(key)
+            if value is None or (key.startswith("alfa_") and not data.get(f"alfa_{key.rsplit('_', 1)[1]}_available")):
+                continue
+            self._buckets.setdefault(key, _Bucket()).add(float(value))
+
+        for key in ENERGY_STATISTICS:
+            value = data.get(key)
+            if value is None:
+                continue
+            prev = self._last_power.get(key)
+            if prev is not None and 0 < mono - prev[0] <= MAX_INTEGRATION_GAP:
+                # Trapezoid, W·s -> kWh
+                kwh = (prev[1] + float(value)) / 2 * (mono - prev[0]) / 3_600_000
+                self._energy_hour[key] = self._energy_hour.get(key, 0.0) + kwh
+            self._last_power[key] = (mono, float(value))
+
+    def _flush(self, hour: dt.datetime) -> None:
+        buckets, self._buckets = self._buckets, {}
+        energy, self._energy_hour = self._energy_hour, {}
+        if "recorder" not in self.hass.config.components:
+            return
+        self.hass.async_create_task(self._async_import(hour, buckets, energy))
+
+    async def _async_import(
+        self, hour: dt.datetime, buckets: dict[str, _Bucket], energy: dict[str, float]
+    ) -> None:
+        from homeassistant.components.recorder import get_instance
+        from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+
+        try:
+            from homeassistant.components.recorder.models import StatisticMeanType
+        except ImportError:  # HA < 2025.2, has_mean only
+            StatisticMeanType = None
+
+        def _mean(kind: str) -> dict[str, Any]:
+            if StatisticMeanType is None:
+                return {"has_mean": kind != "NONE"}
+            return {"mean_type": StatisticMeanType[kind]}
+        from homeassistant.components.recorder.statistics import (
+            async_add_external_statistics,
+            get_last_statistics,
+        )
+
+        name = self.coordinator.name
+        for key, bucket in buckets.items():
+            if not bucket.count:
+                continue
+            meta = StatisticMetaData(
+                **_mean("ARITHMETIC"),
+                has_sum=False,
+                name=f"{name} {key}",
+                source=DOMAIN,
+                statistic_id=self.statistic_id(key),
+                unit_of_measurement=MEAN_STATISTICS[key],
+            )
+            async_add_external_statistics(
+                self.hass,
+                meta,
+                [StatisticData(start=hour, mean=bucket.total / bucket.count, min=bucket.min, max=bucket.max)],
+            )
+
+        if self._energy_sum is None:
+            self._energy_sum = {}
+            for key, stat_key in ENERGY_STATISTICS.items():
+                last = await get_instance(self.hass).async_add_executor_job(
+                    get_last_statistics, self.hass, 1, self.statistic_id(stat_key), True, {"sum"}
+                )
+                rows = last.get(self.statistic_id(stat_key)) or []
+                self._energy_sum[key] = float(rows[0].get("sum") or 0.0) if rows else 0.0
+
+        for key, stat_key in ENERGY_STATISTICS.items():
+            kwh = energy.get(key, 0.0)
+            self._energy_sum[key] = self._energy_sum.get(key, 0.0) + kwh
+            meta = StatisticMetaData(
+                **_mean("NONE"),
+                has_sum=True,
+                name=f"{name} {stat_key}",
+                source=DOMAIN,
+                statistic_id=self.statistic_id(stat_key),
+                unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+            )
+            async_add_external_statistics(
+                self.hass,
+                meta,
+                [StatisticData(start=hour, state=kwh, sum=self._energy_sum[key])],
+            )
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from homeassistant.components.switch import SwitchEntity
 
-from .entity import FuturaEntity
+from .entity import FuturaEntity, async_add_entities_when_available
 from .coordinator import FuturaCoordinator
 
 
@@ -31,12 +31,10 @@ class FuturaRegSwitch(FuturaEntity, SwitchEntity):
         return bool(self.coordinator.data.get(self.avail_key, False))
 
     async def async_turn_on(self, **kwargs):
-        await self.coordinator._write_u16(self.address, 1)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_write(self.address, 1, context=self._context)
 
     async def async_turn_off(self, **kwargs):
-        await self.coordinator._write_u16(self.address, 0)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_write(self.address, 0, context=self._context)
 
 
 async def async_setup_entry(hass, entry, async_add_entities):
@@ -44,9 +42,12 @@ async def async_setup_entry(hass, entry, async_add_entities):
 
     ents = []
     ents.append(FuturaRegSwitch(coord, "Časový program", "time_program_raw", 12))
-    ents.append(FuturaRegSwitch(coord, "Bypass povolen", "bypass_enable_raw", 14, "bypass_available"))
-    ents.append(FuturaRegSwitch(coord, "Topení povoleno", "heating_enable_raw", 15, "heating_available"))
-    ents.append(FuturaRegSwitch(coord, "Chlazení povoleno", "cooling_enable_raw", 16, "cooling_available"))
     ents.append(FuturaRegSwitch(coord, "Komfortní režim", "comfort_enable_raw", 17))
-
-    async_add_entities(ents, True)
+    async_add_entities(ents)
+
+    # Feature switches only for units that have the feature
+    async_add_entities_when_available(coord, entry, async_add_entities, {
+        "bypass_available": lambda: [FuturaRegSwitch(coord, "Bypass povolen", "bypass_enable_raw", 14, "bypass_available")],
+        "heating_available": lambda: [FuturaRegSwitch(coord, "Topení povoleno", "heating_enable_raw", 15, "heating_available")],
+        "cooling_available": lambda: [FuturaRegSwitch(coord, "Chlazení povoleno", "cooling_enable_raw", 16, "cooling_available")],
+    })
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import logging
+from typing import Any, Mapping
+
+import numpy as np
+
+from .analytics import COL, SampleBuffer
+from .const import (
+    CONF_THERMAL_BYPASS_DELTA,
+    CONF_THERMAL_DWELL,
+    CONF_THERMAL_ENABLED,
+    CONF_THERMAL_HEATING_BELOW,
+    CONF_THERMAL_HORIZON,
+    DEFAULT_THERMAL_BYPASS_DELTA,
+    DEFAULT_THERMAL_DWELL,
+    DEFAULT_THERMAL_ENABLED,
+    DEFAULT_THERMAL_HEATING_BELOW,
+    DEFAULT_THERMAL_HORIZON,
+    KEYS,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+TREND_WINDOW = 3 * 3600.0     # s of buffered samples the trend is fitted on
+TREND_MIN_SAMPLES = 10
+TREND_MIN_SPAN = 20 * 60.0    # s the samples must cover
+PLAN_INTERVAL = 60.0          # s between two evaluations (= buffer spacing)
+COMFORT_BAND = 1.0            # °C above/below the setpoint that starts cooling/heating
+HYSTERESIS = 1.0              # °C a condition must recede before it is undone
+OVERRIDE_HOLD = 2 * 3600.0    # s the plan leaves a register alone after a manual change
+
+BYPASS = KEYS["bypass_enable_raw"]
+HEATING = KEYS["heating_enable_raw"]
+PLANNED_KEYS = {HEATING: "heating_enable_raw", BYPASS: "bypass_enable_raw"}
+
+
+def fit_trend(ts: np.ndarray, values: np.ndarray, now: float) -> tuple[float, float] | None:
+    """Weighted linear trend (value at 'now', slope per s); recent samples weigh more."""
+    ok = np.isfinite(values) & (ts >= now - TREND_WINDOW)
+    if ok.sum() < TREND_MIN_SAMPLES or np.ptp(ts[ok]) < TREND_MIN_SPAN:
+        return None
+    x = ts[ok] - now
+    weights = np.exp(x / (TREND_WINDOW / 2))
+    slope, intercept = np.polyfit(x, values[ok].astype(np.float64), 1, w=np.sqrt(weights))
+    return float(intercept), float(slope)
+
+
+class ThermalScheduler:
+    """Plans bypass and heating-enable ahead from the outdoor/indoor trend.
+
+    Works like the DCV loop: called right after every read, it returns the
+    register writes to make (or nothing). Both conditions are checked over the
+    whole horizon – the current value and the extrapolated one – so heating is
+    enabled before a cold front arrives and free cooling starts before the
+    house overheats. Hysteresis, a minimal dwell between two changes of the
+    same register and a hold-off after manual changes prevent toggling.
+    """
+
+    def __init__(self, options: Mapping[str, Any]) -> None:
+        self.enabled = bool(options.get(CONF_THERMAL_ENABLED, DEFAULT_THERMAL_ENABLED))
+        self.horizon = float(options.get(CONF_THERMAL_HORIZON, DEFAULT_THERMAL_HORIZON)) * 60.0
+        self.heating_below = float(options.get(CONF_THERMAL_HEATING_BELOW, DEFAULT_THERMAL_HEATING_BELOW))
+        self.bypass_delta = float(options.get(CONF_THERMAL_BYPASS_DELTA, DEFAULT_THERMAL_BYPASS_DELTA))
+        self.dwell = float(options.get(CONF_THERMAL_DWELL, DEFAULT_THERMAL_DWELL)) * 60.0
+
+        self.forecast: dict[str, float | None] = {"temp_outdoor": None, "temp_extract": None}
+        self._evaluated_at: float | None = None
+        self._changed_at: dict[int, float] = {}
+        self._written: dict[int, int] = {}      # our writes not yet read back
+        self._observed: dict[int, int] = {}     # value seen by the previous read
+        self._hold_until: dict[int, float] = {}
+
+    def _forecast(self, buffer: SampleBuffer, key: str, now: float) -> tuple[float, float] | None:
+        """(current, forecast at now + horizon) of a buffered column."""
+        ts, values = buffer.view(since=now - TREND_WINDOW)
+        trend = fit_trend(ts, values[:, COL[key]], now)
+        if trend is None:
+            return None
+        current, slope = trend
+        return current, current + slope * self.horizon
+
+    def _heating_target(self, out: tuple[float, float], ind: tuple[float, float], setpoint: float, on: bool) -> int:
+        coldest_out, coldest_in = min(out), min(ind)
+        if not on:
+            return int(coldest_out < self.heating_below or coldest_in < setpoint - COMFORT_BAND)
+        return int(not (coldest_out > self.heating_below + HYSTERESIS and coldest_in >= setpoint))
+
+    def _bypass_target(self, out: tuple[float, float], ind: tuple[float, float], setpoint: float, on: bool) -> int:
+        # Free cooling: the house is (or gets) too warm and outdoor air stays cooler
+        margin = min(ind) - max(out)
+        if not on:
+            return int(max(ind) > setpoint + COMFORT_BAND and margin >= self.bypass_delta)
+        return int(max(ind) > setpoint and margin >= self.bypass_delta - HYSTERESIS)
+
+    def _observe(self, data: Mapping[str, Any], now: float) -> None:
+        """Start the hold-off on every change of a planned register we did not write."""
+        for address, key in PLANNED_KEYS.items():
+            if data.get(key) is None:
+                continue
+            current = int(data[key])
+            previous = self._observed.get(address)
+            self._observed[address] = current
+            if address in self._written and current == self._written[address]:
+                del self._written[address]
+            elif previous is not None and current != previous:
+                # Switched by hand (or by something else) – respect that for a while
+                self._hold_until[address] = now + OVERRIDE_HOLD
+                self._written.pop(address, None)
+
+    def evaluate(self, buffer: SampleBuffer, data: Mapping[str, Any], now: float) -> dict[int, int]:
+        """Return {register: value} to write now (empty when nothing changes)."""
+        if not self.enabled:
+            return {}
+        self._observe(data, now)
+        if self._evaluated_at is not None and now - self._evaluated_at < PLAN_INTERVAL:
+            return {}
+        self._evaluated_at = now
+
+        out = self._forecast(buffer, "temp_outdoor", now)
+        ind = self._forecast(buffer, "temp_extract", now)
+        self.forecast = {
+            "temp_outdoor": None if out is None else round(out[1], 1),
+            "temp_extract": None if ind is None else round(ind[1], 1),
+        }
+        if out is None or ind is None:
+            return {}
+        setpoint = float(data.get("temp_set_raw") or 22.0)
+
+        targets: dict[int, int] = {}
+        if data.get("heating_available"):
+            targets[HEATING] = self._heating_target(out, ind, setpoint, bool(data.get("heating_enable_raw")))
+        if data.get("bypass_available"):
+            bypass = self._bypass_target(out, ind, setpoint, bool(data.get("bypass_enable_raw")))
+            # Never cool with outdoor air while heating is planned
+            targets[BYPASS] = 0 if targets.get(HEATING) else bypass
+
+        writes: dict[int, int] = {}
+        for address, target in targets.items():
+            key = PLANNED_KEYS[address]
+            current = int(data.get(key, 0) or 0)
+            if now < self._hold_until.get(address, 0.0) or target == current:
+                continue
+            if now - self._changed_at.get(address, float("-inf")) < self.dwell:
+                continue
+            _LOGGER.debug(
+                "Thermal plan %s -> %s (outdoor %.1f→%.1f °C, indoor %.1f→%.1f °C, setpoint %.1f °C)",
+                key, target, *out, *ind, setpoint,
+            )
+            writes[address] = target
+            self._changed_at[address] = now
+            self._written[address] = target
+        return writes
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import math
+from typing import Any, Mapping
+
+# Countdown registers (device seconds) and the derived key shown in min / h
+COUNTDOWNS: dict[str, tuple[str | None, int]] = {
+    "boost_remaining_s": ("boost_remaining_min", 60),
+    "circulation_remaining_s": ("circulation_remaining_min", 60),
+    "night_remaining_s": ("night_remaining_h", 3600),
+    "party_remaining_s": ("party_remaining_h", 3600),
+    "overpressure_remaining_s": (None, 60),
+}
+
+# The counters have 1 s resolution, so the rate is only measured over long
+# baselines: from the moment a running timer was first seen (its anchor).
+MIN_BASELINE = 600.0          # host s before a baseline replaces the assumed rate 1.0
+DRIFT_MIN_BASELINE = 3600.0   # host s before the drift is published (±1 s ≈ ±280 ppm)
+RATE_TOLERANCE = 0.1          # deviation from the anchor beyond this is a user change
+ANCHOR_SLACK = 2.0            # device s of quantization/poll jitter always accepted
+MIN_TICK = 1.0
+
+
+def derive_countdown_fields(data: dict[str, Any]) -> None:
+    """Fill the rounded-up minute/hour helpers from the *_remaining_s values."""
+    for key, (derived, unit) in COUNTDOWNS.items():
+        if derived is None:
+            continue
+        s = int(data.get(key, 0) or 0)
+        data[derived] = 0 if s == 0 else (s + unit - 1) // unit
+
+
+class CountdownTracker:
+    """Interpolates device countdown timers between polls.
+
+    The device decrements its timers by its own clock. How far a running
+    timer fell since it was anchored, compared with the host's monotonic
+    clock over the same time, gives the device/host clock rate; the longest
+    baseline seen so far wins, since the 1 s counter resolution dominates
+    short ones. The remaining time is projected locally with that rate and
+    expiries are predicted.
+    """
+
+    def __init__(self) -> None:
+        self.rate = 1.0
+        self.baseline = 0.0
+        self._read: dict[str, tuple[float, int]] = {}
+        self._anchor: dict[str, tuple[float, int]] = {}
+
+    @property
+    def drift_ppm(self) -> float | None:
+        if self.baseline < DRIFT_MIN_BASELINE:
+            return None
+        return round((self.rate - 1.0) * 1_000_000)
+
+    def observe(self, data: Mapping[str, Any], mono: float) -> None:
+        for key in COUNTDOWNS:
+            value = int(data.get(key, 0) or 0)
+            self._read[key] = (mono, value)
+            anchor = self._anchor.get(key)
+            if value <= 0:
+                self._anchor.pop(key, None)
+                continue
+            if anchor is None:
+                self._anchor[key] = (mono, value)
+                continue
+            elapsed = mono - anchor[0]
+            fell = anchor[1] - value
+            if abs(fell - elapsed) > ANCHOR_SLACK + RATE_TOLERANCE * elapsed:
+                # Set or extended by the user – start a new baseline
+                self._anchor[key] = (mono, value)
+            elif elapsed >= MIN_BASELINE and elapsed > self.baseline:
+                self.rate = fell / elapsed
+                self.baseline = elapsed
+
+    def remaining(self, key: str, mono: float) -> float:
+        """Device seconds left on 'key' at host time 'mono'."""
+        read_at, value = self._read.get(key, (mono, 0))
+        return max(0.0, value - self.rate * (mono - read_at))
+
+    def interpolate(self, mono: float) -> dict[str, Any]:
+        """Projected *_remaining_s values and their derived helpers."""
+        out: dict[str, Any] = {
+            key: int(math.ceil(self.remaining(key, mono))) for key in COUNTDOWNS if key in self._read
+        }
+        derive_countdown_fields(out)
+        return out
+
+    def expired(self, mono: float) -> bool:
+        """A timer that was running at the last read has run out by now."""
+        return any(
+            value > 0 and self.remaining(key, mono) <= 0 for key, (_, value) in self._read.items()
+        )
+
+    def next_tick(self, mono: float) -> float | None:
+        """Host seconds until a shown value changes or a timer expires."""
+        delays: list[float] = []
+        for key, (_, unit) in COUNTDOWNS.items():
+            left = self.remaining(key, mono)
+            if left <= 0:
+                continue
+            # ceil(left / unit) drops once left reaches the previous multiple of unit
+            step = left - unit * (math.ceil(left / unit) - 1)
+            delays.append(max(MIN_TICK, step / self.rate))
+        return min(delays) if delays else None
@@ -0,0 +1,94 @@
+"""Setup time and memory of N simulated Futura units.
+
+    python scripts/benchmark_setup.py              # 1, 10 and 50 units
+    python scripts/benchmark_setup.py --units 5 8  # custom counts
+
+Every count runs in a fresh interpreter so RSS is not polluted by the
+previous run. Entities are added to real entity platforms, so setup
+includes registry entries and the first state writes. Requires homeassistant and pymodbus to be importable.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+
+def _rss_kib() -> int:
+    try:
+        with open("/proc/self/statm") as fh:
+            pages = int(fh.read().split()[1])
+        return pages * resource.getpagesize() // 1024
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+async def _child(units: int) -> dict:
+    from homeassistant.core import HomeAssistant
+
+    from simulator import async_prepare_hass, async_setup_simulated_units
+
+    # Import cost is paid once per process, keep it out of the per-unit numbers
+    from custom_components.jablotron_futura import (  # noqa: F401
+        binary_sensor, button, number, select, sensor, switch,
+    )
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        await async_prepare_hass(hass)
+        rss_before = _rss_kib()
+        start = time.perf_counter()
+        setup = await async_setup_simulated_units(hass, units)
+        elapsed = time.perf_counter() - start
+        rss_after = _rss_kib()
+        for coordinator, _, unloads in setup:
+            for unload in unloads:
+                unload()
+            await coordinator.async_close()
+        await hass.async_stop(force=True)
+    entities = sum(len(e) for _, e, _ in setup)
+    return {
+        "units": units,
+        "entities": entities,
+        "setup_s": round(elapsed, 4),
+        "setup_ms_per_unit": round(elapsed * 1000 / units, 2),
+        "rss_delta_kib": rss_after - rss_before,
+        "rss_kib_per_unit": round((rss_after - rss_before) / units, 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--units", type=int, nargs="+", default=[1, 10, 50])
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(asyncio.run(_child(args.units[0]))))
+        return
+
+    print(f"{'units':>5} {'entities':>8} {'setup s':>8} {'ms/unit':>8} {'RSS KiB':>8} {'KiB/unit':>8}")
+    for units in args.units:
+        out = subprocess.run(
+            [sys.executable, __file__, "--child", "--units", str(units)],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        r = json.loads(out.stdout.strip().splitlines()[-1])
+        print(
+            f"{r['units']:>5} {r['entities']:>8} {r['setup_s']:>8} {r['setup_ms_per_unit']:>8}"
+            f" {r['rss_delta_kib']:>8} {r['rss_kib_per_unit']:>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Profile setup plus N refresh cycles against simulated Futura units.
+
+    python scripts/profile_cycles.py                          # 1 unit, 200 cycles
+    python scripts/profile_cycles.py --units 10 --cycles 500 --latency 0.002
+    python scripts/profile_cycles.py --prof cycles.prof --all # full stats, not only this integration
+
+All platforms are loaded and every entity is added to a real entity platform,
+so fan-out includes entity property evaluation and state machine writes.
+Prints per-phase timings (I/O, decode, fan-out), the cProfile functions of
+the integration and the top tracemalloc allocators. Requires homeassistant
+and pymodbus to be importable.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import cProfile
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from simulator import async_prepare_hass, async_setup_simulated_units  # noqa: E402
+
+
+async def _run(args: argparse.Namespace) -> None:
+    from custom_components.jablotron_futura.profiling import (
+        format_cprofile,
+        format_tracemalloc,
+    )
+
+    restrict = None if args.all else "jablotron_futura"
+    tracemalloc.start(10)
+    profiler = cProfile.Profile()
+    with tempfile.TemporaryDirectory() as config_dir:
+        from homeassistant.core import HomeAssistant
+
+        hass = HomeAssistant(config_dir)
+        await async_prepare_hass(hass)
+        profiler.enable()
+        start = time.perf_counter()
+        setup = await async_setup_simulated_units(
+            hass, args.units, alfa_bits=args.alfa_bits, latency=args.latency
+        )
+        setup_s = time.perf_counter() - start
+
+        for coordinator, _, _ in setup:
+            coordinator.phases.reset()
+        start = time.perf_counter()
+        for _ in range(args.cycles):
+            await asyncio.gather(*(c.async_refresh() for c, _, _ in setup))
+        cycles_s = time.perf_counter() - start
+        profiler.disable()
+        snapshot = tracemalloc.take_snapshot()
+
+        failed = sum(not c.last_update_success for c, _, _ in setup)
+        for coordinator, _, unloads in setup:
+            for unload in unloads:
+                unload()
+            await coordinator.async_close()
+        await hass.async_stop(force=True)
+
+    entities = sum(len(e) for _, e, _ in setup)
+    print(f"units {args.units}, entities {entities}, states {len(hass.states.async_all())}")
+    print(f"setup   {setup_s * 1000:10.1f} ms")
+    print(
+        f"cycles  {cycles_s * 1000:10.1f} ms for {args.cycles} cycles"
+        f" ({cycles_s * 1000 / args.cycles:.3f} ms per cycle of all units){' – FAILED' if failed else ''}"
+    )
+    for coordinator, _, _ in setup[: args.show_units]:
+        print(f"\n== Phases {coordinator.host}\n{coordinator.phases.format()}")
+    print(f"\n== cProfile (cumulative{', ' + restrict + ' only' if restrict else ''})")
+    print(format_cprofile(profiler, args.limit, restrict))
+    print("== tracemalloc top allocators")
+    print(format_tracemalloc(snapshot, args.limit, restrict))
+    if args.prof:
+        profiler.dump_stats(args.prof)
+        print(f"\nFull cProfile stats written to {args.prof}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--units", type=int, default=1)
+    parser.add_argument("--cycles", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.0, help="simulated Modbus latency per request (s)")
+    parser.add_argument("--alfa-bits", type=lambda v: int(v, 0), default=0b11, help="connected ALFA slots, e.g. 0b11")
+    parser.add_argument("--limit", type=int, default=30, help="rows of cProfile/tracemalloc output")
+    parser.add_argument("--show-units", type=int, default=1, help="units whose phase timings are printed")
+    parser.add_argument("--prof", help="write full cProfile stats to this file")
+    parser.add_argument("--all", action="store_true", help="do not restrict output to the integration")
+    asyncio.run(_run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
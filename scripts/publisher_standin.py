@@ -0,0 +1,121 @@
+"""Local stand-in for the broker/endpoint the telemetry publisher sends to.
+
+    python scripts/publisher_standin.py                       # MQTT on :1883
+    python scripts/publisher_standin.py --websocket --port 8765
+    python scripts/publisher_standin.py --slow 2.0            # simulate a slow consumer
+
+Accepts the publisher's MQTT 3.1.1 (QoS 0) or websocket connection, decodes
+every message (JSON or binary) and prints sequence, size and changed field
+count. --slow delays reading to exercise the publisher's backpressure
+handling. The websocket mode needs aiohttp (installed with homeassistant).
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import struct
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+
+def _describe(payload: bytes) -> str:
+    from custom_components.jablotron_futura.publisher import BINARY_MAGIC, decode_binary
+
+    msg = decode_binary(payload) if payload.startswith(BINARY_MAGIC) else json.loads(payload)
+    kind = "full " if msg["full"] else "delta"
+    return f"seq {msg['seq']:>6} {kind} {len(payload):>6} B {len(msg['data']):>4} fields"
+
+
+async def _read_packet(reader: asyncio.StreamReader) -> tuple[int, bytes]:
+    kind = (await reader.readexactly(1))[0]
+    length = shift = 0
+    while True:
+        byte = (await reader.readexactly(1))[0]
+        length |= (byte & 0x7F) << shift
+        shift += 7
+        if not byte & 0x80:
+            break
+    return kind, await reader.readexactly(length)
+
+
+async def _mqtt_client(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, slow: float) -> None:
+    peer = writer.get_extra_info("peername")
+    try:
+        while True:
+            kind, body = await _read_packet(reader)
+            packet = kind >> 4
+            if packet == 1:      # CONNECT
+                client_id_len = struct.unpack_from(">H", body, 10)[0]
+                print(f"{peer} CONNECT {body[12:12 + client_id_len].decode()}")
+                writer.write(b"\x20\x02\x00\x00")
+            elif packet == 3:    # PUBLISH (QoS 0)
+                topic_len = struct.unpack_from(">H", body)[0]
+                topic = body[2:2 + topic_len].decode()
+                print(f"{topic}  {_describe(body[2 + topic_len:])}")
+                if slow:
+                    await asyncio.sleep(slow)
+            elif packet == 12:   # PINGREQ
+                writer.write(b"\xd0\x00")
+            elif packet == 14:   # DISCONNECT
+                break
+            await writer.drain()
+    except asyncio.IncompleteReadError:
+        pass
+    print(f"{peer} closed")
+    writer.close()
+
+
+async def _serve_mqtt(port: int, slow: float) -> None:
+    server = await asyncio.start_server(lambda r, w: _mqtt_client(r, w, slow), "0.0.0.0", port)
+    print(f"MQTT stand-in listening on :{port}")
+    async with server:
+        await server.serve_forever()
+
+
+async def _serve_websocket(port: int, slow: float) -> None:
+    from aiohttp import WSMsgType, web
+
+    async def handler(request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        print(f"{request.remote} websocket connected")
+        async for msg in ws:
+            if msg.type in (WSMsgType.TEXT, WSMsgType.BINARY):
+                data = msg.data.encode() if msg.type == WSMsgType.TEXT else msg.data
+                print(_describe(data))
+                if slow:
+                    await asyncio.sleep(slow)
+        print(f"{request.remote} closed")
+        return ws
+
+    app = web.Application()
+    app.router.add_get("/{tail:.*}", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, "0.0.0.0", port).start()
+    print(f"websocket stand-in listening on ws://0.0.0.0:{port}/")
+    await asyncio.Event().wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--websocket", action="store_true", help="serve a websocket instead of MQTT")
+    parser.add_argument("--port", type=int, help="listen port (1883 for MQTT, 8765 for websocket)")
+    parser.add_argument("--slow", type=float, default=0.0, help="s to wait after every message")
+    args = parser.parse_args()
+    try:
+        if args.websocket:
+            asyncio.run(_serve_websocket(args.port or 8765, args.slow))
+        else:
+            asyncio.run(_serve_mqtt(args.port or 1883, args.slow))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""Replay a captured Modbus trace through FuturaCoordinator.
+
+    python scripts/replay_trace.py trace.jsonl.gz               # as fast as possible
+    python scripts/replay_trace.py trace.jsonl.gz --realtime    # recorded latencies
+    python scripts/replay_trace.py --record sim.jsonl.gz --cycles 200   # trace of the simulator
+
+Traces come from the jablotron_futura.capture_traffic service. The replay
+runs refresh cycles until the trace has no more answers (or --cycles) and
+prints per-cycle timings, so parsing and scheduling changes can be compared
+against real traffic. Requires homeassistant and pymodbus to be importable.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from simulator import SimulatedFuturaClient  # noqa: E402
+
+
+async def _record(path: str, cycles: int) -> None:
+    from homeassistant.const import CONF_HOST
+    from homeassistant.core import HomeAssistant
+
+    from custom_components.jablotron_futura.coordinator import FuturaCoordinator
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        client = SimulatedFuturaClient(alfa_bits=0b101)
+        coordinator = FuturaCoordinator(hass, {CONF_HOST: "sim"}, client_factory=lambda: client)
+        await coordinator.async_start_capture(path, 24 * 3600)
+        for _ in range(cycles):
+            await coordinator.async_refresh()
+        await coordinator.async_close()
+        await hass.async_stop(force=True)
+    print(f"{cycles} simulated cycles recorded to {path}")
+
+
+async def _replay(path: str, cycles: int | None, realtime: bool) -> None:
+    from homeassistant.const import CONF_HOST
+    from homeassistant.core import HomeAssistant
+
+    from custom_components.jablotron_futura.capture import ReplayClient, load_trace
+    from custom_components.jablotron_futura.coordinator import FuturaCoordinator
+
+    header, records = load_trace(path)
+    client = ReplayClient(records, realtime=realtime)
+    timings: list[float] = []
+    failures = 0
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        coordinator = FuturaCoordinator(
+            hass,
+            {CONF_HOST: header.get("host") or "replay", "unit_id": header.get("unit", 1)},
+            header.get("options"),
+            client_factory=lambda: client,
+        )
+        # Same read plan and tier phase as the captured coordinator
+        coordinator.planner.spans = {
+            name: {int(a): int(n) for a, n in spans.items()}
+            for name, spans in (header.get("spans") or {}).items()
+        }
+        coordinator.poll_count = int(header.get("poll_count") or 0)
+        while cycles is None or len(timings) < cycles:
+            served = client.served
+            start = time.perf_counter()
+            await coordinator.async_refresh()
+            elapsed = time.perf_counter() - start
+            if client.exhausted or client.served == served:
+                break  # trace exhausted
+            timings.append(elapsed)
+            failures += not coordinator.last_update_success
+        await coordinator.async_close()
+        await hass.async_stop(force=True)
+
+    if not timings:
+        print("No cycle could be replayed")
+        return
+    ms = sorted(t * 1000 for t in timings)
+    print(f"trace      {path} ({header.get('host')}, variant {header.get('variant')}, {len(records)} records)")
+    print(f"cycles     {len(timings)} ({failures} failed), {client.served} answers served")
+    print(
+        f"cycle ms   mean {statistics.fmean(ms):.3f}  p50 {ms[len(ms) // 2]:.3f}"
+        f"  p95 {ms[min(len(ms) - 1, int(len(ms) * 0.95))]:.3f}  max {ms[-1]:.3f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("trace", nargs="?", help="trace to replay")
+    parser.add_argument("--record", metavar="PATH", help="record a trace of the simulator instead")
+    parser.add_argument("--cycles", type=int, help="number of refresh cycles")
+    parser.add_argument("--realtime", action="store_true", help="delay answers by the recorded durations")
+    args = parser.parse_args()
+
+    if args.record:
+        asyncio.run(_record(args.record, args.cycles or 100))
+    elif args.trace:
+        asyncio.run(_replay(args.trace, args.cycles, args.realtime))
+    else:
+        parser.error("a trace or --record is required")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+"""Simulated Futura Modbus unit for offline benchmarks and profiling.
+
+SimulatedFuturaClient has the subset of the pymodbus AsyncModbusTcpClient
+interface the coordinator uses and can be passed as its client_factory.
+Addresses outside the legal spans answer ILLEGAL DATA ADDRESS like the real
+unit does.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import random
+import sys
+from collections import defaultdict
+from datetime import timedelta
+from pathlib import Path
+from types import SimpleNamespace
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+ILLEGAL_DATA_ADDRESS = 0x02
+
+LEGAL_INPUT = [(14, 21), (30, 48), (52, 52), (75, 75)] + [
+    (160 + i * 10, 165 + i * 10) for i in range(8)
+]
+LEGAL_HOLDING = [(0, 17)]
+
+
+class SimulatedResponse:
+    def __init__(self, registers: list[int] | None = None, exception_code: int | None = None) -> None:
+        self.registers = registers or []
+        self.exception_code = exception_code
+
+    def isError(self) -> bool:  # noqa: N802 – pymodbus API
+        return self.exception_code is not None
+
+    def __str__(self) -> str:
+        if self.isError():
+            return f"ExceptionResponse(exception_code={self.exception_code})"
+        return f"ReadResponse({self.registers})"
+
+
+def _legal(spans: list[tuple[int, int]], address: int, count: int) -> bool:
+    return any(first <= address and address + count - 1 <= last for first, last in spans)
+
+
+class SimulatedFuturaClient:
+    """In-memory Futura with slowly drifting temperatures and CO₂."""
+
+    def __init__(self, *, alfa_bits: int = 0b1, latency: float = 0.0, seed: int = 0) -> None:
+        self.connected = False
+        self.latency = latency
+        self._rng = random.Random(seed)
+        self._tick = 0
+        self.input = [0] * 256
+        self.holding = [0] * 64
+        self.input[14] = 1            # variant
+        self.input[15] = 0x9          # internal heater + bypass
+        self.input[75] = alfa_bits
+        for i in range(8):
+            self.input[160 + i * 10] = 10 + i
+        self.holding[0] = 2
+        self.holding[10] = 220
+        self.holding[11] = 500
+        self._step()
+
+    def _step(self) -> None:
+        self._tick += 1
+        t = self._tick / 100.0
+        u16 = lambda v: int(round(v)) & 0xFFFF  # noqa: E731
+        self.input[30] = u16(50 + 30 * math.sin(t))                 # outdoor
+        self.input[31] = u16(190 + 5 * math.sin(t))                 # supply
+        self.input[32] = u16(220 + self._rng.uniform(-2, 2))        # extract
+        self.input[33] = u16(80 + 20 * math.sin(t))                 # exhaust
+        for addr, base in ((34, 800), (35, 400), (36, 450), (37, 700)):
+            self.input[addr] = u16(base + self._rng.uniform(-10, 10))
+        self.input[38] = self.input[30]
+        self.input[40] = 20 + self._tick // 10_000
+        self.input[41] = u16(40 + self._rng.uniform(-3, 3))
+        self.input[42] = u16(900 + 200 * math.sin(t))
+        self.input[44] = u16(150 + 20 * self.holding[0])
+        self.input[45] = self.input[46] = u16(20 + 10 * self.holding[0])
+        self.input[47] = u16(1200 + 150 * self.holding[0])
+        self.input[48] = u16(1180 + 150 * self.holding[0])
+        self.input[52] = 3000
+        for i in range(8):
+            base = 160 + i * 10
+            self.input[base + 2] = u16(700 + 300 * (1 + math.sin(t + i)))
+            self.input[base + 3] = u16(215 + self._rng.uniform(-3, 3))
+            self.input[base + 4] = u16(480 + self._rng.uniform(-20, 20))
+            self.input[base + 5] = self.input[base + 3]
+
+    async def connect(self) -> bool:
+        self.connected = True
+        return True
+
+    def close(self) -> None:
+        self.connected = False
+
+    async def _answer(self, table: list[int], spans, address: int, count: int) -> SimulatedResponse:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if not _legal(spans, address, count):
+            return SimulatedResponse(exception_code=ILLEGAL_DATA_ADDRESS)
+        return SimulatedResponse(table[address:address + count])
+
+    async def read_input_registers(self, address: int, count: int = 1, **kwargs) -> SimulatedResponse:
+        if address == 14:
+            self._step()
+        return await self._answer(self.input, LEGAL_INPUT, address, count)
+
+    async def read_holding_registers(self, address: int, count: int = 1, **kwargs) -> SimulatedResponse:
+        return await self._answer(self.holding, LEGAL_HOLDING, address, count)
+
+    async def write_register(self, address: int, value: int, **kwargs) -> SimulatedResponse:
+        return await self.write_registers(address, [value])
+
+    async def write_registers(self, address: int, values: list[int], **kwargs) -> SimulatedResponse:
+        if not _legal(LEGAL_HOLDING, address, len(values)):
+            return SimulatedResponse(exception_code=ILLEGAL_DATA_ADDRESS)
+        self.holding[address:address + len(values)] = values
+        return SimulatedResponse(list(values))
+
+
+class _CollectingPlatform:
+    def __init__(self) -> None:
+        self.entities: list = []
+
+    def __call__(self, entities, update_before_add: bool = False) -> None:
+        self.entities.extend(entities)
+
+
+async def async_prepare_hass(hass) -> None:
+    """What bootstrap would have set up before entity platforms are used."""
+    from homeassistant.helpers import (
+        device_registry as dr,
+        entity as entity_helper,
+        entity_registry as er,
+        restore_state,
+    )
+
+    entity_helper.async_setup(hass)
+    await dr.async_load(hass)
+    await er.async_load(hass)
+    await restore_state.async_load(hass)
+
+
+async def async_add_to_platforms(hass, entities: list) -> None:
+    """Add entities to real entity platforms (registry, state machine writes)."""
+    from homeassistant.helpers.entity_platform import EntityPlatform
+
+    from custom_components.jablotron_futura.const import DOMAIN
+
+    by_domain: dict[str, list] = defaultdict(list)
+    for entity in entities:
+        by_domain[type(entity).__module__.rsplit(".", 1)[1]].append(entity)
+    for domain, group in by_domain.items():
+        platform = EntityPlatform(
+            hass=hass,
+            logger=logging.getLogger(__name__),
+            domain=domain,
+            platform_name=DOMAIN,
+            platform=None,
+            scan_interval=timedelta(seconds=30),
+            entity_namespace=None,
+        )
+        await platform.async_add_entities(group)
+
+
+async def async_setup_simulated_units(hass, count: int, *, alfa_bits: int = 0b1, latency: float = 0.0):
+    """Create 'count' coordinators on simulated units with all platform entities.
+
+    Returns a list of (coordinator, entities, unloads). Entities are built
+    through each platform's async_setup_entry and added to real entity
+    platforms, so 'hass' must have been prepared with async_prepare_hass.
+    """
+    from homeassistant.const import CONF_HOST
+
+    from custom_components.jablotron_futura import (
+        binary_sensor,
+        button,
+        number,
+        select,
+        sensor,
+        switch,
+    )
+    from custom_components.jablotron_futura.const import DOMAIN
+    from custom_components.jablotron_futura.coordinator import FuturaCoordinator
+
+    units = []
+    for n in range(count):
+        unloads: list = []
+        entry = SimpleNamespace(
+            entry_id=f"sim{n}",
+            data={CONF_HOST: f"sim-{n}"},
+            options={},
+            async_on_unload=unloads.append,
+        )
+        client = SimulatedFuturaClient(alfa_bits=alfa_bits, latency=latency, seed=n)
+        coordinator = FuturaCoordinator(hass, entry.data, entry.options, client_factory=lambda c=client: c)
+        await coordinator.async_refresh()
+        hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
+        collect = _CollectingPlatform()
+        for platform in (sensor, binary_sensor, switch, select, number, button):
+            await platform.async_setup_entry(hass, entry, collect)
+        await async_add_to_platforms(hass, collect.entities)
+        units.append((coordinator, collect.entities, unloads))
+    return units
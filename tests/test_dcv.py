@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import pytest
+
+from custom_components.jablotron_futura.dcv import DemandControl, parse_curve
+
+OPTIONS = {"dcv_enabled": True, "dcv_dwell_up": 60, "dcv_dwell_down": 600}
+
+
+def _data(mode: int, co2: float, humi: float = 40.0) -> dict:
+    return {"mode_raw": mode, "alfa_1_available": True, "alfa_co2_1": co2, "alfa_humi_1": humi}
+
+
+def test_parse_curve_sorts_and_validates() -> None:
+    assert parse_curve("1000:3, 800:2") == [(800.0, 2), (1000.0, 3)]
+    with pytest.raises(ValueError):
+        parse_curve("800:9")
+
+
+def test_first_evaluation_adopts_level_without_writing() -> None:
+    dcv = DemandControl(OPTIONS)
+    assert dcv.evaluate(_data(4, 900), 0) is None
+    # 900 ppm is within the hysteresis of the 1000 ppm step below level 4
+    assert dcv.level == 3
+    # Readings unchanged – the hand-set level 4 stays
+    assert dcv.evaluate(_data(4, 900), 1000) is None
+
+
+def test_level_rises_at_once_and_drops_after_hysteresis_and_dwell() -> None:
+    dcv = DemandControl(OPTIONS)
+    dcv.evaluate(_data(2, 900), 0)
+    assert dcv.evaluate(_data(2, 1250), 10) == 4
+    # 1150 ppm is within the 100 ppm hysteresis below the 1200 step
+    assert dcv.evaluate(_data(4, 1150), 20) is None
+    # Below the hysteresis, but the dwell before lowering has not passed
+    assert dcv.evaluate(_data(4, 1050), 30) is None
+    assert dcv.evaluate(_data(4, 1050), 700) == 3
+
+
+def test_manual_change_is_kept_until_target_changes() -> None:
+    dcv = DemandControl(OPTIONS)
+    dcv.evaluate(_data(2, 900), 0)
+    assert dcv.evaluate(_data(5, 900), 1000) is None
+    assert dcv.evaluate(_data(5, 1100), 2000) == 3
+
+
+def test_auto_and_off_are_left_alone() -> None:
+    dcv = DemandControl(OPTIONS)
+    assert dcv.evaluate(_data(6, 1600), 0) is None
+    assert dcv.evaluate(_data(0, 1600), 10) is None
+    assert dcv.level is None
+
+
+def test_humidity_curve_can_raise_the_level() -> None:
+    dcv = DemandControl(OPTIONS)
+    dcv.evaluate(_data(1, 500, 40), 0)
+    assert dcv.evaluate(_data(1, 500, 80), 10) == 3
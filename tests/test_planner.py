@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.jablotron_futura.dump import ILLEGAL_DATA_ADDRESS
+from custom_components.jablotron_futura.planner import ReadPlanner, SpanCache
+
+# Input registers 22..29 and 49..51 answer ILLEGAL DATA ADDRESS
+ILLEGAL_INPUT = set(range(22, 30)) | set(range(49, 52))
+
+
+class _Response:
+    def __init__(self, count: int, exception_code: int | None = None) -> None:
+        self.registers = [0] * count
+        self.exception_code = exception_code
+
+    def isError(self) -> bool:  # noqa: N802
+        return self.exception_code is not None
+
+
+class _Unit:
+    host = "test"
+
+    def __init__(self) -> None:
+        self.requests: list[tuple[int, int]] = []
+
+    async def _read_raw(self, start: int, count: int, *, input_regs: bool) -> _Response:
+        self.requests.append((start, count))
+        illegal = ILLEGAL_INPUT if input_regs else set()
+        if any(a in illegal for a in range(start, start + count)):
+            return _Response(0, ILLEGAL_DATA_ADDRESS)
+        return _Response(count)
+
+
+def _run(test, tmp_path: Path) -> None:
+    async def run() -> None:
+        hass = HomeAssistant(str(tmp_path))
+        try:
+            await test(hass)
+        finally:
+            await hass.async_stop(force=True)
+
+    asyncio.run(run())
+
+
+def test_plan_uses_default_blocks_without_spans(tmp_path: Path) -> None:
+    async def test(hass: HomeAssistant) -> None:
+        planner = ReadPlanner(hass)
+        assert planner.plan("input_main", [14, 15, 30, 31, 34]) == [(14, 2), (30, 2), (34, 1)]
+
+    _run(test, tmp_path)
+
+
+def test_probe_finds_largest_legal_spans(tmp_path: Path) -> None:
+    async def test(hass: HomeAssistant) -> None:
+        planner = ReadPlanner(hass)
+        spans = await planner.async_probe(_Unit())
+        assert spans["input_main"][14] == 8      # stops before the hole at 22
+        assert spans["input_main"][30] == 19     # 30..48
+        assert spans["holding_main"][0] == 18
+        planner.spans = spans
+        assert planner.plan("input_main", [14, 21, 30, 40, 48]) == [(14, 8), (30, 19)]
+
+    _run(test, tmp_path)
+
+
+def test_learn_from_map_uses_single_requests_only(tmp_path: Path) -> None:
+    async def test(hass: HomeAssistant) -> None:
+        planner = ReadPlanner(hass)
+        planner.learn_from_map({"input": {"legal": [(0, 48)], "reads": [(0, 20), (20, 2)]}})
+        assert planner.spans["input_main"][14] == 6      # 14..19, not up to 48
+        assert planner.spans["input_main"][20] == 2
+        assert 30 not in planner.spans["input_main"]
+
+    _run(test, tmp_path)
+
+
+def test_forget_drops_only_the_failing_span(tmp_path: Path) -> None:
+    async def test(hass: HomeAssistant) -> None:
+        planner = ReadPlanner(hass)
+        await planner.async_setup(_Unit(), 1)
+        await planner.async_forget("input_main", 30)
+        assert 30 not in planner.spans["input_main"]
+        assert planner.spans["input_main"][14] == 8
+
+        stored = await SpanCache(hass).async_get(1)
+        assert 30 not in stored["input_main"]
+        assert stored["input_main"][14] == 8
+
+    _run(test, tmp_path)
+
+
+def test_units_starting_together_keep_all_variants(tmp_path: Path) -> None:
+    async def test(hass: HomeAssistant) -> None:
+        units = [_Unit() for _ in range(3)]
+        planners = [ReadPlanner(hass) for _ in units]
+        await asyncio.gather(
+            *(p.async_setup(u, v) for p, u, v in zip(planners, units, (1, 2, 1)))
+        )
+        fresh = SpanCache(hass)
+        assert await fresh.async_get(1) is not None
+        assert await fresh.async_get(2) is not None
+        # The second unit of variant 1 reused the probe of the first one
+        assert sorted(bool(u.requests) for u in units) == [False, True, True]
+
+    _run(test, tmp_path)
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from homeassistant.exceptions import HomeAssistantError
+
+from custom_components.jablotron_futura.const import PRIORITY_BACKGROUND, PRIORITY_USER
+from custom_components.jablotron_futura.scheduler import FuturaWriteScheduler
+
+
+class _Hass:
+    def async_create_background_task(self, coro, name):
+        return asyncio.get_running_loop().create_task(coro, name=name)
+
+
+class _Coordinator:
+    host = "test"
+
+    def __init__(self) -> None:
+        self.hass = _Hass()
+        self.written: list[int] = []
+        self.refreshes = 0
+        self.during_refresh = None
+
+    def holding_matches(self, address, values) -> bool:
+        return False
+
+    async def _write_block(self, address, values) -> None:
+        self.written.append(address)
+
+    async def async_request_refresh(self) -> None:
+        self.refreshes += 1
+        if self.during_refresh is not None:
+            hook, self.during_refresh = self.during_refresh, None
+            await hook()
+
+
+def test_write_submitted_during_final_refresh_is_written() -> None:
+    async def run() -> None:
+        coordinator = _Coordinator()
+        scheduler = FuturaWriteScheduler(coordinator)
+        second: list[asyncio.Task] = []
+
+        async def submit_second() -> None:
+            second.append(asyncio.create_task(scheduler.async_submit(11, [1], PRIORITY_USER)))
+            await asyncio.sleep(0)
+
+        coordinator.during_refresh = submit_second
+        await asyncio.wait_for(scheduler.async_submit(10, [1], PRIORITY_USER), 5)
+        await asyncio.wait_for(second[0], 5)
+
+        assert coordinator.written == [10, 11]
+        assert coordinator.refreshes == 2
+        await scheduler.async_stop()
+
+    asyncio.run(run())
+
+
+def test_lower_lane_does_not_replace_pending_user_write() -> None:
+    async def run() -> None:
+        coordinator = _Coordinator()
+        values: list[list[int]] = []
+
+        async def write_block(address, block) -> None:
+            values.append(block)
+
+        coordinator._write_block = write_block
+        scheduler = FuturaWriteScheduler(coordinator)
+
+        user = asyncio.create_task(scheduler.async_submit(0, [3], PRIORITY_USER))
+        await asyncio.sleep(0)
+        await scheduler.async_submit(0, [2], PRIORITY_BACKGROUND)
+        await asyncio.wait_for(user, 5)
+
+        assert values == [[3]]
+        await scheduler.async_stop()
+
+    asyncio.run(run())
+
+
+def test_superseded_user_write_is_not_reported_as_written() -> None:
+    async def run() -> None:
+        coordinator = _Coordinator()
+        scheduler = FuturaWriteScheduler(coordinator)
+
+        first = asyncio.create_task(scheduler.async_submit(0, [3], PRIORITY_USER))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(scheduler.async_submit(0, [4], PRIORITY_USER))
+        await asyncio.wait_for(second, 5)
+
+        with pytest.raises(HomeAssistantError):
+            await first
+        await scheduler.async_stop()
+
+    asyncio.run(run())
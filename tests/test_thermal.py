@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from custom_components.jablotron_futura.analytics import SampleBuffer
+from custom_components.jablotron_futura.thermal import (
+    HEATING,
+    OVERRIDE_HOLD,
+    PLAN_INTERVAL,
+    ThermalScheduler,
+)
+
+OPTIONS = {"thermal_enabled": True, "thermal_heating_below": 10.0, "thermal_dwell": 0}
+
+
+def _cold_buffer(until: float) -> SampleBuffer:
+    buffer = SampleBuffer()
+    for minute in range(int(until // 60) + 1):
+        buffer.append(minute * 60.0, {"temp_outdoor": 2.0, "temp_extract": 21.0})
+    return buffer
+
+
+def _data(heating: int) -> dict:
+    return {"heating_available": True, "heating_enable_raw": heating, "temp_set_raw": 22.0}
+
+
+def test_cold_outdoor_enables_heating() -> None:
+    plan = ThermalScheduler(OPTIONS)
+    assert plan.evaluate(_cold_buffer(3600), _data(0), 3600) == {HEATING: 1}
+
+
+def test_manual_change_holds_without_a_previous_plan_write() -> None:
+    plan = ThermalScheduler(OPTIONS)
+    buffer = _cold_buffer(7200)
+    assert plan.evaluate(buffer, _data(1), 3600) == {}
+    # Switched off by hand – the plan never wrote the register
+    now = 3600 + PLAN_INTERVAL
+    assert plan.evaluate(buffer, _data(0), now) == {}
+    assert plan.evaluate(buffer, _data(0), now + PLAN_INTERVAL) == {}
+    assert plan.evaluate(buffer, _data(0), now + OVERRIDE_HOLD) == {HEATING: 1}
+
+
+def test_own_write_read_back_is_not_a_manual_change() -> None:
+    plan = ThermalScheduler(OPTIONS)
+    buffer = _cold_buffer(7200)
+    assert plan.evaluate(buffer, _data(0), 3600) == {HEATING: 1}
+    # Our write shows up, then the user turns it off again
+    assert plan.evaluate(buffer, _data(1), 3600 + PLAN_INTERVAL) == {}
+    assert plan.evaluate(buffer, _data(0), 3600 + 2 * PLAN_INTERVAL) == {}
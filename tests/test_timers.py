@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import pytest
+
+from custom_components.jablotron_futura.timers import (
+    DRIFT_MIN_BASELINE,
+    MIN_BASELINE,
+    CountdownTracker,
+)
+
+
+def _data(boost_s: int = 0, night_s: int = 0) -> dict:
+    return {"boost_remaining_s": boost_s, "night_remaining_s": night_s}
+
+
+def test_interpolate_projects_and_rounds_up() -> None:
+    tracker = CountdownTracker()
+    tracker.observe(_data(boost_s=600), 0.0)
+    out = tracker.interpolate(61.0)
+    assert out["boost_remaining_s"] == 539
+    assert out["boost_remaining_min"] == 9
+    assert out["night_remaining_s"] == 0
+    assert out["night_remaining_h"] == 0
+
+
+def test_next_tick_is_the_next_minute_boundary() -> None:
+    tracker = CountdownTracker()
+    tracker.observe(_data(boost_s=150), 0.0)
+    # 150 s shows 3 min, 120 s shows 2 min
+    assert tracker.next_tick(0.0) == pytest.approx(30.0)
+    assert tracker.next_tick(30.0) == pytest.approx(60.0)
+    assert CountdownTracker().next_tick(0.0) is None
+
+
+def test_expired_only_for_a_running_timer() -> None:
+    tracker = CountdownTracker()
+    tracker.observe(_data(boost_s=30), 0.0)
+    assert not tracker.expired(29.0)
+    assert tracker.expired(30.0)
+    tracker.observe(_data(), 31.0)
+    assert not tracker.expired(100.0)
+
+
+def test_drift_needs_an_hour_of_baseline() -> None:
+    tracker = CountdownTracker()
+    tracker.observe(_data(night_s=36000), 0.0)
+    # One extra device second per baseline, the counter resolution
+    tracker.observe(_data(night_s=36000 - int(MIN_BASELINE) - 1), MIN_BASELINE)
+    assert tracker.rate > 1.0
+    assert tracker.drift_ppm is None
+    tracker.observe(_data(night_s=36000 - int(DRIFT_MIN_BASELINE) - 1), DRIFT_MIN_BASELINE)
+    assert tracker.baseline == DRIFT_MIN_BASELINE
+    assert tracker.drift_ppm == 278
+
+
+def test_user_change_reanchors_instead_of_skewing_the_rate() -> None:
+    tracker = CountdownTracker()
+    tracker.observe(_data(boost_s=900), 0.0)
+    # Extended to 60 min after 5 min – not a clock rate of -8.8
+    tracker.observe(_data(boost_s=3600), 300.0)
+    assert tracker.rate == 1.0
+    tracker.observe(_data(boost_s=3600 - 900), 1200.0)
+    assert tracker.rate == pytest.approx(1.0)
+    assert tracker.baseline == 900.0